@@ -4,7 +4,7 @@ VERSI 4.1 - PERBAIKAN LOGIKA & UI
 
 INSTALASI:
 1. Install dependencies:
-   pip install flask flask-cors pymysql pandas werkzeug pillow
+   pip install flask flask-cors pymysql werkzeug pillow
 
 2. Aktifkan XAMPP (Apache + MySQL)
 
@@ -15,12 +15,12 @@ INSTALASI:
    http://localhost:5000
 """
 
-from flask import Flask, render_template_string, request, jsonify, session, redirect, url_for
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for
 from flask_cors import CORS
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
+from jinja2 import ChoiceLoader, DictLoader, FileSystemBytecodeCache
 import pymysql
-import pandas as pd
 from datetime import datetime, timedelta
 import os
 from functools import wraps
@@ -1457,9 +1457,16 @@ MAIN_TEMPLATE = """
                     const tbody = document.getElementById('bukuBesarBody');
                     tbody.innerHTML = '';
                     
-                    let saldo = 0;
+                    if (data.entries.length > 0) {
+                        const awal = document.createElement('tr');
+                        awal.innerHTML = `
+                            <td colspan="5" class="text-end"><em>Saldo Awal</em></td>
+                            <td class="text-end"><strong>Rp ${data.saldo_awal.toLocaleString('id-ID')}</strong></td>
+                        `;
+                        tbody.appendChild(awal);
+                    }
+                    
                     data.entries.forEach(entry => {
-                        saldo += parseFloat(entry.debit) - parseFloat(entry.kredit);
                         const row = document.createElement('tr');
                         row.innerHTML = `
                             <td>${new Date(entry.tanggal).toLocaleDateString('id-ID')}</td>
@@ -1467,7 +1474,7 @@ MAIN_TEMPLATE = """
                             <td>${entry.kategori}</td>
                             <td class="text-end debit">${entry.debit > 0 ? 'Rp ' + parseFloat(entry.debit).toLocaleString('id-ID') : '-'}</td>
                             <td class="text-end kredit">${entry.kredit > 0 ? 'Rp ' + parseFloat(entry.kredit).toLocaleString('id-ID') : '-'}</td>
-                            <td class="text-end"><strong>Rp ${saldo.toLocaleString('id-ID')}</strong></td>
+                            <td class="text-end"><strong>Rp ${entry.saldo.toLocaleString('id-ID')}</strong></td>
                         `;
                         tbody.appendChild(row);
                     });
@@ -1667,6 +1674,26 @@ MAIN_TEMPLATE = """
 </html>
 """
 
+# Template inline dikompilasi sekali saat startup lewat loader Jinja milik app
+# (render_template_string mem-parse ulang seluruh template di setiap request).
+# Set TEMPLATE_CACHE_DIR agar hasil kompilasi juga disimpan di disk dan
+# dipakai ulang saat proses/worker berikutnya start.
+TEMPLATE_CACHE_DIR = os.environ.get('TEMPLATE_CACHE_DIR')
+
+app.jinja_env.loader = ChoiceLoader([
+    DictLoader({
+        'app/login.html': LOGIN_TEMPLATE,
+        'app/main.html': MAIN_TEMPLATE
+    }),
+    app.jinja_env.loader
+])
+if TEMPLATE_CACHE_DIR:
+    os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+for template_name in ('app/login.html', 'app/main.html'):
+    app.jinja_env.get_template(template_name)
+
 # Routes untuk Authentication
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -1689,17 +1716,17 @@ def login():
                 session['username'] = user['username']
                 return redirect(url_for('index'))
             else:
-                return render_template_string(LOGIN_TEMPLATE, 
+                return render_template('app/login.html', 
                     title='Login', 
                     is_register=False, 
                     error='Username/Email atau password salah!')
         except Exception as e:
-            return render_template_string(LOGIN_TEMPLATE, 
+            return render_template('app/login.html', 
                 title='Login', 
                 is_register=False, 
                 error=f'Error: {str(e)}')
     
-    return render_template_string(LOGIN_TEMPLATE, title='Login', is_register=False)
+    return render_template('app/login.html', title='Login', is_register=False)
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
@@ -1710,7 +1737,7 @@ def register():
         confirm_password = request.form.get('confirm_password')
         
         if password != confirm_password:
-            return render_template_string(LOGIN_TEMPLATE, 
+            return render_template('app/login.html', 
                 title='Register', 
                 is_register=True, 
                 error='Password tidak cocok!')
@@ -1723,7 +1750,7 @@ def register():
             if cursor.fetchone():
                 cursor.close()
                 conn.close()
-                return render_template_string(LOGIN_TEMPLATE, 
+                return render_template('app/login.html', 
                     title='Register', 
                     is_register=True, 
                     error='Username sudah digunakan!')
@@ -1732,7 +1759,7 @@ def register():
             if cursor.fetchone():
                 cursor.close()
                 conn.close()
-                return render_template_string(LOGIN_TEMPLATE, 
+                return render_template('app/login.html', 
                     title='Register', 
                     is_register=True, 
                     error='Email sudah digunakan!')
@@ -1750,17 +1777,17 @@ def register():
             cursor.close()
             conn.close()
             
-            return render_template_string(LOGIN_TEMPLATE, 
+            return render_template('app/login.html', 
                 title='Register', 
                 is_register=True, 
                 success='Registrasi berhasil! Silakan login.')
         except Exception as e:
-            return render_template_string(LOGIN_TEMPLATE, 
+            return render_template('app/login.html', 
                 title='Register', 
                 is_register=True, 
                 error=f'Error: {str(e)}')
     
-    return render_template_string(LOGIN_TEMPLATE, title='Register', is_register=True)
+    return render_template('app/login.html', title='Register', is_register=True)
 
 @app.route('/logout')
 def logout():
@@ -1777,7 +1804,7 @@ def index():
     cursor.close()
     conn.close()
     
-    return render_template_string(MAIN_TEMPLATE, user=user)
+    return render_template('app/main.html', user=user)
 
 # API Routes
 @app.route('/api/transaksi', methods=['POST'])
@@ -1914,14 +1941,14 @@ def get_buku_besar():
             params.append(kategori)
         
         if tanggal_mulai:
-            query += " AND DATE(tanggal) >= %s"
+            query += " AND tanggal >= %s"
             params.append(tanggal_mulai)
         
         if tanggal_akhir:
-            query += " AND DATE(tanggal) <= %s"
+            query += " AND tanggal <= %s"
             params.append(tanggal_akhir)
         
-        query += " ORDER BY tanggal DESC, created_at DESC"
+        query += " ORDER BY tanggal DESC, created_at DESC, id DESC"
         
         # Tambahkan LIMIT jika ada
         if limit:
@@ -1933,9 +1960,35 @@ def get_buku_besar():
         # Reverse untuk menampilkan yang terlama dulu, tapi tetap ambil 10 terakhir
         transaksi.reverse()
         
+        # Saldo awal = saldo semua transaksi sebelum baris pertama yang tampil
+        saldo_awal = 0
+        if transaksi:
+            pertama = transaksi[0]
+            saldo_query = """
+                SELECT COALESCE(SUM(CASE WHEN tipe = 'Pemasukan' THEN jumlah ELSE -jumlah END), 0) AS saldo
+                FROM transaksi
+                WHERE user_id = %s
+            """
+            saldo_params = [session['user_id']]
+            
+            if kategori:
+                saldo_query += " AND kategori = %s"
+                saldo_params.append(kategori)
+            
+            saldo_query += """
+                AND (tanggal < %s OR (tanggal = %s AND (created_at < %s
+                                                        OR (created_at = %s AND id < %s))))
+            """
+            saldo_params += [pertama['tanggal'], pertama['tanggal'],
+                             pertama['created_at'], pertama['created_at'], pertama['id']]
+            
+            cursor.execute(saldo_query, saldo_params)
+            saldo_awal = float(cursor.fetchone()['saldo'])
+        
         entries = []
         total_debit = 0
         total_kredit = 0
+        saldo = saldo_awal
         
         for t in transaksi:
             if t['tipe'] == 'Pemasukan':
@@ -1946,13 +1999,15 @@ def get_buku_besar():
                 debit = 0
                 kredit = float(t['jumlah'])
                 total_kredit += kredit
+            saldo += debit - kredit
             
             entries.append({
                 'tanggal': t['tanggal'],
                 'keterangan': t['keterangan'] or '-',
                 'kategori': t['kategori'],
                 'debit': debit,
-                'kredit': kredit
+                'kredit': kredit,
+                'saldo': saldo
             })
         
         cursor.close()
@@ -1960,9 +2015,10 @@ def get_buku_besar():
         
         return jsonify({
             'entries': entries,
+            'saldo_awal': saldo_awal,
             'total_debit': total_debit,
             'total_kredit': total_kredit,
-            'saldo_akhir': total_debit - total_kredit
+            'saldo_akhir': saldo
         })
     except Exception as e:
         return jsonify({'error': str(e)})
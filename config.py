@@ -12,12 +12,21 @@ class Config:
     # Database Configuration
     DB_CONFIG = {
         'host': os.environ.get('DB_HOST') or 'localhost',
+        'port': int(os.environ.get('DB_PORT') or 3306),
         'user': os.environ.get('DB_USER') or 'root',
         'password': os.environ.get('DB_PASSWORD') or '',
         'database': os.environ.get('DB_NAME') or 'keuangan_db',
         'charset': 'utf8mb4',
     }
     
+    # Connection Pool Configuration
+    DB_POOL = {
+        'min_size': int(os.environ.get('DB_POOL_MIN') or 1),
+        'max_size': int(os.environ.get('DB_POOL_MAX') or 10),
+        'idle_timeout': int(os.environ.get('DB_POOL_IDLE_TIMEOUT') or 300),  # detik
+        'wait_timeout': int(os.environ.get('DB_POOL_WAIT_TIMEOUT') or 10),  # detik
+    }
+    
     # Upload Configuration
     UPLOAD_FOLDER = 'static/uploads'
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
@@ -32,5 +41,56 @@ class Config:
     KATEGORI_PEMASUKAN = ['Gaji', 'Hibah', 'Lainnya']
     KATEGORI_PENGELUARAN = ['Jajan', 'Transportasi', 'Makan', 'Kebutuhan', 'Keinginan', 'Lainnya']
     
+    # Batch transaksi (POST /api/transaksi/batch)
+    # Batas ini menjaga satu batch tetap satu statement INSERT multi-baris
+    TRANSAKSI_BATCH_MAX = 200
+    KETERANGAN_MAX_LENGTH = 255
+    
+    # Import CSV: baris per chunk executemany (satu commit per chunk)
+    # dan jumlah error per baris yang dilaporkan
+    IMPORT_CHUNK_SIZE = 400
+    IMPORT_MAX_ERRORS = 100
+    
+    # Export streaming: baris per fetchmany dari server-side cursor
+    EXPORT_FETCH_SIZE = 1000
+    
+    # Pagination riwayat transaksi
+    RIWAYAT_PAGE_SIZE = 50
+    RIWAYAT_PAGE_SIZE_MAX = 200
+    
+    # Rentang maksimal endpoint /api/trend
+    TREND_MAX_BULAN = 120
+    
+    # Cache per user (ringkasan dashboard, profil user)
+    # 'memory' = per proses, 'redis' = dipakai bersama semua worker
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND') or 'memory'
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL') or 'redis://localhost:6379/0'
+    CACHE_KEY_PREFIX = 'keuangan:'
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES') or 5000)  # hanya backend memory
+    CACHE_TTL = int(os.environ.get('CACHE_TTL') or 60)  # detik
+    
+    # Hash password (format method werkzeug, mis. 'scrypt:32768:8:1' atau
+    # 'pbkdf2:sha256:600000'). Hash lama di-hash ulang otomatis saat login.
+    # Hashing berjalan di pool thread terbatas agar lonjakan login tidak
+    # menghabiskan CPU (dan memori scrypt) untuk endpoint lain.
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD') or 'scrypt:32768:8:1'
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS') or 2)
+    
+    # Analitik (/api/analytics): jendela rata-rata bergulir (hari)
+    # dan panjang seri harian yang dikirim
+    ANALYTICS_ROLLING_WINDOWS = (30, 90)
+    ANALYTICS_SERIES_HARI = 90
+    
+    # Server-Sent Events (/api/events): batas koneksi & interval heartbeat
+    SSE_MAX_PER_USER = 5
+    SSE_MAX_TOTAL = int(os.environ.get('SSE_MAX_TOTAL') or 200)
+    SSE_HEARTBEAT = 15  # detik
+    SSE_RETRY_MS = 5000
+    
+    # Asset CSS/JS hasil build (python -m scripts.build_assets)
+    ASSET_SOURCE_DIR = 'static'
+    ASSET_DIST_DIR = 'static/dist'
+    ASSET_MAX_AGE = 365 * 24 * 3600  # detik, nama file ber-hash
+    
     # Date Limits (untuk input transaksi)
     TRANSAKSI_DATE_RANGE_DAYS = 7  # ±7 hari dari hari ini
@@ -0,0 +1,191 @@
+"""
+ANALYTICS CONTROLLER
+Analitik ledger user secara vektor: seluruh transaksi dimuat sekali sebagai
+array NumPy per kolom (hari, tipe, kategori, sen), lalu arus kas bulanan,
+rata-rata bergulir harian, porsi kategori dan rasio tabungan dihitung dengan
+operasi array (bincount/cumsum), tanpa loop Python per baris.
+Jumlah tetap dalam integer sen; bincount menjumlah bilangan bulat secara
+eksak selama total di bawah 2^53 sen.
+"""
+from datetime import date
+import numpy as np
+from config import Config
+from models.transaksi import Transaksi
+from utils.cache import cache
+
+# Kode tipe dari Transaksi.get_ledger_columns (FIELD di SQL)
+TIPE_PEMASUKAN = 1
+TIPE_PENGELUARAN = 2
+TIPE_TABUNGAN = 3
+
+EPOCH = date(1970, 1, 1)
+
+class AnalyticsController:
+    """Controller untuk analitik keuangan"""
+    
+    @staticmethod
+    def get_analytics(user_id):
+        """
+        Dapatkan analitik ledger user (lewat cache per user)
+        Args:
+            user_id: ID user
+        Returns: dict bulanan, rolling, kategori, rasio_tabungan, jumlah_transaksi
+        """
+        return cache.get(user_id, 'analytics', lambda: AnalyticsController._load_analytics(user_id))
+    
+    @staticmethod
+    def _load_analytics(user_id):
+        """Muat ledger sekali dari database lalu hitung semua metrik"""
+        ledger = AnalyticsController.to_arrays(*Transaksi.get_ledger_columns(user_id))
+        return AnalyticsController.compute(ledger, date.today())
+    
+    @staticmethod
+    def to_arrays(hari, tipe, kategori, sen):
+        """
+        Ubah kolom ledger menjadi array NumPy
+        Args:
+            hari: hari sejak 1970-01-01 per transaksi
+            tipe: kode tipe (TIPE_*)
+            kategori: nama kategori
+            sen: jumlah dalam sen
+        Returns: dict array hari, tipe, kategori (indeks), sen dan list kategori_labels
+        """
+        # Dictionary encoding lewat dict, jauh lebih cepat dari np.unique
+        # pada array object berisi string
+        labels = sorted(dict.fromkeys(kategori))
+        index = {label: i for i, label in enumerate(labels)}
+        
+        return {
+            'hari': np.fromiter(hari, dtype=np.int64, count=len(hari)),
+            'tipe': np.fromiter(tipe, dtype=np.int8, count=len(tipe)),
+            'kategori': np.fromiter(map(index.__getitem__, kategori), dtype=np.int64, count=len(kategori)),
+            'kategori_labels': labels,
+            'sen': np.fromiter(sen, dtype=np.int64, count=len(sen))
+        }
+    
+    @staticmethod
+    def compute(ledger, today):
+        """
+        Hitung semua metrik dari array ledger
+        Args:
+            ledger: dict hasil to_arrays
+            today: tanggal acuan (akhir seri bulanan dan rolling)
+        Returns: dict siap JSON (nilai uang dalam rupiah)
+        """
+        today_hari = (today - EPOCH).days
+        pemasukan = np.where(ledger['tipe'] == TIPE_PEMASUKAN, ledger['sen'], 0)
+        pengeluaran = np.where(ledger['tipe'] == TIPE_PENGELUARAN, ledger['sen'], 0)
+        tabungan = np.where(ledger['tipe'] == TIPE_TABUNGAN, ledger['sen'], 0)
+        arus_kas = pemasukan - pengeluaran - tabungan
+        
+        # Ambil dari tabungan tercatat sebagai Pemasukan kategori Tabungan;
+        # itu perpindahan dana, bukan pendapatan, jadi tidak ikut rasio tabungan
+        pendapatan = pemasukan
+        if 'Tabungan' in ledger['kategori_labels']:
+            transfer = ledger['kategori'] == ledger['kategori_labels'].index('Tabungan')
+            pendapatan = np.where(transfer, 0, pemasukan)
+        
+        return {
+            'bulanan': AnalyticsController._monthly(
+                ledger['hari'], today_hari, pemasukan, pengeluaran, tabungan, arus_kas, pendapatan
+            ),
+            'rolling': AnalyticsController._rolling(ledger['hari'], today_hari, pengeluaran, arus_kas),
+            'kategori': AnalyticsController._category_shares(
+                ledger['kategori'], ledger['kategori_labels'], pengeluaran
+            ),
+            'rasio_tabungan': AnalyticsController._savings_rate(pendapatan.sum(), pengeluaran.sum()),
+            'jumlah_transaksi': int(ledger['sen'].size)
+        }
+    
+    @staticmethod
+    def _monthly(hari, today_hari, pemasukan, pengeluaran, tabungan, arus_kas, pendapatan):
+        """Arus kas per bulan dari bulan transaksi pertama sampai bulan ini"""
+        bulan_ini = np.datetime64(today_hari, 'D').astype('datetime64[M]').astype(np.int64)
+        if hari.size == 0:
+            return AnalyticsController._monthly_result(np.arange(bulan_ini, bulan_ini + 1), {}, [None])
+        
+        # Tabel hari -> bulan untuk rentang ledger saja, lalu gather per baris
+        # (lebih murah daripada konversi datetime64 untuk setiap baris)
+        hari_min = int(hari.min())
+        tabel = np.arange(hari_min, int(hari.max()) + 1).astype('datetime64[D]').astype('datetime64[M]')
+        bulan = tabel.astype(np.int64)[hari - hari_min]
+        mulai = min(int(bulan.min()), int(bulan_ini))
+        akhir = max(int(bulan.max()), int(bulan_ini))
+        index = bulan - mulai
+        
+        def per_bulan(values):
+            return np.bincount(index, weights=values, minlength=akhir - mulai + 1).astype(np.int64)
+        
+        series = {
+            'pemasukan': per_bulan(pemasukan),
+            'pengeluaran': per_bulan(pengeluaran),
+            'tabungan': per_bulan(tabungan),
+            'arus_kas': per_bulan(arus_kas)
+        }
+        
+        pendapatan_bulanan = per_bulan(pendapatan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rasio = (pendapatan_bulanan - series['pengeluaran']) / pendapatan_bulanan
+        rasio = [round(float(r), 4) if p > 0 else None for r, p in zip(rasio, pendapatan_bulanan)]
+        
+        return AnalyticsController._monthly_result(np.arange(mulai, akhir + 1), series, rasio)
+    
+    @staticmethod
+    def _monthly_result(bulan, series, rasio):
+        """Susun hasil bulanan (sen -> rupiah) dengan label 'YYYY-MM'"""
+        result = {'labels': bulan.astype('datetime64[M]').astype(str).tolist()}
+        for key in ('pemasukan', 'pengeluaran', 'tabungan', 'arus_kas'):
+            values = series.get(key, np.zeros(bulan.size, dtype=np.int64))
+            result[key] = (values / 100).tolist()
+        result['rasio_tabungan'] = rasio
+        return result
+    
+    @staticmethod
+    def _rolling(hari, today_hari, pengeluaran, arus_kas):
+        """
+        Rata-rata harian bergulir (jendela Config.ANALYTICS_ROLLING_WINDOWS hari)
+        untuk ANALYTICS_SERIES_HARI hari terakhir, dari prefix sum harian
+        """
+        windows = Config.ANALYTICS_ROLLING_WINDOWS
+        jumlah_hari = Config.ANALYTICS_SERIES_HARI
+        span = jumlah_hari + max(windows) - 1
+        first = today_hari - span + 1
+        
+        mask = (hari >= first) & (hari <= today_hari)
+        index = hari[mask] - first
+        
+        hari_seri = np.arange(today_hari - jumlah_hari + 1, today_hari + 1)
+        result = {'labels': hari_seri.astype('datetime64[D]').astype(str).tolist()}
+        
+        for key, values in (('pengeluaran', pengeluaran), ('arus_kas', arus_kas)):
+            harian = np.bincount(index, weights=values[mask], minlength=span)
+            prefix = np.concatenate(([0.0], np.cumsum(harian)))
+            for window in windows:
+                rata = (prefix[window:] - prefix[:-window]) / window
+                result[f"{key}_{window}"] = np.round(rata[-jumlah_hari:] / 100, 2).tolist()
+        
+        return result
+    
+    @staticmethod
+    def _category_shares(kategori, labels, pengeluaran):
+        """Total dan porsi pengeluaran per kategori, terbesar lebih dulu"""
+        totals = np.bincount(kategori, weights=pengeluaran, minlength=len(labels)).astype(np.int64)
+        keseluruhan = int(totals.sum())
+        
+        order = np.argsort(-totals, kind='stable')
+        return [
+            {
+                'kategori': labels[i],
+                'total': int(totals[i]) / 100,
+                'porsi': round(int(totals[i]) / keseluruhan, 4)
+            }
+            for i in order if totals[i] > 0
+        ]
+    
+    @staticmethod
+    def _savings_rate(pendapatan, pengeluaran):
+        """Rasio tabungan keseluruhan: (pendapatan - pengeluaran) / pendapatan"""
+        pendapatan = int(pendapatan)
+        if pendapatan <= 0:
+            return None
+        return round((pendapatan - int(pengeluaran)) / pendapatan, 4)
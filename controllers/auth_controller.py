@@ -2,7 +2,7 @@
 AUTHENTICATION CONTROLLER
 """
 from flask import session
-from models.user import User
+from models.user import User, DuplicateUserError
 
 class AuthController:
     """Controller untuk authentication"""
@@ -50,17 +50,14 @@ class AuthController:
         if len(password) < 6:
             return False, "Password minimal 6 karakter!"
         
-        # Cek username sudah ada
-        if User.check_username_exists(username):
+        # Buat user; duplikat username/email ditolak constraint UNIQUE
+        try:
+            user_id = User.create(username, email, password)
+        except DuplicateUserError as e:
+            if e.field == 'email':
+                return False, "Email sudah digunakan!"
             return False, "Username sudah digunakan!"
         
-        # Cek email sudah ada
-        if User.check_email_exists(email):
-            return False, "Email sudah digunakan!"
-        
-        # Buat user
-        user_id = User.create(username, email, password)
-        
         if user_id:
             return True, "Registrasi berhasil! Silakan login."
         else:
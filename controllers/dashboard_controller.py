@@ -1,38 +1,66 @@
 """
 DASHBOARD CONTROLLER
 """
+import json
+from datetime import date, datetime
+from config import Config
 from models.transaksi import Transaksi
 from models.tabungan import Tabungan
+from models.rekap_bulanan import RekapBulanan
+from models.user import User
+from utils.cache import cache
+from utils.events import hub
+from utils.money import Money
 
 class DashboardController:
     """Controller untuk dashboard"""
     
     @staticmethod
-    def get_summary_data(user_id):
+    def get_dashboard_data(user_id):
         """
-        Dapatkan data summary untuk dashboard
+        Dapatkan semua data dashboard (summary, kategori, tabungan, health score)
+        dari satu query, lewat cache per user
         Args:
             user_id: ID user
-        Returns: dict summary data
+        Returns: dict dashboard data
         """
-        # Ambil summary transaksi
-        summary = Transaksi.get_summary(user_id)
-        
-        # Ambil saldo tabungan
-        tabungan = Tabungan.get_by_user(user_id)
+        return cache.get(
+            user_id, 'dashboard', lambda: DashboardController._load_dashboard_data(user_id)
+        )
+    
+    @staticmethod
+    def _load_dashboard_data(user_id):
+        """Hitung data dashboard dari database (satu round trip)"""
+        data = Transaksi.get_dashboard(user_id)
         
         # Hitung health score
-        health_score = DashboardController.calculate_health_score(summary, tabungan)
+        health_score = DashboardController.calculate_health_score(data, data['tabungan'])
         
+        # Money -> angka JSON hanya di sini (nilai cache siap di-serialize)
         return {
-            'pemasukan': summary['pemasukan'],
-            'pengeluaran': summary['pengeluaran'],
-            'saldo': summary['saldo'],
-            'arus_kas': summary['arus_kas'],
-            'tabungan': tabungan,
-            'health_score': health_score
+            'pemasukan': float(data['pemasukan']),
+            'pengeluaran': float(data['pengeluaran']),
+            'saldo': float(data['saldo']),
+            'arus_kas': float(data['arus_kas']),
+            'tabungan': float(data['tabungan']),
+            'health_score': health_score,
+            'kategori_labels': [item['kategori'] for item in data['kategori']],
+            'kategori_values': [float(item['total']) for item in data['kategori']]
         }
     
+    @staticmethod
+    def get_summary_data(user_id):
+        """
+        Dapatkan data summary untuk dashboard
+        Args:
+            user_id: ID user
+        Returns: dict summary data
+        """
+        data = DashboardController.get_dashboard_data(user_id)
+        return {key: data[key] for key in (
+            'pemasukan', 'pengeluaran', 'saldo', 'arus_kas', 'tabungan', 'health_score'
+        )}
+    
     @staticmethod
     def get_chart_data(user_id):
         """
@@ -41,23 +69,129 @@ class DashboardController:
             user_id: ID user
         Returns: dict chart data
         """
-        # Data untuk pie chart (pengeluaran per kategori)
-        kategori_data = Transaksi.get_by_kategori(user_id, 'Pengeluaran')
+        data = DashboardController.get_dashboard_data(user_id)
+        return {key: data[key] for key in (
+            'kategori_labels', 'kategori_values', 'pemasukan', 'pengeluaran', 'saldo', 'tabungan'
+        )}
+    
+    @staticmethod
+    def get_tabungan(user_id):
+        """
+        Dapatkan saldo tabungan (lewat cache per user)
+        Args:
+            user_id: ID user
+        Returns: float jumlah tabungan
+        """
+        return cache.get(user_id, 'tabungan', lambda: float(Tabungan.get_by_user(user_id)))
+    
+    @staticmethod
+    def stream_summary(user_id):
+        """
+        Stream SSE data dashboard untuk satu tab browser.
+        Event 'summary' berisi field yang berubah saja (event pertama lengkap);
+        setiap SSE_HEARTBEAT detik dikirim heartbeat sekaligus dicek versi data
+        user, agar perubahan yang ditulis worker lain tetap terkirim.
+        Args:
+            user_id: ID user
+        Returns: tuple (generator string event SSE, fungsi pelepas slot koneksi),
+            atau None jika batas koneksi tercapai. Fungsi pelepas harus
+            dipanggil saat response ditutup (Response.call_on_close): finally
+            di generator tidak pernah jalan jika body tidak pernah dibaca.
+        """
+        subscriber = hub.subscribe(user_id)
+        if subscriber is None:
+            return None
+        
+        def release():
+            hub.unsubscribe(user_id, subscriber)
+        
+        def generate():
+            last = {}
+            version = None
+            changed = True
+            
+            try:
+                yield f"retry: {Config.SSE_RETRY_MS}\n\n"
+                
+                while True:
+                    current = User.get_data_version(user_id)
+                    if version is not None and current != version and not changed:
+                        # Ditulis worker lain: cache lokal mungkin masih versi lama
+                        cache.invalidate(user_id)
+                        changed = True
+                    version = current
+                    
+                    if changed:
+                        summary = DashboardController.get_dashboard_data(user_id)
+                        delta = {key: value for key, value in summary.items() if last.get(key) != value}
+                        last = summary
+                        if delta:
+                            yield f"event: summary\ndata: {json.dumps(delta)}\n\n"
+                    else:
+                        yield ": ping\n\n"
+                    
+                    changed = subscriber.wait(Config.SSE_HEARTBEAT)
+                    if changed is None:
+                        # Diganti koneksi yang lebih baru: minta browser berhenti reconnect
+                        yield "event: close\ndata: {}\n\n"
+                        return
+            finally:
+                release()
+        
+        return generate(), release
+    
+    @staticmethod
+    def get_trend_data(user_id, bulan_mulai='', bulan_akhir='', kategori=''):
+        """
+        Dapatkan seri bulanan pemasukan/pengeluaran/tabungan dari rekap bulanan
+        Args:
+            user_id: ID user
+            bulan_mulai: bulan awal 'YYYY-MM' (default 11 bulan sebelum bulan_akhir)
+            bulan_akhir: bulan akhir 'YYYY-MM' (default bulan ini)
+            kategori: filter kategori (opsional)
+        Returns: dict labels dan seri per tipe
+        Raises: ValueError jika format bulan atau rentang tidak valid
+        """
+        akhir = datetime.strptime(bulan_akhir, '%Y-%m').date() if bulan_akhir else date.today().replace(day=1)
+        if bulan_mulai:
+            mulai = datetime.strptime(bulan_mulai, '%Y-%m').date()
+        else:
+            total_bulan = akhir.year * 12 + akhir.month - 1 - 11
+            mulai = date(total_bulan // 12, total_bulan % 12 + 1, 1)
+        
+        jumlah_bulan = (akhir.year - mulai.year) * 12 + akhir.month - mulai.month + 1
+        if jumlah_bulan < 1:
+            raise ValueError("bulan_mulai tidak boleh setelah bulan_akhir")
+        if jumlah_bulan > Config.TREND_MAX_BULAN:
+            raise ValueError(f"Rentang maksimal {Config.TREND_MAX_BULAN} bulan")
+        
+        # Label bulan berurutan, termasuk bulan tanpa transaksi
+        labels = []
+        for i in range(jumlah_bulan):
+            total_bulan = mulai.year * 12 + mulai.month - 1 + i
+            labels.append(f"{total_bulan // 12:04d}-{total_bulan % 12 + 1:02d}")
+        
+        index = {bulan: i for i, bulan in enumerate(labels)}
+        series = {
+            'Pemasukan': [Money()] * jumlah_bulan,
+            'Pengeluaran': [Money()] * jumlah_bulan,
+            'Tabungan': [Money()] * jumlah_bulan,
+        }
         
-        kategori_labels = [item['kategori'] for item in kategori_data]
-        kategori_values = [float(item['total']) for item in kategori_data]
+        for row in RekapBulanan.get_trend(user_id, labels[0], labels[-1], kategori):
+            if row['tipe'] in series:
+                series[row['tipe']][index[row['bulan']]] = Money.of(row['total'])
         
-        # Data untuk bar chart
-        summary = Transaksi.get_summary(user_id)
-        tabungan = Tabungan.get_by_user(user_id)
+        arus_kas = [
+            p - k - t for p, k, t in zip(series['Pemasukan'], series['Pengeluaran'], series['Tabungan'])
+        ]
         
         return {
-            'kategori_labels': kategori_labels,
-            'kategori_values': kategori_values,
-            'pemasukan': summary['pemasukan'],
-            'pengeluaran': summary['pengeluaran'],
-            'saldo': summary['saldo'],
-            'tabungan': tabungan
+            'labels': labels,
+            'pemasukan': [float(m) for m in series['Pemasukan']],
+            'pengeluaran': [float(m) for m in series['Pengeluaran']],
+            'tabungan': [float(m) for m in series['Tabungan']],
+            'arus_kas': [float(m) for m in arus_kas]
         }
     
     @staticmethod
@@ -65,15 +199,17 @@ class DashboardController:
         """
         Hitung health score keuangan
         Args:
-            summary: dict summary transaksi
-            tabungan: float saldo tabungan
+            summary: dict summary transaksi (Money)
+            tabungan: Money saldo tabungan
         Returns: int (0-100)
         """
         score = 50  # Base score
         
-        pemasukan = summary['pemasukan']
-        pengeluaran = summary['pengeluaran']
-        saldo = summary['saldo']
+        # Rasio dihitung dari integer sen
+        pemasukan = summary['pemasukan'].sen
+        pengeluaran = summary['pengeluaran'].sen
+        saldo = summary['saldo'].sen
+        tabungan = tabungan.sen
         
         # Tabungan factor (max +20)
         if tabungan > 0 and pemasukan > 0:
@@ -0,0 +1,230 @@
+"""
+IMPORT CONTROLLER
+Import CSV / mutasi rekening secara streaming: file dibaca baris per baris
+dan disimpan per chunk, sehingga memori tetap kecil berapa pun ukuran file.
+"""
+import codecs
+import csv
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from config import Config
+from models.database import unit_of_work
+from models.transaksi import Transaksi
+from controllers.transaksi_controller import TransaksiController
+
+class ImportController:
+    """Controller untuk import transaksi dari CSV"""
+    
+    FIELDS = ('tanggal', 'tipe', 'kategori', 'jumlah', 'keterangan')
+    REQUIRED_FIELDS = ('tanggal', 'jumlah')
+    
+    @staticmethod
+    def import_csv(user_id, stream, mapping=None, format_tanggal='%Y-%m-%d',
+                   pemisah=',', desimal_koma=False, encoding='utf-8-sig', progress=None):
+        """
+        Import transaksi dari file CSV
+        Args:
+            user_id: ID user
+            stream: file biner (upload atau open(..., 'rb'))
+            mapping: dict field -> nama kolom CSV (default: nama field)
+            format_tanggal: format strptime kolom tanggal
+            pemisah: delimiter CSV
+            desimal_koma: True untuk angka format 1.234,56
+            encoding: encoding file berbasis ASCII (utf-8-sig, cp1252, latin-1, ...)
+            progress: callback(dict statistik) setiap chunk disimpan
+        Returns: dict statistik import (diproses, diimpor, gagal, errors)
+        """
+        stats = {
+            'success': True,
+            'message': '',
+            'diproses': 0,
+            'diimpor': 0,
+            'gagal': 0,
+            'errors': [],
+            'errors_terpotong': False
+        }
+        
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            stats.update(success=False, message=f"❌ Encoding tidak dikenal: {encoding}")
+            return stats
+        
+        # Baris biner di-decode satu per satu (bukan lewat TextIOWrapper yang
+        # butuh readable() dari stream upload), sehingga byte yang tidak valid
+        # terdeteksi tepat di baris tempatnya berada
+        reader = csv.reader(codecs.iterdecode(stream, encoding), delimiter=pemisah)
+        
+        try:
+            header = next(reader, None)
+        except (UnicodeDecodeError, csv.Error) as e:
+            return ImportController._abort(stats, 1, e)
+        if header is None:
+            stats.update(success=False, message="❌ File CSV kosong")
+            return stats
+        
+        columns, missing = ImportController._resolve_columns(header, mapping or {})
+        if missing:
+            stats.update(success=False, message=f"❌ Kolom tidak ditemukan: {', '.join(missing)}")
+            return stats
+        
+        chunk = []
+        chunk_lines = []
+        
+        try:
+            for record in reader:
+                line_no = reader.line_num
+                if not any(cell.strip() for cell in record):
+                    continue
+                
+                stats['diproses'] += 1
+                data = ImportController._map_record(record, columns, format_tanggal, desimal_koma)
+                row, errors = TransaksiController.validasi(data)
+                
+                if errors:
+                    ImportController._add_error(stats, line_no, errors)
+                    continue
+                
+                chunk.append(row)
+                chunk_lines.append(line_no)
+                
+                if len(chunk) >= Config.IMPORT_CHUNK_SIZE:
+                    ImportController._flush(user_id, chunk, chunk_lines, stats, progress)
+                    chunk = []
+                    chunk_lines = []
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Chunk sebelumnya sudah di-commit; simpan juga baris valid yang
+            # sudah terbaca agar import berhenti tepat di baris yang rusak
+            if chunk:
+                ImportController._flush(user_id, chunk, chunk_lines, stats, progress)
+            # UnicodeDecodeError muncul sebelum baris terhitung di line_num
+            line_no = reader.line_num + 1 if isinstance(e, UnicodeDecodeError) else reader.line_num
+            return ImportController._abort(stats, line_no, e)
+        
+        if chunk:
+            ImportController._flush(user_id, chunk, chunk_lines, stats, progress)
+        
+        if stats['diimpor'] == 0 and stats['gagal'] > 0:
+            stats.update(success=False, message=f"❌ Tidak ada transaksi diimpor, {stats['gagal']} baris gagal")
+            return stats
+        
+        stats['message'] = f"✅ {stats['diimpor']} transaksi diimpor, {stats['gagal']} baris gagal"
+        return stats
+    
+    @staticmethod
+    def _abort(stats, line_no, error):
+        """
+        Hentikan import karena file tidak bisa dibaca lagi (encoding/format CSV rusak)
+        Returns: dict statistik dengan baris yang gagal dan jumlah baris yang sudah tersimpan
+        """
+        if isinstance(error, UnicodeDecodeError):
+            reason = f"bukan teks {error.encoding} yang valid (coba pilih encoding lain)"
+        else:
+            reason = f"format CSV tidak valid ({error})"
+        
+        stats.update(
+            success=False,
+            baris_gagal=line_no,
+            message=f"❌ Import berhenti di baris {line_no}: {reason}. "
+                    f"{stats['diimpor']} transaksi sudah tersimpan"
+        )
+        return stats
+    
+    @staticmethod
+    def _resolve_columns(header, mapping):
+        """
+        Cocokkan field transaksi dengan indeks kolom CSV
+        Returns: tuple (dict field -> indeks, list kolom wajib yang hilang)
+        """
+        normalized = {name.strip().lower(): i for i, name in enumerate(header)}
+        columns = {}
+        missing = []
+        
+        for field in ImportController.FIELDS:
+            column = mapping.get(field, field)
+            index = normalized.get(str(column).strip().lower())
+            if index is not None:
+                columns[field] = index
+            elif field in ImportController.REQUIRED_FIELDS or field in mapping:
+                missing.append(str(column))
+        
+        return columns, missing
+    
+    @staticmethod
+    def _map_record(record, columns, format_tanggal, desimal_koma):
+        """
+        Ubah satu baris CSV menjadi dict data transaksi.
+        Jika kolom tipe tidak dipetakan, tipe ditentukan dari tanda jumlah
+        (negatif = Pengeluaran), seperti pada mutasi rekening bank.
+        """
+        def cell(field):
+            index = columns.get(field)
+            if index is None or index >= len(record):
+                return ''
+            return record[index].strip()
+        
+        tanggal = cell('tanggal')
+        try:
+            tanggal = datetime.strptime(tanggal, format_tanggal).date().isoformat()
+        except ValueError:
+            pass
+        
+        jumlah = ImportController._parse_amount(cell('jumlah'), desimal_koma)
+        
+        tipe = cell('tipe')
+        if 'tipe' not in columns and isinstance(jumlah, Decimal):
+            tipe = 'Pengeluaran' if jumlah < 0 else 'Pemasukan'
+            jumlah = abs(jumlah)
+        
+        return {
+            'tanggal': tanggal,
+            'tipe': tipe,
+            'kategori': cell('kategori') or 'Lainnya',
+            'jumlah': jumlah,
+            'keterangan': cell('keterangan')
+        }
+    
+    @staticmethod
+    def _parse_amount(value, desimal_koma):
+        """
+        Baca angka seperti 'Rp 1.500.000,00', '(25.000)' atau '-1,500.50'
+        Returns: Decimal, atau string asli jika tidak bisa dibaca
+        """
+        text = value.replace('Rp', '').replace('IDR', '').replace(' ', '')
+        negative = text.startswith('(') and text.endswith(')')
+        text = text.strip('()')
+        
+        if desimal_koma:
+            text = text.replace('.', '').replace(',', '.')
+        else:
+            text = text.replace(',', '')
+        
+        try:
+            amount = Decimal(text)
+        except InvalidOperation:
+            return value
+        return -amount if negative else amount
+    
+    @staticmethod
+    def _add_error(stats, line_no, errors):
+        """Catat error satu baris (dibatasi IMPORT_MAX_ERRORS agar memori tetap kecil)"""
+        stats['gagal'] += 1
+        if len(stats['errors']) < Config.IMPORT_MAX_ERRORS:
+            stats['errors'].append({'baris': line_no, 'errors': errors})
+        else:
+            stats['errors_terpotong'] = True
+    
+    @staticmethod
+    def _flush(user_id, chunk, chunk_lines, stats, progress):
+        """Simpan satu chunk dengan satu executemany dan commit sendiri"""
+        with unit_of_work(join=False):
+            ids = Transaksi.create_many(user_id, chunk)
+        
+        if ids is None:
+            for line_no in chunk_lines:
+                ImportController._add_error(stats, line_no, ["Gagal menyimpan ke database"])
+        else:
+            stats['diimpor'] += len(ids)
+        
+        if progress:
+            progress(stats)
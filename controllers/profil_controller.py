@@ -71,7 +71,7 @@ class ProfilController:
         Returns: tuple (success: Boolean, message: str)
         """
         # Verifikasi password
-        user = User.get_by_id(user_id)
+        user = User.get_credentials(user_id)
         if not User.verify_password(user, password):
             return False, "❌ Password salah!"
         
@@ -1,8 +1,19 @@
 """
 TRANSAKSI CONTROLLER
 """
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from config import Config
 from models.transaksi import Transaksi
 from models.tabungan import Tabungan
+from models.user import User
+from utils.money import Money
+
+# Kolom file export, urutan sama untuk CSV dan JSON Lines
+EXPORT_COLUMNS = ('id', 'tanggal', 'tipe', 'kategori', 'jumlah', 'keterangan', 'created_at')
 
 class TransaksiController:
     """Controller untuk transaksi"""
@@ -10,39 +21,190 @@ class TransaksiController:
     @staticmethod
     def tambah_transaksi(user_id, data):
         """
-        Tambah transaksi baru
+        Tambah transaksi baru (divalidasi dengan aturan yang sama seperti batch dan import)
         Args:
             user_id: ID user
             data: dict data transaksi
         Returns: tuple (success: Boolean, message: str)
         """
+        row, errors = TransaksiController.validasi(data)
+        if errors:
+            return False, f"❌ {'; '.join(errors)}"
+        
+        transaksi_id = Transaksi.create(user_id=user_id, **row)
+        
+        if transaksi_id:
+            return True, f"✅ {row['tipe']} berhasil ditambahkan!"
+        else:
+            return False, "❌ Gagal menambahkan transaksi"
+    
+    @staticmethod
+    def validasi(data):
+        """
+        Validasi dan normalisasi satu data transaksi
+        Args:
+            data: dict data transaksi
+        Returns: tuple (row: dict atau None, errors: list str)
+        """
+        if not isinstance(data, dict):
+            return None, ["Data transaksi harus berupa object"]
+        
+        errors = []
+        
+        tanggal = str(data.get('tanggal') or '')
         try:
-            transaksi_id = Transaksi.create(
-                user_id=user_id,
-                tanggal=data['tanggal'],
-                tipe=data['tipe'],
-                kategori=data['kategori'],
-                jumlah=data['jumlah'],
-                keterangan=data.get('keterangan', '')
-            )
-            
-            if transaksi_id:
-                return True, f"✅ {data['tipe']} berhasil ditambahkan!"
+            tanggal = datetime.strptime(tanggal, '%Y-%m-%d').date().isoformat()
+        except ValueError:
+            errors.append("Tanggal harus berformat YYYY-MM-DD")
+        
+        tipe = data.get('tipe')
+        kategori_valid = {
+            'Pemasukan': Config.KATEGORI_PEMASUKAN,
+            'Pengeluaran': Config.KATEGORI_PENGELUARAN,
+        }
+        kategori = data.get('kategori')
+        if tipe not in kategori_valid:
+            errors.append("Tipe harus Pemasukan atau Pengeluaran")
+        elif kategori not in kategori_valid[tipe]:
+            errors.append(f"Kategori tidak valid untuk {tipe}")
+        
+        try:
+            jumlah = Money.of(Decimal(str(data.get('jumlah'))))
+            if not Money() < jumlah < Money(10 ** 15):
+                errors.append("Jumlah harus lebih dari 0")
+        except (InvalidOperation, ValueError):
+            errors.append("Jumlah harus berupa angka")
+        
+        keterangan = data.get('keterangan') or ''
+        if not isinstance(keterangan, str):
+            errors.append("Keterangan harus berupa teks")
+        elif len(keterangan) > Config.KETERANGAN_MAX_LENGTH:
+            errors.append(f"Keterangan maksimal {Config.KETERANGAN_MAX_LENGTH} karakter")
+        
+        if errors:
+            return None, errors
+        
+        return {
+            'tanggal': tanggal,
+            'tipe': tipe,
+            'kategori': kategori,
+            'jumlah': jumlah,
+            'keterangan': keterangan
+        }, []
+    
+    @staticmethod
+    def tambah_batch(user_id, items):
+        """
+        Tambah banyak transaksi sekaligus.
+        Batch divalidasi utuh: jika ada satu baris tidak valid, tidak ada
+        yang disimpan. Baris valid disimpan dengan satu executemany dalam
+        satu transaksi database.
+        Args:
+            user_id: ID user
+            items: list dict data transaksi
+        Returns: tuple (success: Boolean, message: str, results: list dict per baris)
+        """
+        if not isinstance(items, list) or not items:
+            return False, "❌ Data batch harus berupa daftar transaksi", []
+        
+        if len(items) > Config.TRANSAKSI_BATCH_MAX:
+            return False, f"❌ Maksimal {Config.TRANSAKSI_BATCH_MAX} transaksi per batch", []
+        
+        rows = []
+        results = []
+        for index, item in enumerate(items):
+            row, errors = TransaksiController.validasi(item)
+            if errors:
+                results.append({'index': index, 'errors': errors})
             else:
-                return False, "❌ Gagal menambahkan transaksi"
-            
-        except Exception as e:
-            return False, f"❌ Error: {str(e)}"
+                rows.append(row)
+                results.append({'index': index})
+        
+        invalid = len(items) - len(rows)
+        if invalid:
+            return False, f"❌ {invalid} transaksi tidak valid, tidak ada yang disimpan", results
+        
+        ids = Transaksi.create_many(user_id, rows)
+        if ids is None:
+            return False, "❌ Gagal menambahkan transaksi", results
+        
+        for result, transaksi_id in zip(results, ids):
+            result['id'] = transaksi_id
+        
+        return True, f"✅ {len(ids)} transaksi berhasil ditambahkan!", results
     
     @staticmethod
-    def get_riwayat(user_id):
+    def get_riwayat(user_id, cursor='', limit=None, fmt=''):
         """
-        Dapatkan riwayat transaksi
+        Dapatkan satu halaman riwayat transaksi
         Args:
             user_id: ID user
-        Returns: list transaksi
+            cursor: token halaman berikutnya (kosong = halaman pertama)
+            limit: jumlah baris per halaman (dibatasi RIWAYAT_PAGE_SIZE_MAX)
+            fmt: '' (list objek per baris) atau 'columnar' (lihat _columnar)
+        Returns: dict dengan items (atau columns) dan next_cursor
+        Raises: ValueError jika cursor/limit/format tidak valid
         """
-        return Transaksi.get_all_by_user(user_id)
+        if fmt not in ('', 'columnar'):
+            raise ValueError("Format riwayat harus columnar atau kosong")
+        
+        limit = int(limit) if limit else Config.RIWAYAT_PAGE_SIZE
+        limit = max(1, min(limit, Config.RIWAYAT_PAGE_SIZE_MAX))
+        
+        position = Transaksi.decode_cursor(cursor) if cursor else None
+        sync_token = Transaksi.encode_change_token(User.get_data_version(user_id))
+        
+        if fmt == 'columnar':
+            columns, next_cursor = Transaksi.get_page_columnar(user_id, position, limit)
+            data = TransaksiController._columnar(columns)
+        else:
+            items, next_cursor = Transaksi.get_page(user_id, position, limit)
+            data = {'items': items}
+        
+        data.update(next_cursor=next_cursor, sync_token=sync_token)
+        return data
+    
+    @staticmethod
+    def _columnar(columns):
+        """
+        Susun respons columnar: satu array per kolom (tanpa user_id), dengan
+        tipe dan kategori dikodekan sebagai indeks ke array dictionaries.
+        Baris ke-i = columns[field][i] untuk setiap field.
+        Args:
+            columns: dict field -> list nilai dari Transaksi.get_page_columnar
+        Returns: dict format, count, columns, dictionaries
+        """
+        dictionaries = {}
+        
+        for field in ('tipe', 'kategori'):
+            values = dict.fromkeys(columns[field])
+            index = {value: i for i, value in enumerate(values)}
+            dictionaries[field] = list(values)
+            columns[field] = list(map(index.__getitem__, columns[field]))
+        
+        return {
+            'format': 'columnar',
+            'count': len(columns['id']),
+            'columns': columns,
+            'dictionaries': dictionaries
+        }
+    
+    @staticmethod
+    def get_riwayat_changes(user_id, since='', limit=None):
+        """
+        Dapatkan perubahan riwayat sejak token sinkronisasi
+        Args:
+            user_id: ID user
+            since: token dari sync_token / next_token sebelumnya (kosong = dari awal)
+            limit: jumlah baris maksimal (dibatasi RIWAYAT_PAGE_SIZE_MAX)
+        Returns: dict items, deleted, reset, next_token, has_more
+        Raises: ValueError jika token/limit tidak valid
+        """
+        limit = int(limit) if limit else Config.RIWAYAT_PAGE_SIZE_MAX
+        limit = max(1, min(limit, Config.RIWAYAT_PAGE_SIZE_MAX))
+        
+        position = Transaksi.decode_change_token(since) if since else (0, None)
+        return Transaksi.get_changes(user_id, position, limit)
     
     @staticmethod
     def get_buku_besar(user_id, kategori='', tanggal_mulai='', tanggal_akhir='', limit=10):
@@ -64,32 +226,96 @@ class TransaksiController:
         # Reverse untuk tampilan kronologis
         transaksi.reverse()
         
-        # Format untuk buku besar
+        # Saldo awal = saldo semua transaksi sebelum baris pertama jendela,
+        # agar kolom saldo benar walau jendela tidak dimulai dari awal riwayat
+        saldo_awal = Money()
+        if transaksi:
+            saldo_awal = Transaksi.get_saldo_sebelum(user_id, transaksi[0], kategori)
+        
+        # Format untuk buku besar (saldo berjalan dihitung dalam integer sen)
         entries = []
-        total_debit = 0
-        total_kredit = 0
+        total_debit = Money()
+        total_kredit = Money()
+        saldo = saldo_awal
         
         for t in transaksi:
+            jumlah = Money.of(t['jumlah'])
             if t['tipe'] == 'Pemasukan':
-                debit = float(t['jumlah'])
-                kredit = 0
+                debit = jumlah
+                kredit = Money()
                 total_debit += debit
             else:  # Pengeluaran atau Tabungan
-                debit = 0
-                kredit = float(t['jumlah'])
+                debit = Money()
+                kredit = jumlah
                 total_kredit += kredit
+            saldo += debit - kredit
             
             entries.append({
                 'tanggal': t['tanggal'],
                 'keterangan': t['keterangan'] or '-',
                 'kategori': t['kategori'],
-                'debit': debit,
-                'kredit': kredit
+                'debit': float(debit),
+                'kredit': float(kredit),
+                'saldo': float(saldo)
             })
         
         return {
             'entries': entries,
-            'total_debit': total_debit,
-            'total_kredit': total_kredit,
-            'saldo_akhir': total_debit - total_kredit
+            'saldo_awal': float(saldo_awal),
+            'total_debit': float(total_debit),
+            'total_kredit': float(total_kredit),
+            'saldo_akhir': float(saldo)
         }
+    
+    @staticmethod
+    def export(user_id, fmt='csv', kategori='', tanggal_mulai='', tanggal_akhir=''):
+        """
+        Export transaksi secara streaming
+        Args:
+            user_id: ID user
+            fmt: 'csv' atau 'jsonl'
+            kategori, tanggal_mulai, tanggal_akhir: filter seperti buku besar
+        Returns: generator string (potongan isi file per batch)
+        Raises: ValueError jika format tidak didukung
+        """
+        if fmt not in ('csv', 'jsonl'):
+            raise ValueError("Format export harus csv atau jsonl")
+        
+        batches = Transaksi.stream_filtered(
+            user_id, kategori, tanggal_mulai, tanggal_akhir, Config.EXPORT_FETCH_SIZE
+        )
+        
+        if fmt == 'csv':
+            return TransaksiController._export_csv(batches)
+        return TransaksiController._export_jsonl(batches)
+    
+    @staticmethod
+    def _export_csv(batches):
+        """Tulis batch transaksi sebagai potongan CSV"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        try:
+            writer.writerow(EXPORT_COLUMNS)
+            yield buffer.getvalue()
+            
+            for rows in batches:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([row[column] for column in EXPORT_COLUMNS] for row in rows)
+                yield buffer.getvalue()
+        finally:
+            batches.close()
+    
+    @staticmethod
+    def _export_jsonl(batches):
+        """Tulis batch transaksi sebagai potongan JSON Lines"""
+        try:
+            for rows in batches:
+                yield ''.join(
+                    json.dumps({column: row[column] for column in EXPORT_COLUMNS},
+                               default=str, ensure_ascii=False) + '\n'
+                    for row in rows
+                )
+        finally:
+            batches.close()
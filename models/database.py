@@ -1,23 +1,589 @@
 """
 DATABASE CONNECTION & INITIALIZATION
 """
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 import pymysql
 from pymysql.cursors import DictCursor
+from flask import current_app, g, got_request_exception, jsonify
 from config import Config
 
+class PoolTimeout(Exception):
+    """Tidak ada koneksi pool yang tersedia dalam batas waktu tunggu"""
+
+class PooledConnection:
+    """
+    Pembungkus koneksi pymysql yang dipinjam dari pool.
+    Semua atribut diteruskan ke koneksi asli, kecuali close()
+    yang mengembalikan koneksi ke pool alih-alih memutusnya.
+    """
+    
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self._clean = True  # False jika mungkin ada transaksi terbuka
+    
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise pymysql.err.InterfaceError("Koneksi sudah dikembalikan ke pool")
+        return getattr(self._raw, name)
+    
+    def cursor(self, *args, **kwargs):
+        self._clean = False
+        return self.__getattr__('cursor')(*args, **kwargs)
+    
+    def commit(self):
+        self.__getattr__('commit')()
+        self._clean = True
+    
+    def rollback(self):
+        self.__getattr__('rollback')()
+        self._clean = True
+    
+    def close(self):
+        """Kembalikan koneksi ke pool (aman dipanggil berkali-kali)"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool.release(raw, clean=self._clean)
+    
+    def discard(self):
+        """
+        Putus koneksi alih-alih mengembalikannya ke pool, misalnya saat
+        hasil query streaming (SSCursor) ditinggalkan di tengah jalan
+        """
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool.discard(raw)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __del__(self):
+        # Koneksi yang tidak sempat di-close (misalnya karena exception)
+        # tetap kembali ke pool dan transaksinya di-rollback
+        try:
+            self.close()
+        except Exception:
+            pass
+
+class ConnectionPool:
+    """
+    Pool koneksi MySQL yang thread-safe dan berukuran terbatas.
+    - min_size: jumlah koneksi idle yang selalu dipertahankan
+    - max_size: batas total koneksi terbuka (idle + dipakai)
+    - idle_timeout: koneksi idle lebih lama dari ini (detik) ditutup
+    - wait_timeout: lama menunggu (detik) saat pool penuh sebelum PoolTimeout
+    """
+    
+    def __init__(self, connect_kwargs, min_size=1, max_size=10, idle_timeout=300, wait_timeout=10):
+        if max_size < 1 or min_size > max_size:
+            raise ValueError("Ukuran pool tidak valid")
+        
+        self.connect_kwargs = connect_kwargs
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.wait_timeout = wait_timeout
+        self.pid = os.getpid()
+        
+        self._cond = threading.Condition()
+        self._idle = []  # list (koneksi, waktu_kembali), yang terbaru di akhir
+        self._size = 0   # total koneksi terbuka
+        self._waiting = 0
+        self._counters = {
+            'created': 0,
+            'reused': 0,
+            'closed': 0,
+            'timeouts': 0,
+            'ping_failures': 0,
+        }
+    
+    def warm(self):
+        """Buka koneksi sampai min_size agar request pertama tidak menunggu handshake"""
+        while True:
+            with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                raw = self._connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._counters['created'] += 1
+                self._idle.append((raw, time.monotonic()))
+                self._cond.notify()
+    
+    def acquire(self, timeout=None):
+        """
+        Pinjam koneksi dari pool
+        Args:
+            timeout: lama menunggu (detik), default wait_timeout
+        Returns: PooledConnection
+        """
+        if timeout is None:
+            timeout = self.wait_timeout
+        deadline = time.monotonic() + timeout
+        expired = []
+        
+        with self._cond:
+            while True:
+                expired.extend(self._pop_expired())
+                if self._idle:
+                    raw, _ = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    raw = None
+                    break
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    raise PoolTimeout(
+                        f"Pool koneksi penuh ({self.max_size}) setelah menunggu {timeout} detik"
+                    )
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+        
+        self._close_quietly(expired)
+        
+        if raw is None:
+            return PooledConnection(self, self._open_new())
+        
+        # Ping saat checkout: koneksi yang diputus server diganti yang baru
+        try:
+            raw.ping(reconnect=False)
+        except Exception:
+            with self._cond:
+                self._counters['ping_failures'] += 1
+                self._counters['closed'] += 1
+            self._close_quietly([raw])
+            return PooledConnection(self, self._open_new())
+        
+        with self._cond:
+            self._counters['reused'] += 1
+        return PooledConnection(self, raw)
+    
+    def release(self, raw, clean=False):
+        """
+        Kembalikan koneksi ke pool.
+        Transaksi yang masih terbuka di-rollback supaya peminjam berikutnya
+        tidak mewarisi lock atau snapshot lama.
+        Args:
+            raw: koneksi pymysql
+            clean: True jika transaksi terakhir sudah di-commit/rollback
+        """
+        try:
+            if not clean:
+                raw.rollback()
+            healthy = raw.open
+        except Exception:
+            healthy = False
+        
+        with self._cond:
+            if healthy:
+                self._idle.append((raw, time.monotonic()))
+            else:
+                self._size -= 1
+                self._counters['closed'] += 1
+            self._cond.notify()
+        
+        if not healthy:
+            self._close_quietly([raw])
+    
+    def discard(self, raw):
+        """Tutup koneksi yang dipinjam dan bebaskan slotnya di pool"""
+        with self._cond:
+            self._size -= 1
+            self._counters['closed'] += 1
+            self._cond.notify()
+        self._close_quietly([raw])
+    
+    def close_all(self):
+        """Tutup semua koneksi idle (koneksi yang sedang dipinjam ditutup saat kembali)"""
+        with self._cond:
+            idle = [raw for raw, _ in self._idle]
+            self._idle = []
+            self._size -= len(idle)
+            self._counters['closed'] += len(idle)
+            self._cond.notify_all()
+        self._close_quietly(idle)
+    
+    def stats(self):
+        """
+        Statistik pool untuk monitoring
+        Returns: dict ukuran pool dan counter kumulatif
+        """
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'waiting': self._waiting,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                **self._counters,
+            }
+    
+    def _connect(self):
+        return pymysql.connect(**self.connect_kwargs)
+    
+    def _open_new(self):
+        """Buka koneksi baru untuk slot yang sudah dipesan di _size"""
+        try:
+            raw = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._counters['created'] += 1
+        return raw
+    
+    def _pop_expired(self):
+        """Keluarkan koneksi idle yang melewati idle_timeout (dipanggil dengan lock)"""
+        expired = []
+        now = time.monotonic()
+        while (self._idle and self._size > self.min_size
+               and now - self._idle[0][1] > self.idle_timeout):
+            raw, _ = self._idle.pop(0)
+            self._size -= 1
+            self._counters['closed'] += 1
+            expired.append(raw)
+        return expired
+    
+    @staticmethod
+    def _close_quietly(connections):
+        for raw in connections:
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+class UnitOfWork:
+    """
+    Satu koneksi dan satu transaksi yang dipakai bersama oleh semua
+    pemanggilan model selama scope aktif (satu request atau satu blok with).
+    Koneksi baru dipinjam saat pertama dibutuhkan, lalu di-commit atau
+    di-rollback sekali ketika scope selesai.
+    """
+    
+    def __init__(self):
+        self._conn = None
+        self._after_commit = []
+        self.failed = False
+    
+    def connection(self):
+        """
+        Koneksi milik scope ini
+        Returns: ScopedConnection
+        """
+        if self._conn is None:
+            self._conn = get_pool().acquire()
+        return ScopedConnection(self)
+    
+    def mark_failed(self):
+        """Tandai scope agar di-rollback saat selesai"""
+        self.failed = True
+    
+    def on_commit(self, callback):
+        """Daftarkan callback yang dijalankan setelah scope ini berhasil commit"""
+        self._after_commit.append(callback)
+    
+    def finish(self, commit=True):
+        """
+        Akhiri scope: commit jika berhasil, rollback jika ada kegagalan
+        Args:
+            commit: False untuk memaksa rollback
+        Returns: Boolean (True jika perubahan di-commit)
+        """
+        conn, self._conn = self._conn, None
+        callbacks, self._after_commit = self._after_commit, []
+        if conn is None:
+            return False
+        
+        try:
+            if commit and not self.failed:
+                conn.commit()
+            else:
+                conn.rollback()
+                return False
+        finally:
+            conn.close()
+        
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error callback setelah commit: {e}")
+        return True
+
+class ScopedConnection:
+    """
+    Pandangan model terhadap koneksi milik UnitOfWork.
+    commit() dan close() dari model diabaikan karena scope yang memutuskan;
+    rollback() dan statement yang gagal menandai scope untuk di-rollback.
+    """
+    
+    def __init__(self, uow):
+        self._uow = uow
+    
+    def __getattr__(self, name):
+        return getattr(self._uow._conn, name)
+    
+    def cursor(self, *args, **kwargs):
+        return TrackingCursor(self._uow, self._uow._conn.cursor(*args, **kwargs))
+    
+    def commit(self):
+        pass
+    
+    def rollback(self):
+        self._uow.mark_failed()
+    
+    def close(self):
+        pass
+
+class TrackingCursor:
+    """Cursor yang menandai UnitOfWork gagal jika sebuah statement error"""
+    
+    def __init__(self, uow, cursor):
+        self._uow = uow
+        self._cursor = cursor
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+    
+    def __iter__(self):
+        return iter(self._cursor)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._cursor.close()
+    
+    def execute(self, query, args=None):
+        try:
+            return self._cursor.execute(query, args)
+        except Exception:
+            self._uow.mark_failed()
+            raise
+    
+    def executemany(self, query, args):
+        try:
+            return self._cursor.executemany(query, args)
+        except Exception:
+            self._uow.mark_failed()
+            raise
+
+_current_uow = ContextVar('current_uow', default=None)
+
+@contextmanager
+def unit_of_work(join=True):
+    """
+    Jalankan beberapa pemanggilan model dalam satu koneksi dan satu transaksi.
+    Jika sudah ada scope aktif (misalnya scope request), blok ini ikut
+    bergabung ke scope tersebut sehingga commit tetap terjadi sekali.
+    Args:
+        join: False untuk selalu membuka scope baru yang commit sendiri
+              saat blok selesai (misalnya commit per chunk saat import)
+    
+    Contoh:
+        with unit_of_work():
+            Transaksi.delete_all_by_user(user_id)
+            Tabungan.reset(user_id)
+    """
+    uow = _current_uow.get()
+    if join and uow is not None:
+        try:
+            yield uow
+        except BaseException:
+            uow.mark_failed()
+            raise
+        return
+    
+    uow = UnitOfWork()
+    token = _current_uow.set(uow)
+    try:
+        yield uow
+    except BaseException:
+        uow.mark_failed()
+        raise
+    finally:
+        _current_uow.reset(token)
+        uow.finish()
+
+def after_commit(callback):
+    """
+    Jalankan callback setelah perubahan benar-benar di-commit.
+    Di dalam scope aktif callback ditunda sampai scope commit (dan dibuang
+    jika scope di-rollback); di luar scope callback langsung dijalankan
+    karena model sudah commit sendiri sebelum memanggil fungsi ini.
+    Args:
+        callback: fungsi tanpa argumen
+    """
+    uow = _current_uow.get()
+    if uow is None:
+        callback()
+    else:
+        uow.on_commit(callback)
+
+def begin_request_scope():
+    """Hook before_request: buka UnitOfWork untuk request ini"""
+    g._db_uow_token = _current_uow.set(UnitOfWork())
+
+def _mark_request_failed(sender, exception, **extra):
+    """Sinyal got_request_exception: view gagal, perubahannya jangan di-commit"""
+    if g.get('_db_uow_token') is not None:
+        _current_uow.get().mark_failed()
+
+# Flask tetap menjalankan after_request untuk response 500 yang dibuat dari
+# exception di view, jadi kegagalan view harus ditandai pada scope-nya
+got_request_exception.connect(_mark_request_failed)
+
+def commit_request_scope(response):
+    """
+    Hook after_request: commit UnitOfWork request ini sebelum response
+    dikirim. Jika COMMIT gagal (deadlock, koneksi putus, constraint),
+    response diganti error 500 agar client tidak menerima success untuk
+    perubahan yang ter-rollback.
+    Response 5xx dan request yang view-nya melempar exception (Flask tetap
+    menjalankan hook ini untuk response 500-nya) tidak di-commit; scope
+    dibiarkan untuk di-rollback oleh end_request_scope.
+    """
+    token = g.get('_db_uow_token')
+    if token is None:
+        return response
+    
+    uow = _current_uow.get()
+    if response.status_code >= 500 or uow.failed:
+        return response
+    
+    try:
+        uow.finish()
+    except Exception:
+        current_app.logger.exception("Gagal commit transaksi request")
+        response = jsonify({'success': False, 'message': '❌ Gagal menyimpan perubahan, silakan coba lagi'})
+        response.status_code = 500
+    return response
+
+def end_request_scope(exc=None):
+    """
+    Hook teardown_request: lepaskan UnitOfWork request ini.
+    Request yang berhasil sudah di-commit oleh commit_request_scope; yang
+    tersisa di sini (response 5xx, exception di view, statement gagal)
+    di-rollback, lalu koneksi dikembalikan ke pool.
+    """
+    token = g.pop('_db_uow_token', None)
+    if token is None:
+        return
+    uow = _current_uow.get()
+    _current_uow.reset(token)
+    try:
+        uow.finish(commit=False)
+    except Exception:
+        current_app.logger.exception("Gagal menutup transaksi request")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """
+    Dapatkan pool koneksi global (dibuat saat pertama dipakai,
+    dan dibuat ulang di proses hasil fork)
+    Returns: ConnectionPool
+    """
+    global _pool
+    if _pool is None or _pool.pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool.pid != os.getpid():
+                pool = ConnectionPool(
+                    connect_kwargs={
+                        'host': Config.DB_CONFIG['host'],
+                        'port': Config.DB_CONFIG['port'],
+                        'user': Config.DB_CONFIG['user'],
+                        'password': Config.DB_CONFIG['password'],
+                        'database': Config.DB_CONFIG['database'],
+                        'charset': Config.DB_CONFIG['charset'],
+                        'cursorclass': DictCursor,
+                    },
+                    **Config.DB_POOL
+                )
+                try:
+                    pool.warm()
+                except Exception as e:
+                    print(f"⚠️  Gagal menyiapkan pool koneksi: {e}")
+                _pool = pool
+    return _pool
+
 def get_db_connection():
     """
-    Membuat koneksi ke database MySQL
-    Returns: pymysql connection object
+    Pinjam koneksi ke database MySQL dari pool.
+    Panggil close() seperti biasa untuk mengembalikannya ke pool.
+    Di dalam unit_of_work() / scope request, koneksi milik scope yang dipakai.
+    Returns: PooledConnection atau ScopedConnection
+    """
+    uow = _current_uow.get()
+    if uow is not None:
+        return uow.connection()
+    return get_pool().acquire()
+
+def get_pool_stats():
+    """
+    Statistik pool koneksi untuk monitoring
+    Returns: dict
+    """
+    return get_pool().stats()
+
+def ensure_index(cursor, table, name, columns):
+    """
+    Tambahkan index ke tabel yang sudah ada jika belum dibuat (migrasi ringan)
+    Args:
+        cursor: cursor aktif
+        table: nama tabel
+        name: nama index
+        columns: definisi kolom, contoh '(user_id, tanggal)'
+    Returns: Boolean (True jika index baru dibuat)
+    """
+    cursor.execute(f"SHOW INDEX FROM {table} WHERE Key_name = %s", (name,))
+    if cursor.fetchone():
+        return False
+    
+    cursor.execute(f"ALTER TABLE {table} ADD INDEX {name} {columns}")
+    print(f"✅ Index '{name}' ditambahkan ke tabel '{table}'")
+    return True
+
+def ensure_column(cursor, table, name, definition):
+    """
+    Tambahkan kolom ke tabel yang sudah ada jika belum ada (migrasi ringan)
+    Args:
+        cursor: cursor aktif
+        table: nama tabel
+        name: nama kolom
+        definition: definisi kolom, contoh 'BIGINT NOT NULL DEFAULT 0'
+    Returns: Boolean (True jika kolom baru dibuat)
     """
-    return pymysql.connect(
-        host=Config.DB_CONFIG['host'],
-        user=Config.DB_CONFIG['user'],
-        password=Config.DB_CONFIG['password'],
-        database=Config.DB_CONFIG['database'],
-        charset=Config.DB_CONFIG['charset'],
-        cursorclass=DictCursor
-    )
+    cursor.execute(f"SHOW COLUMNS FROM {table} LIKE %s", (name,))
+    if cursor.fetchone():
+        return False
+    
+    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+    print(f"✅ Kolom '{name}' ditambahkan ke tabel '{table}'")
+    return True
 
 def init_database():
     """
@@ -28,6 +594,7 @@ def init_database():
         # Koneksi tanpa database untuk membuat database
         conn = pymysql.connect(
             host=Config.DB_CONFIG['host'],
+            port=Config.DB_CONFIG['port'],
             user=Config.DB_CONFIG['user'],
             password=Config.DB_CONFIG['password']
         )
@@ -59,6 +626,9 @@ def init_database():
             """)
             print("✅ Tabel 'users' berhasil dibuat")
         
+        # Versi data per user, naik setiap ada penulisan (dipakai untuk ETag)
+        ensure_column(cursor, 'users', 'data_version', 'BIGINT NOT NULL DEFAULT 0')
+        
         # Cek dan buat tabel transaksi
         cursor.execute("SHOW TABLES LIKE 'transaksi'")
         if not cursor.fetchone():
@@ -80,6 +650,49 @@ def init_database():
             """)
             print("✅ Tabel 'transaksi' berhasil dibuat")
         
+        # Index komposit untuk keyset pagination riwayat & filter tanggal
+        ensure_index(cursor, 'transaksi', 'idx_user_tanggal', '(user_id, tanggal, created_at)')
+        
+        # Index komposit untuk filter kategori (+ rentang tanggal) buku besar
+        ensure_index(cursor, 'transaksi', 'idx_user_kategori_tanggal', '(user_id, kategori, tanggal, created_at)')
+        
+        # Change sequence untuk delta sync riwayat (/api/riwayat/changes)
+        ensure_column(cursor, 'transaksi', 'change_seq', 'BIGINT NOT NULL DEFAULT 0')
+        ensure_index(cursor, 'transaksi', 'idx_user_change', '(user_id, change_seq)')
+        
+        # Backfill baris lama (sebelum kolom ada, atau ditulis app.py lama):
+        # beri change_seq di atas data_version user lalu naikkan versinya,
+        # agar klien yang tokennya sudah lewat pun menerima baris tersebut
+        cursor.execute("""
+            UPDATE transaksi t JOIN users u ON u.id = t.user_id
+            SET t.change_seq = u.data_version + 1
+            WHERE t.change_seq = 0
+        """)
+        if cursor.rowcount:
+            cursor.execute("""
+                UPDATE users u
+                JOIN (SELECT user_id, MAX(change_seq) AS seq FROM transaksi GROUP BY user_id) t
+                  ON t.user_id = u.id
+                SET u.data_version = t.seq
+                WHERE t.seq > u.data_version
+            """)
+            print(f"✅ change_seq diisi untuk {cursor.rowcount} user")
+        
+        # Cek dan buat tabel tombstone transaksi yang dihapus
+        cursor.execute("SHOW TABLES LIKE 'transaksi_hapus'")
+        if not cursor.fetchone():
+            cursor.execute("""
+                CREATE TABLE transaksi_hapus (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    user_id INT NOT NULL,
+                    transaksi_id INT NULL,
+                    change_seq BIGINT NOT NULL,
+                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                    INDEX idx_user_change (user_id, change_seq)
+                )
+            """)
+            print("✅ Tabel 'transaksi_hapus' berhasil dibuat")
+        
         # Cek dan buat tabel tabungan
         cursor.execute("SHOW TABLES LIKE 'tabungan'")
         if not cursor.fetchone():
@@ -95,6 +708,60 @@ def init_database():
             """)
             print("✅ Tabel 'tabungan' berhasil dibuat")
         
+        # Cek dan buat tabel agregat saldo per user
+        cursor.execute("SHOW TABLES LIKE 'user_balances'")
+        if not cursor.fetchone():
+            cursor.execute("""
+                CREATE TABLE user_balances (
+                    user_id INT PRIMARY KEY,
+                    total_pemasukan DECIMAL(17,2) NOT NULL DEFAULT 0,
+                    total_pengeluaran DECIMAL(17,2) NOT NULL DEFAULT 0,
+                    jumlah_transaksi INT NOT NULL DEFAULT 0,
+                    last_transaction_id INT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+                )
+            """)
+            
+            # Isi dari ledger yang sudah ada
+            cursor.execute("""
+                INSERT INTO user_balances
+                    (user_id, total_pemasukan, total_pengeluaran, jumlah_transaksi, last_transaction_id)
+                SELECT user_id,
+                       COALESCE(SUM(CASE WHEN tipe = 'Pemasukan' THEN jumlah END), 0),
+                       COALESCE(SUM(CASE WHEN tipe IN ('Pengeluaran', 'Tabungan') THEN jumlah END), 0),
+                       COUNT(*),
+                       MAX(id)
+                FROM transaksi
+                GROUP BY user_id
+            """)
+            print("✅ Tabel 'user_balances' berhasil dibuat")
+        
+        # Cek dan buat tabel rekap bulanan
+        cursor.execute("SHOW TABLES LIKE 'rekap_bulanan'")
+        if not cursor.fetchone():
+            cursor.execute("""
+                CREATE TABLE rekap_bulanan (
+                    user_id INT NOT NULL,
+                    bulan CHAR(7) NOT NULL,
+                    tipe VARCHAR(20) NOT NULL,
+                    kategori VARCHAR(50) NOT NULL,
+                    total DECIMAL(17,2) NOT NULL DEFAULT 0,
+                    jumlah_transaksi INT NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, bulan, tipe, kategori),
+                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+                )
+            """)
+            
+            # Isi dari ledger yang sudah ada
+            cursor.execute("""
+                INSERT INTO rekap_bulanan (user_id, bulan, tipe, kategori, total, jumlah_transaksi)
+                SELECT user_id, DATE_FORMAT(tanggal, '%Y-%m'), tipe, kategori, SUM(jumlah), COUNT(*)
+                FROM transaksi
+                GROUP BY user_id, DATE_FORMAT(tanggal, '%Y-%m'), tipe, kategori
+            """)
+            print("✅ Tabel 'rekap_bulanan' berhasil dibuat")
+        
         conn.commit()
         cursor.close()
         conn.close()
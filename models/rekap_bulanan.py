@@ -0,0 +1,193 @@
+"""
+REKAP BULANAN MODEL
+Rollup transaksi per (user, bulan, tipe, kategori) yang diperbarui saat
+transaksi ditulis, sehingga chart dan tren cukup membaca O(bulan) baris.
+"""
+from datetime import date, datetime
+from models.database import get_db_connection
+
+class RekapBulanan:
+    """Model untuk tabel rollup rekap_bulanan"""
+    
+    @staticmethod
+    def bulan_dari(tanggal):
+        """
+        Kunci bulan 'YYYY-MM' dari tanggal transaksi
+        Args:
+            tanggal: date/datetime atau string 'YYYY-MM-DD'
+        Returns: string 'YYYY-MM'
+        """
+        if not isinstance(tanggal, date):
+            tanggal = datetime.strptime(str(tanggal)[:10], '%Y-%m-%d')
+        return tanggal.strftime('%Y-%m')
+    
+    @staticmethod
+    def apply(cursor, user_id, rekap):
+        """
+        Tambahkan perubahan ke rollup user.
+        Dipanggil dengan cursor yang sama dengan INSERT transaksi.
+        Args:
+            cursor: cursor aktif
+            user_id: ID user
+            rekap: dict {(bulan, tipe, kategori): (total Money, jumlah_transaksi)}
+        """
+        if not rekap:
+            return
+        
+        cursor.executemany("""
+            INSERT INTO rekap_bulanan (user_id, bulan, tipe, kategori, total, jumlah_transaksi)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                total = total + VALUES(total),
+                jumlah_transaksi = jumlah_transaksi + VALUES(jumlah_transaksi)
+        """, [
+            (user_id, bulan, tipe, kategori, total.to_decimal(), jumlah)
+            for (bulan, tipe, kategori), (total, jumlah) in rekap.items()
+        ])
+    
+    @staticmethod
+    def reset(cursor, user_id):
+        """
+        Hapus rollup user (setelah semua transaksinya dihapus)
+        Args:
+            cursor: cursor aktif
+            user_id: ID user
+        """
+        cursor.execute("DELETE FROM rekap_bulanan WHERE user_id = %s", (user_id,))
+    
+    @staticmethod
+    def get_by_kategori(user_id, tipe='Pengeluaran'):
+        """
+        Total per kategori sepanjang waktu
+        Args:
+            user_id: ID user
+            tipe: Pemasukan/Pengeluaran
+        Returns: list dict dengan kategori dan total
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute("""
+                SELECT kategori, SUM(total) as total
+                FROM rekap_bulanan
+                WHERE user_id = %s AND tipe = %s
+                GROUP BY kategori
+            """, (user_id, tipe))
+            
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def get_trend(user_id, bulan_mulai, bulan_akhir, kategori=''):
+        """
+        Total per bulan per tipe dalam rentang bulan
+        Args:
+            user_id: ID user
+            bulan_mulai: bulan awal 'YYYY-MM'
+            bulan_akhir: bulan akhir 'YYYY-MM'
+            kategori: filter kategori (opsional)
+        Returns: list dict dengan bulan, tipe, total, jumlah_transaksi
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            query = """
+                SELECT bulan, tipe, SUM(total) as total, SUM(jumlah_transaksi) as jumlah_transaksi
+                FROM rekap_bulanan
+                WHERE user_id = %s AND bulan BETWEEN %s AND %s
+            """
+            params = [user_id, bulan_mulai, bulan_akhir]
+            
+            if kategori:
+                query += " AND kategori = %s"
+                params.append(kategori)
+            
+            query += " GROUP BY bulan, tipe ORDER BY bulan"
+            
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def rebuild(user_id=None):
+        """
+        Hitung ulang rollup dari ledger transaksi
+        Args:
+            user_id: ID user (None = semua user)
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            where = "WHERE user_id = %s" if user_id is not None else ""
+            params = (user_id,) if user_id is not None else ()
+            
+            cursor.execute(f"DELETE FROM rekap_bulanan {where}", params)
+            cursor.execute(f"""
+                INSERT INTO rekap_bulanan (user_id, bulan, tipe, kategori, total, jumlah_transaksi)
+                SELECT user_id, DATE_FORMAT(tanggal, '%%Y-%%m'), tipe, kategori, SUM(jumlah), COUNT(*)
+                FROM transaksi
+                {where}
+                GROUP BY user_id, DATE_FORMAT(tanggal, '%%Y-%%m'), tipe, kategori
+            """, params)
+            
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def verify(user_id=None):
+        """
+        Bandingkan rollup tersimpan dengan hasil hitung ulang dari ledger
+        Args:
+            user_id: ID user (None = semua user)
+        Returns: list dict (user_id, bulan, tipe, kategori) yang tidak cocok
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            where_t = "WHERE user_id = %s" if user_id is not None else ""
+            and_r = "AND r.user_id = %s" if user_id is not None else ""
+            params = (user_id,) if user_id is not None else ()
+            
+            # Selisih dua arah: baris ledger yang hilang/berbeda di rollup,
+            # dan baris rollup yang tidak punya padanan di ledger
+            cursor.execute(f"""
+                SELECT l.user_id, l.bulan, l.tipe, l.kategori,
+                       l.total, r.total AS tersimpan_total
+                FROM (
+                    SELECT user_id, DATE_FORMAT(tanggal, '%%Y-%%m') AS bulan, tipe, kategori,
+                           SUM(jumlah) AS total, COUNT(*) AS jumlah_transaksi
+                    FROM transaksi
+                    {where_t}
+                    GROUP BY user_id, DATE_FORMAT(tanggal, '%%Y-%%m'), tipe, kategori
+                ) l
+                LEFT JOIN rekap_bulanan r
+                    ON r.user_id = l.user_id AND r.bulan = l.bulan
+                   AND r.tipe = l.tipe AND r.kategori = l.kategori
+                WHERE r.user_id IS NULL
+                   OR r.total <> l.total
+                   OR r.jumlah_transaksi <> l.jumlah_transaksi
+                UNION ALL
+                SELECT r.user_id, r.bulan, r.tipe, r.kategori, 0, r.total
+                FROM rekap_bulanan r
+                WHERE r.jumlah_transaksi > 0 {and_r} AND NOT EXISTS (
+                    SELECT 1 FROM transaksi t
+                    WHERE t.user_id = r.user_id AND t.tipe = r.tipe AND t.kategori = r.kategori
+                      AND t.tanggal >= STR_TO_DATE(CONCAT(r.bulan, '-01'), '%%Y-%%m-%%d')
+                      AND t.tanggal < STR_TO_DATE(CONCAT(r.bulan, '-01'), '%%Y-%%m-%%d') + INTERVAL 1 MONTH
+                )
+            """, params + params)
+            
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
@@ -1,7 +1,21 @@
 """
 TABUNGAN MODEL
 """
+from datetime import date
 from models.database import get_db_connection
+from models.transaksi import Transaksi
+from models.user import User
+from utils.cache import invalidate_user
+from utils.money import Money
+
+# Saldo tabungan menurut ledger: transaksi Tabungan (menabung) dikurangi
+# Pemasukan kategori Tabungan (ambil dari tabungan)
+LEDGER_TABUNGAN_SUM = """
+    COALESCE(SUM(CASE WHEN tipe = 'Tabungan' THEN jumlah ELSE -jumlah END), 0)
+"""
+LEDGER_TABUNGAN_WHERE = """
+    (tipe = 'Tabungan' OR (tipe = 'Pemasukan' AND kategori = 'Tabungan'))
+"""
 
 class Tabungan:
     """Model untuk tabungan user"""
@@ -12,7 +26,7 @@ class Tabungan:
         Dapatkan saldo tabungan user
         Args:
             user_id: ID user
-        Returns: float jumlah tabungan
+        Returns: Money jumlah tabungan
         """
         try:
             conn = get_db_connection()
@@ -28,15 +42,15 @@ class Tabungan:
             conn.close()
             
             if result:
-                return float(result['jumlah'])
+                return Money.of(result['jumlah'])
             else:
                 # Buat record tabungan jika belum ada
                 Tabungan.create(user_id)
-                return 0.0
+                return Money()
             
         except Exception as e:
             print(f"Error get tabungan: {e}")
-            return 0.0
+            return Money()
     
     @staticmethod
     def create(user_id, jumlah=0):
@@ -72,21 +86,25 @@ class Tabungan:
         Update jumlah tabungan
         Args:
             user_id: ID user
-            jumlah: jumlah baru
+            jumlah: jumlah baru (Money)
         Returns: Boolean
         """
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
             
+            # Kunci row users lebih dulu, urutan yang sama dengan semua
+            # penulis saldo lain (Transaksi, tambah/kurang) agar tidak deadlock
+            User.bump_data_version(cursor, user_id)
             cursor.execute("""
                 UPDATE tabungan SET jumlah = %s WHERE user_id = %s
-            """, (jumlah, user_id))
+            """, (Money.of(jumlah).to_decimal(), user_id))
             
             conn.commit()
             cursor.close()
             conn.close()
             
+            invalidate_user(user_id)
             return True
             
         except Exception as e:
@@ -94,38 +112,108 @@ class Tabungan:
             return False
     
     @staticmethod
-    def tambah(user_id, jumlah):
+    def tambah(user_id, jumlah, tanggal=None):
         """
-        Tambah ke tabungan
+        Pindahkan saldo tersedia ke tabungan.
+        Transaksi Tabungan dicatat lebih dulu (mengunci row users dan
+        user_balances), lalu tabungan ditambah dengan satu upsert atomik dan
+        saldo tersedia dicek ulang di transaksi yang sama; jika saldo menjadi
+        negatif semuanya di-rollback. Dua request bersamaan tidak bisa
+        memakai saldo yang sama.
         Args:
             user_id: ID user
-            jumlah: jumlah yang ditambahkan
-        Returns: Boolean
+            jumlah: jumlah yang ditabung (Money, > 0)
+            tanggal: tanggal transaksi (default hari ini)
+        Returns: tuple (success: Boolean, message: str)
         """
-        current = Tabungan.get_by_user(user_id)
-        new_amount = current + float(jumlah)
-        return Tabungan.update(user_id, new_amount)
+        jumlah = Money.of(jumlah)
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
+            Transaksi.insert_rows(cursor, user_id, [{
+                'tanggal': tanggal or date.today().isoformat(),
+                'tipe': 'Tabungan',
+                'kategori': 'Tabungan',
+                'jumlah': jumlah,
+                'keterangan': 'Menabung'
+            }])
+            
+            cursor.execute("""
+                INSERT INTO tabungan (user_id, jumlah) VALUES (%s, %s)
+                ON DUPLICATE KEY UPDATE jumlah = jumlah + VALUES(jumlah)
+            """, (user_id, jumlah.to_decimal()))
+            
+            cursor.execute("""
+                SELECT total_pemasukan - total_pengeluaran AS saldo
+                FROM user_balances WHERE user_id = %s
+            """, (user_id,))
+            saldo = Money.of(cursor.fetchone()['saldo'])
+            
+            if saldo < Money():
+                conn.rollback()
+                cursor.close()
+                conn.close()
+                return False, f"Saldo tersedia tidak cukup! Anda hanya punya Rp {saldo + jumlah:,.0f}"
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            invalidate_user(user_id)
+            return True, "Berhasil menambah tabungan"
+            
+        except Exception as e:
+            print(f"Error tambah tabungan: {e}")
+            return False, "Gagal menambah tabungan"
     
     @staticmethod
-    def kurang(user_id, jumlah):
+    def kurang(user_id, jumlah, tanggal=None):
         """
-        Kurangi dari tabungan
+        Ambil dari tabungan kembali ke saldo tersedia.
+        Tabungan dikurangi dengan satu UPDATE bersyarat (jumlah >= yang
+        diambil) di transaksi yang sama dengan pencatatan transaksi
+        Pemasukan kategori Tabungan.
         Args:
             user_id: ID user
-            jumlah: jumlah yang dikurangi
+            jumlah: jumlah yang diambil (Money, > 0)
+            tanggal: tanggal transaksi (default hari ini)
         Returns: tuple (success: Boolean, message: str)
         """
-        current = Tabungan.get_by_user(user_id)
-        
-        if float(jumlah) > current:
-            return False, "Saldo tabungan tidak cukup!"
-        
-        new_amount = current - float(jumlah)
-        success = Tabungan.update(user_id, new_amount)
-        
-        if success:
+        jumlah = Money.of(jumlah)
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
+            # Ledger dulu agar row users terkunci sebelum row tabungan
+            Transaksi.insert_rows(cursor, user_id, [{
+                'tanggal': tanggal or date.today().isoformat(),
+                'tipe': 'Pemasukan',
+                'kategori': 'Tabungan',
+                'jumlah': jumlah,
+                'keterangan': 'Ambil dari tabungan'
+            }])
+            
+            cursor.execute("""
+                UPDATE tabungan SET jumlah = jumlah - %s
+                WHERE user_id = %s AND jumlah >= %s
+            """, (jumlah.to_decimal(), user_id, jumlah.to_decimal()))
+            
+            if cursor.rowcount == 0:
+                conn.rollback()
+                cursor.close()
+                conn.close()
+                return False, "Saldo tabungan tidak cukup!"
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            invalidate_user(user_id)
             return True, "Berhasil mengambil dari tabungan"
-        else:
+            
+        except Exception as e:
+            print(f"Error kurang tabungan: {e}")
             return False, "Gagal mengambil dari tabungan"
     
     @staticmethod
@@ -136,4 +224,79 @@ class Tabungan:
             user_id: ID user
         Returns: Boolean
         """
-        return Tabungan.update(user_id, 0)
+        return Tabungan.update(user_id, Money())
+    
+    @staticmethod
+    def verify_range(user_id_awal, user_id_akhir):
+        """
+        Bandingkan saldo tabungan tersimpan dengan saldo menurut ledger untuk
+        semua user dalam satu rentang ID (satu query ber-GROUP BY)
+        Args:
+            user_id_awal: ID user pertama (inklusif)
+            user_id_akhir: ID user terakhir (inklusif)
+        Returns: tuple (jumlah user diperiksa, list dict user_id, jumlah, tersimpan yang tidak cocok)
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f"""
+                SELECT u.id AS user_id, COALESCE(l.jumlah, 0) AS jumlah, tb.jumlah AS tersimpan
+                FROM users u
+                LEFT JOIN (
+                    SELECT user_id, {LEDGER_TABUNGAN_SUM} AS jumlah
+                    FROM transaksi
+                    WHERE user_id BETWEEN %s AND %s AND {LEDGER_TABUNGAN_WHERE}
+                    GROUP BY user_id
+                ) l ON l.user_id = u.id
+                LEFT JOIN tabungan tb ON tb.user_id = u.id
+                WHERE u.id BETWEEN %s AND %s
+            """, (user_id_awal, user_id_akhir, user_id_awal, user_id_akhir))
+            
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
+        
+        # User tanpa record tabungan dianggap bersaldo 0
+        mismatches = []
+        for row in rows:
+            jumlah = Money.of(row['jumlah'])
+            tersimpan = Money.of(row['tersimpan'])
+            if jumlah != tersimpan:
+                mismatches.append({'user_id': row['user_id'], 'jumlah': jumlah, 'tersimpan': tersimpan})
+        
+        return len(rows), mismatches
+    
+    @staticmethod
+    def rebuild(user_id):
+        """
+        Hitung ulang saldo tabungan user dari ledger transaksi.
+        Row users dikunci lebih dulu (seperti tambah/kurang) sehingga tidak
+        ada operasi tabungan yang berjalan di antara hitung ulang dan tulis.
+        Args:
+            user_id: ID user
+        Returns: Money saldo tabungan baru
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            User.bump_data_version(cursor, user_id)
+            cursor.execute(f"""
+                INSERT INTO tabungan (user_id, jumlah)
+                SELECT %s, {LEDGER_TABUNGAN_SUM}
+                FROM transaksi
+                WHERE user_id = %s AND {LEDGER_TABUNGAN_WHERE}
+                ON DUPLICATE KEY UPDATE jumlah = VALUES(jumlah)
+            """, (user_id, user_id))
+            cursor.execute("SELECT jumlah FROM tabungan WHERE user_id = %s", (user_id,))
+            jumlah = Money.of(cursor.fetchone()['jumlah'])
+            
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+        
+        invalidate_user(user_id)
+        return jumlah
@@ -1,7 +1,23 @@
 """
 TRANSAKSI MODEL
 """
-from models.database import get_db_connection
+import base64
+from pymysql.cursors import Cursor, SSDictCursor
+from models.database import get_db_connection, get_pool
+from models.user_balance import UserBalance
+from models.rekap_bulanan import RekapBulanan
+from models.user import User
+from utils.cache import invalidate_user
+from utils.money import Money
+
+# Kolom riwayat format columnar. Tanggal, jumlah dan created_at sudah diubah
+# ke string oleh MySQL sehingga hasil fetch langsung bisa di-serialize JSON
+# tanpa konversi Decimal/date per baris di Python.
+COLUMNAR_FIELDS = ('id', 'tanggal', 'tipe', 'kategori', 'jumlah', 'keterangan', 'created_at')
+COLUMNAR_SELECT = """
+    id, DATE_FORMAT(tanggal, '%%Y-%%m-%%d'), tipe, kategori,
+    CAST(jumlah AS CHAR), keterangan, DATE_FORMAT(created_at, '%%Y-%%m-%%d %%H:%%i:%%s')
+"""
 
 class Transaksi:
     """Model untuk transaksi keuangan"""
@@ -15,7 +31,7 @@ class Transaksi:
             tanggal: tanggal transaksi
             tipe: Pemasukan/Pengeluaran/Tabungan
             kategori: kategori transaksi
-            jumlah: jumlah uang
+            jumlah: jumlah uang (Money, Decimal atau angka)
             keterangan: keterangan opsional
         Returns: transaksi_id atau None
         """
@@ -23,23 +39,103 @@ class Transaksi:
             conn = get_db_connection()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO transaksi (user_id, tanggal, tipe, kategori, jumlah, keterangan)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (user_id, tanggal, tipe, kategori, jumlah, keterangan))
-            
-            transaksi_id = cursor.lastrowid
+            transaksi_id = Transaksi.insert_rows(cursor, user_id, [{
+                'tanggal': tanggal,
+                'tipe': tipe,
+                'kategori': kategori,
+                'jumlah': jumlah,
+                'keterangan': keterangan
+            }])[0]
             
             conn.commit()
             cursor.close()
             conn.close()
             
+            invalidate_user(user_id)
             return transaksi_id
             
         except Exception as e:
             print(f"Error create transaksi: {e}")
             return None
     
+    @staticmethod
+    def create_many(user_id, rows):
+        """
+        Buat banyak transaksi sekaligus (satu executemany, satu commit)
+        Args:
+            user_id: ID user
+            rows: list dict (tanggal, tipe, kategori, jumlah, keterangan) yang sudah divalidasi
+        Returns: list transaksi_id (urutan sama dengan rows) atau None jika gagal
+        """
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
+            ids = Transaksi.insert_rows(cursor, user_id, rows)
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            invalidate_user(user_id)
+            return ids
+            
+        except Exception as e:
+            print(f"Error create many transaksi: {e}")
+            return None
+    
+    @staticmethod
+    def insert_rows(cursor, user_id, rows):
+        """
+        INSERT baris transaksi lalu perbarui agregat saldo, rekap bulanan dan
+        versi data user dengan cursor yang sama (ikut commit/rollback bersama ledger)
+        Args:
+            cursor: cursor aktif
+            user_id: ID user
+            rows: list dict transaksi
+        Returns: list transaksi_id
+        """
+        # Hitung perubahan agregat sebelum menulis apa pun (integer sen)
+        amounts = [Money.of(r['jumlah']) for r in rows]
+        total_pemasukan = Money()
+        total_pengeluaran = Money()
+        rekap = {}
+        for r, jumlah in zip(rows, amounts):
+            pemasukan, pengeluaran = UserBalance.delta(r['tipe'], jumlah)
+            total_pemasukan += pemasukan
+            total_pengeluaran += pengeluaran
+            
+            key = (RekapBulanan.bulan_dari(r['tanggal']), r['tipe'], r['kategori'])
+            total, count = rekap.get(key, (Money(), 0))
+            rekap[key] = (total + jumlah, count + 1)
+        
+        # Versi data dinaikkan lebih dulu agar row users terkunci sebelum
+        # INSERT; versi baru menjadi change_seq baris-baris ini
+        change_seq = User.bump_data_version(cursor, user_id)
+        
+        # pymysql menggabungkan executemany menjadi satu INSERT multi-baris
+        cursor.executemany("""
+            INSERT INTO transaksi (user_id, tanggal, tipe, kategori, jumlah, keterangan, change_seq)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, [
+            (user_id, r['tanggal'], r['tipe'], r['kategori'], jumlah.to_decimal(), r.get('keterangan', ''), change_seq)
+            for r, jumlah in zip(rows, amounts)
+        ])
+        
+        # ID dibaca ulang, bukan dihitung dari lastrowid: ID satu INSERT tidak
+        # dijamin berurutan (auto_increment_increment > 1 pada replikasi/Galera,
+        # innodb_autoinc_lock_mode=2). Row users masih terkunci sehingga hanya
+        # baris INSERT ini yang punya change_seq tersebut (index idx_user_change).
+        cursor.execute("""
+            SELECT id FROM transaksi WHERE user_id = %s AND change_seq = %s ORDER BY id
+        """, (user_id, change_seq))
+        ids = [row['id'] for row in cursor.fetchall()]
+        
+        UserBalance.apply(cursor, user_id, total_pemasukan, total_pengeluaran, len(rows), ids[-1])
+        RekapBulanan.apply(cursor, user_id, rekap)
+        
+        return ids
+    
     @staticmethod
     def get_all_by_user(user_id, limit=None):
         """
@@ -74,6 +170,289 @@ class Transaksi:
             print(f"Error get transaksi: {e}")
             return []
     
+    @staticmethod
+    def encode_cursor(row):
+        """
+        Buat token cursor halaman berikutnya dari baris terakhir halaman
+        Args:
+            row: dict transaksi (tanggal, created_at, id), nilai date/datetime atau string ISO
+        Returns: string token
+        """
+        raw = f"{row['tanggal']}|{row['created_at']}|{row['id']}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def decode_cursor(token):
+        """
+        Baca token cursor
+        Args:
+            token: string token dari encode_cursor
+        Returns: tuple (tanggal, created_at, id)
+        Raises: ValueError jika token tidak valid
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+            tanggal, created_at, transaksi_id = raw.split('|')
+            return tanggal, created_at, int(transaksi_id)
+        except Exception:
+            raise ValueError("Cursor tidak valid")
+    
+    @staticmethod
+    def get_page(user_id, after=None, limit=50):
+        """
+        Dapatkan satu halaman riwayat dengan keyset pagination
+        (urut tanggal, created_at, id menurun), memakai idx_user_tanggal
+        sehingga halaman ke-N sama murahnya dengan halaman pertama.
+        Args:
+            user_id: ID user
+            after: tuple hasil decode_cursor (None = halaman pertama)
+            limit: jumlah baris per halaman
+        Returns: tuple (list transaksi, token cursor berikutnya atau None)
+        """
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
+            query, params = Transaksi._page_query("*", user_id, after, limit)
+            cursor.execute(query, params)
+            transaksi = cursor.fetchall()
+            
+            cursor.close()
+            conn.close()
+            
+            next_cursor = None
+            if len(transaksi) > int(limit):
+                transaksi = transaksi[:int(limit)]
+                next_cursor = Transaksi.encode_cursor(transaksi[-1])
+            
+            return transaksi, next_cursor
+            
+        except Exception as e:
+            print(f"Error get page transaksi: {e}")
+            return [], None
+    
+    @staticmethod
+    def get_page_columnar(user_id, after=None, limit=50):
+        """
+        Sama dengan get_page, tetapi hasilnya per kolom (list nilai per field
+        COLUMNAR_FIELDS). Baris dibaca sebagai tuple lalu ditranspos sekaligus,
+        tanpa membuat dict per baris.
+        Args:
+            user_id: ID user
+            after: tuple hasil decode_cursor (None = halaman pertama)
+            limit: jumlah baris per halaman
+        Returns: tuple (dict field -> list nilai, token cursor berikutnya atau None)
+        """
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor(Cursor)
+            
+            query, params = Transaksi._page_query(COLUMNAR_SELECT, user_id, after, limit)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            
+            cursor.close()
+            conn.close()
+            
+            next_cursor = None
+            if len(rows) > int(limit):
+                rows = rows[:int(limit)]
+                next_cursor = Transaksi.encode_cursor(dict(zip(COLUMNAR_FIELDS, rows[-1])))
+            
+            columns = zip(*rows) if rows else [()] * len(COLUMNAR_FIELDS)
+            return dict(zip(COLUMNAR_FIELDS, map(list, columns))), next_cursor
+            
+        except Exception as e:
+            print(f"Error get page columnar transaksi: {e}")
+            return {field: [] for field in COLUMNAR_FIELDS}, None
+    
+    @staticmethod
+    def _page_query(select, user_id, after, limit):
+        """
+        Susun query keyset pagination riwayat
+        (urut tanggal, created_at, id menurun, memakai idx_user_tanggal)
+        Returns: tuple (string query, list params)
+        """
+        query = f"SELECT {select} FROM transaksi WHERE user_id = %s"
+        params = [user_id]
+        
+        if after:
+            tanggal, created_at, transaksi_id = after
+            query += """
+                AND (tanggal < %s
+                     OR (tanggal = %s AND (created_at < %s
+                         OR (created_at = %s AND id < %s))))
+            """
+            params += [tanggal, tanggal, created_at, created_at, transaksi_id]
+        
+        # Ambil satu baris ekstra untuk mengetahui ada halaman berikutnya
+        query += " ORDER BY tanggal DESC, created_at DESC, id DESC LIMIT %s"
+        params.append(int(limit) + 1)
+        
+        return query, params
+    
+    @staticmethod
+    def encode_change_token(change_seq, transaksi_id=None):
+        """
+        Buat token delta sync
+        Args:
+            change_seq: change sequence terakhir yang sudah diterima klien
+            transaksi_id: ID terakhir di change_seq tersebut (None = semua baris
+                          di change_seq itu sudah diterima)
+        Returns: string token
+        """
+        raw = f"{change_seq}" if transaksi_id is None else f"{change_seq}|{transaksi_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def decode_change_token(token):
+        """
+        Baca token delta sync
+        Args:
+            token: string token dari encode_change_token
+        Returns: tuple (change_seq, transaksi_id atau None)
+        Raises: ValueError jika token tidak valid
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+            parts = raw.split('|')
+            if len(parts) > 2:
+                raise ValueError
+            transaksi_id = int(parts[1]) if len(parts) == 2 else None
+            return int(parts[0]), transaksi_id
+        except Exception:
+            raise ValueError("Token sinkronisasi tidak valid")
+    
+    @staticmethod
+    def get_changes(user_id, since=(0, None), limit=200):
+        """
+        Dapatkan perubahan riwayat setelah sebuah token (delta sync).
+        Baris dibaca lewat idx_user_change, jadi biayanya sebanding dengan
+        jumlah perubahan, bukan panjang riwayat.
+        Args:
+            user_id: ID user
+            since: tuple hasil decode_change_token
+            limit: jumlah baris maksimal
+        Returns: dict items, deleted (list ID), reset (Boolean), next_token, has_more
+        """
+        change_seq, transaksi_id = since
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # Sync awal (token kosong) cukup menerima baris yang ada sekarang;
+            # tombstone, termasuk tombstone reset, hanya relevan bagi klien
+            # yang sudah memegang data dari token sebelumnya
+            tombstones = []
+            if change_seq > 0:
+                cursor.execute("""
+                    SELECT transaksi_id FROM transaksi_hapus
+                    WHERE user_id = %s AND change_seq > %s
+                """, (user_id, change_seq))
+                tombstones = [row['transaksi_id'] for row in cursor.fetchall()]
+            
+            if change_seq == 0 and transaksi_id is None:
+                # Sync awal ikut membaca change_seq 0 (baris yang ditulis
+                # app.py lama atau sebelum backfill di init_database)
+                cursor.execute("""
+                    SELECT * FROM transaksi
+                    WHERE user_id = %s AND change_seq >= 0
+                    ORDER BY change_seq, id
+                    LIMIT %s
+                """, (user_id, int(limit) + 1))
+            elif transaksi_id is None:
+                cursor.execute("""
+                    SELECT * FROM transaksi
+                    WHERE user_id = %s AND change_seq > %s
+                    ORDER BY change_seq, id
+                    LIMIT %s
+                """, (user_id, change_seq, int(limit) + 1))
+            else:
+                cursor.execute("""
+                    SELECT * FROM transaksi
+                    WHERE user_id = %s
+                      AND (change_seq > %s OR (change_seq = %s AND id > %s))
+                    ORDER BY change_seq, id
+                    LIMIT %s
+                """, (user_id, change_seq, change_seq, transaksi_id, int(limit) + 1))
+            items = cursor.fetchall()
+            has_more = len(items) > int(limit)
+            items = items[:int(limit)]
+            
+            if items:
+                last = items[-1]
+                # Token "0" tanpa ID sama dengan token kosong, jadi posisi di
+                # change_seq 0 selalu disimpan bersama ID terakhirnya
+                change_seq = int(last['change_seq'])
+                transaksi_id = last['id'] if has_more or change_seq == 0 else None
+            
+            # Setelah halaman terakhir, token maju ke versi data saat ini
+            # (penulisan non-transaksi juga menaikkan versi)
+            if not has_more:
+                cursor.execute("SELECT data_version FROM users WHERE id = %s", (user_id,))
+                row = cursor.fetchone()
+                if row and int(row['data_version']) > change_seq:
+                    change_seq, transaksi_id = int(row['data_version']), None
+        finally:
+            cursor.close()
+            conn.close()
+        
+        return {
+            'items': items,
+            'deleted': [t for t in tombstones if t is not None],
+            'reset': None in tombstones,
+            'next_token': Transaksi.encode_change_token(change_seq, transaksi_id),
+            'has_more': has_more
+        }
+    
+    @staticmethod
+    def build_filter(user_id, kategori='', tanggal_mulai='', tanggal_akhir=''):
+        """
+        Susun klausa WHERE filter transaksi.
+        Kolom tanggal dibandingkan langsung (tanpa DATE()) agar predikat
+        tetap sargable dan bisa memakai range scan pada index komposit
+        idx_user_tanggal / idx_user_kategori_tanggal.
+        Args:
+            user_id: ID user
+            kategori: filter kategori (opsional)
+            tanggal_mulai: filter tanggal awal 'YYYY-MM-DD' (opsional)
+            tanggal_akhir: filter tanggal akhir 'YYYY-MM-DD' (opsional)
+        Returns: tuple (string klausa WHERE, list params)
+        """
+        where = "user_id = %s"
+        params = [user_id]
+        
+        if kategori:
+            where += " AND kategori = %s"
+            params.append(kategori)
+        
+        if tanggal_mulai:
+            where += " AND tanggal >= %s"
+            params.append(tanggal_mulai)
+        
+        if tanggal_akhir:
+            where += " AND tanggal <= %s"
+            params.append(tanggal_akhir)
+        
+        return where, params
+    
+    @staticmethod
+    def filtered_query(user_id, kategori='', tanggal_mulai='', tanggal_akhir='', limit=None):
+        """
+        Susun query get_filtered (juga dipakai scripts/explain_filters agar
+        rencana yang diperiksa sama persis dengan query produksi)
+        Args:
+            user_id, kategori, tanggal_mulai, tanggal_akhir, limit: seperti get_filtered
+        Returns: tuple (query, params)
+        """
+        where, params = Transaksi.build_filter(user_id, kategori, tanggal_mulai, tanggal_akhir)
+        query = f"SELECT * FROM transaksi WHERE {where} ORDER BY tanggal DESC, created_at DESC, id DESC"
+        
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return query, params
+    
     @staticmethod
     def get_filtered(user_id, kategori='', tanggal_mulai='', tanggal_akhir='', limit=None):
         """
@@ -90,26 +469,7 @@ class Transaksi:
             conn = get_db_connection()
             cursor = conn.cursor()
             
-            query = "SELECT * FROM transaksi WHERE user_id = %s"
-            params = [user_id]
-            
-            if kategori:
-                query += " AND kategori = %s"
-                params.append(kategori)
-            
-            if tanggal_mulai:
-                query += " AND DATE(tanggal) >= %s"
-                params.append(tanggal_mulai)
-            
-            if tanggal_akhir:
-                query += " AND DATE(tanggal) <= %s"
-                params.append(tanggal_akhir)
-            
-            query += " ORDER BY tanggal DESC, created_at DESC"
-            
-            if limit:
-                query += f" LIMIT {int(limit)}"
-            
+            query, params = Transaksi.filtered_query(user_id, kategori, tanggal_mulai, tanggal_akhir, limit)
             cursor.execute(query, params)
             transaksi = cursor.fetchall()
             
@@ -123,78 +483,234 @@ class Transaksi:
             return []
     
     @staticmethod
-    def get_summary(user_id):
+    def get_saldo_sebelum(user_id, transaksi, kategori=''):
         """
-        Dapatkan ringkasan transaksi user
+        Saldo (pemasukan - pengeluaran) semua transaksi sebelum satu transaksi,
+        dalam urutan (tanggal, created_at, id). Bulan-bulan sebelumnya dibaca
+        dari rollup rekap_bulanan, sisanya hanya transaksi di bulan yang sama
+        lewat range scan index, jadi biayanya tidak tumbuh dengan panjang riwayat.
         Args:
             user_id: ID user
-        Returns: dict dengan pemasukan, pengeluaran, saldo
+            transaksi: dict transaksi acuan (tanggal, created_at, id)
+            kategori: hitung hanya kategori ini (opsional)
+        Returns: Money saldo
         """
+        tanggal = transaksi['tanggal']
+        bulan = RekapBulanan.bulan_dari(tanggal)
+        kategori_filter = " AND kategori = %s" if kategori else ""
+        kategori_params = [kategori] if kategori else []
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f"""
+                SELECT (
+                    SELECT COALESCE(SUM(CASE WHEN tipe = 'Pemasukan' THEN total ELSE -total END), 0)
+                    FROM rekap_bulanan
+                    WHERE user_id = %s AND bulan < %s{kategori_filter}
+                ) + (
+                    SELECT COALESCE(SUM(CASE WHEN tipe = 'Pemasukan' THEN jumlah ELSE -jumlah END), 0)
+                    FROM transaksi
+                    WHERE user_id = %s{kategori_filter}
+                      AND tanggal >= %s
+                      AND (tanggal < %s
+                           OR (tanggal = %s AND (created_at < %s
+                                                 OR (created_at = %s AND id < %s))))
+                ) AS saldo
+            """, [user_id, bulan] + kategori_params + [user_id] + kategori_params + [
+                f"{bulan}-01", tanggal, tanggal,
+                transaksi['created_at'], transaksi['created_at'], transaksi['id']
+            ])
+            
+            return Money.of(cursor.fetchone()['saldo'])
+        finally:
+            cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def get_ledger_columns(user_id):
+        """
+        Baca seluruh ledger user per kolom untuk analitik vektor.
+        Nilai sudah berbentuk integer dari MySQL (hari sejak 1970-01-01,
+        kode tipe, jumlah dalam sen) sehingga langsung bisa menjadi array NumPy.
+        Args:
+            user_id: ID user
+        Returns: tuple 4 kolom (hari, kode tipe 1=Pemasukan 2=Pengeluaran 3=Tabungan,
+                 kategori, sen), masing-masing tuple nilai
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor(Cursor)
+        
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            # Total pemasukan
-            cursor.execute("""
-                SELECT COALESCE(SUM(jumlah), 0) as total 
-                FROM transaksi 
-                WHERE user_id = %s AND tipe = 'Pemasukan'
-            """, (user_id,))
-            pemasukan = cursor.fetchone()['total']
-            
-            # Total pengeluaran (termasuk tabungan)
             cursor.execute("""
-                SELECT COALESCE(SUM(jumlah), 0) as total 
-                FROM transaksi 
-                WHERE user_id = %s AND tipe IN ('Pengeluaran', 'Tabungan')
+                SELECT DATEDIFF(tanggal, '1970-01-01'),
+                       FIELD(tipe, 'Pemasukan', 'Pengeluaran', 'Tabungan'),
+                       kategori,
+                       CAST(jumlah * 100 AS SIGNED)
+                FROM transaksi
+                WHERE user_id = %s
             """, (user_id,))
-            pengeluaran = cursor.fetchone()['total']
-            
+            rows = cursor.fetchall()
+        finally:
             cursor.close()
             conn.close()
+        
+        if not rows:
+            return (), (), (), ()
+        return tuple(zip(*rows))
+    
+    @staticmethod
+    def stream_filtered(user_id, kategori='', tanggal_mulai='', tanggal_akhir='', batch_size=1000):
+        """
+        Baca transaksi terfilter secara streaming dengan server-side cursor
+        (SSDictCursor), urut kronologis. Baris mengalir dari MySQL per batch
+        tanpa pernah dimuat semuanya ke memori.
+        Koneksi baru dipinjam dan query baru dijalankan saat batch pertama
+        diminta, sehingga body response yang tidak pernah dibaca (HEAD,
+        client putus sebelum chunk pertama) tidak menahan koneksi pool.
+        Args:
+            user_id: ID user
+            kategori, tanggal_mulai, tanggal_akhir: filter seperti get_filtered
+            batch_size: jumlah baris per fetchmany
+        Returns: generator list transaksi (per batch)
+        """
+        where, params = Transaksi.build_filter(user_id, kategori, tanggal_mulai, tanggal_akhir)
+        
+        # Koneksi khusus di luar scope request: response streaming
+        # masih membaca setelah scope request selesai
+        conn = get_pool().acquire()
+        finished = False
+        try:
+            cursor = conn.cursor(SSDictCursor)
+            cursor.execute(f"""
+                SELECT id, tanggal, tipe, kategori, jumlah, keterangan, created_at
+                FROM transaksi
+                WHERE {where}
+                ORDER BY tanggal, created_at, id
+            """, params)
+            
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    finished = True
+                    return
+                yield rows
+        finally:
+            if finished:
+                cursor.close()
+                conn.close()
+            else:
+                # Query gagal atau sisa hasil belum dibaca (client putus):
+                # putus koneksinya daripada menguras seluruh hasil dari server
+                conn.discard()
+    
+    @staticmethod
+    def get_summary(user_id):
+        """
+        Dapatkan ringkasan transaksi user
+        Args:
+            user_id: ID user
+        Returns: dict Money pemasukan, pengeluaran, saldo, arus_kas
+        """
+        try:
+            # Dibaca dari agregat user_balances (satu lookup primary key)
+            balance = UserBalance.get(user_id)
+            pemasukan = balance['total_pemasukan']
+            pengeluaran = balance['total_pengeluaran']
             
             return {
-                'pemasukan': float(pemasukan),
-                'pengeluaran': float(pengeluaran),
-                'saldo': float(pemasukan) - float(pengeluaran),
-                'arus_kas': float(pemasukan) - float(pengeluaran)
+                'pemasukan': pemasukan,
+                'pengeluaran': pengeluaran,
+                'saldo': pemasukan - pengeluaran,
+                'arus_kas': pemasukan - pengeluaran
             }
             
         except Exception as e:
             print(f"Error get summary: {e}")
             return {
-                'pemasukan': 0,
-                'pengeluaran': 0,
-                'saldo': 0,
-                'arus_kas': 0
+                'pemasukan': Money(),
+                'pengeluaran': Money(),
+                'saldo': Money(),
+                'arus_kas': Money()
             }
     
     @staticmethod
-    def get_by_kategori(user_id, tipe='Pengeluaran'):
+    def get_dashboard(user_id):
         """
-        Dapatkan transaksi dikelompokkan per kategori
+        Dapatkan ringkasan, pengeluaran per kategori dan saldo tabungan dalam
+        satu query (satu round trip): agregat user_balances dan tabungan
+        di-join dengan rollup rekap_bulanan yang dijumlah per kategori.
         Args:
             user_id: ID user
-            tipe: Pemasukan/Pengeluaran
-        Returns: list dict dengan kategori dan total
+        Returns: dict Money pemasukan, pengeluaran, saldo, arus_kas, tabungan
+                 dan kategori (list dict kategori, total Money)
         """
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
-                SELECT kategori, SUM(jumlah) as total 
-                FROM transaksi 
-                WHERE user_id = %s AND tipe = %s
-                GROUP BY kategori
-            """, (user_id, tipe))
-            
-            hasil = cursor.fetchall()
+                SELECT COALESCE(b.total_pemasukan, 0) AS pemasukan,
+                       COALESCE(b.total_pengeluaran, 0) AS pengeluaran,
+                       COALESCE(t.jumlah, 0) AS tabungan,
+                       r.kategori, r.total
+                FROM users u
+                LEFT JOIN user_balances b ON b.user_id = u.id
+                LEFT JOIN tabungan t ON t.user_id = u.id
+                LEFT JOIN (
+                    SELECT kategori, SUM(total) AS total
+                    FROM rekap_bulanan
+                    WHERE user_id = %s AND tipe = 'Pengeluaran'
+                    GROUP BY kategori
+                ) r ON 1 = 1
+                WHERE u.id = %s
+                ORDER BY r.kategori
+            """, (user_id, user_id))
+            
+            rows = cursor.fetchall()
             
             cursor.close()
             conn.close()
             
-            return hasil
+            pemasukan = Money.of(rows[0]['pemasukan']) if rows else Money()
+            pengeluaran = Money.of(rows[0]['pengeluaran']) if rows else Money()
+            
+            return {
+                'pemasukan': pemasukan,
+                'pengeluaran': pengeluaran,
+                'saldo': pemasukan - pengeluaran,
+                'arus_kas': pemasukan - pengeluaran,
+                'tabungan': Money.of(rows[0]['tabungan']) if rows else Money(),
+                'kategori': [
+                    {'kategori': row['kategori'], 'total': Money.of(row['total'])}
+                    for row in rows if row['kategori'] is not None
+                ]
+            }
+            
+        except Exception as e:
+            print(f"Error get dashboard: {e}")
+            return {
+                'pemasukan': Money(),
+                'pengeluaran': Money(),
+                'saldo': Money(),
+                'arus_kas': Money(),
+                'tabungan': Money(),
+                'kategori': []
+            }
+    
+    @staticmethod
+    def get_by_kategori(user_id, tipe='Pengeluaran'):
+        """
+        Dapatkan transaksi dikelompokkan per kategori
+        Args:
+            user_id: ID user
+            tipe: Pemasukan/Pengeluaran
+        Returns: list dict dengan kategori dan total
+        """
+        try:
+            # Dibaca dari rekap bulanan, bukan GROUP BY atas seluruh riwayat
+            return RekapBulanan.get_by_kategori(user_id, tipe)
             
         except Exception as e:
             print(f"Error get by kategori: {e}")
@@ -212,12 +728,25 @@ class Transaksi:
             conn = get_db_connection()
             cursor = conn.cursor()
             
+            change_seq = User.bump_data_version(cursor, user_id)
+            
             cursor.execute("DELETE FROM transaksi WHERE user_id = %s", (user_id,))
+            UserBalance.reset(cursor, user_id)
+            RekapBulanan.reset(cursor, user_id)
+            
+            # Satu tombstone "semua transaksi" menggantikan tombstone lama:
+            # klien dengan token sebelum ini harus sinkron ulang dari awal
+            cursor.execute("DELETE FROM transaksi_hapus WHERE user_id = %s", (user_id,))
+            cursor.execute("""
+                INSERT INTO transaksi_hapus (user_id, transaksi_id, change_seq)
+                VALUES (%s, NULL, %s)
+            """, (user_id, change_seq))
             
             conn.commit()
             cursor.close()
             conn.close()
             
+            invalidate_user(user_id)
             return True
             
         except Exception as e:
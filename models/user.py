@@ -1,8 +1,29 @@
 """
 USER MODEL
 """
-from models.database import get_db_connection
-from werkzeug.security import generate_password_hash, check_password_hash
+import pymysql
+from models.database import get_db_connection, get_pool
+from utils.cache import cache, invalidate_user
+from utils.passwords import hash_password, check_password, needs_rehash
+
+# Kode error MySQL untuk pelanggaran UNIQUE
+ER_DUP_ENTRY = 1062
+
+class DuplicateUserError(Exception):
+    """Username atau email sudah terdaftar"""
+    
+    def __init__(self, field):
+        super().__init__(f"{field} sudah terdaftar")
+        self.field = field  # 'username' atau 'email'
+
+def _duplicate_key(message):
+    """
+    Nama kolom UNIQUE dari pesan duplicate entry, misalnya
+    "Duplicate entry 'budi' for key 'username'" (MariaDB) atau
+    "... for key 'users.username'" (MySQL 8) -> 'username'
+    """
+    key = message.rsplit("for key '", 1)[-1].rstrip("'")
+    return key.rsplit('.', 1)[-1]
 
 class User:
     """Model untuk user/pengguna"""
@@ -10,25 +31,36 @@ class User:
     @staticmethod
     def create(username, email, password):
         """
-        Buat user baru
+        Buat user baru beserta record tabungannya dalam satu transaksi.
+        Keunikan username/email dijamin constraint UNIQUE tabel users,
+        sehingga tidak perlu query cek lebih dulu dan dua pendaftaran
+        bersamaan dengan username/email sama tetap hanya satu yang berhasil.
         Args:
             username: username
             email: email
             password: password (plain text, akan di-hash)
         Returns: user_id atau None jika gagal
+        Raises: DuplicateUserError jika username atau email sudah terdaftar
         """
+        # Hash sebelum meminjam koneksi agar koneksi tidak tertahan selama hashing
+        hashed_password = hash_password(password)
+        
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
             
-            # Hash password
-            hashed_password = generate_password_hash(password)
-            
-            # Insert user
-            cursor.execute("""
-                INSERT INTO users (username, email, password) 
-                VALUES (%s, %s, %s)
-            """, (username, email, hashed_password))
+            try:
+                cursor.execute("""
+                    INSERT INTO users (username, email, password) 
+                    VALUES (%s, %s, %s)
+                """, (username, email, hashed_password))
+            except pymysql.err.IntegrityError as e:
+                conn.rollback()
+                cursor.close()
+                conn.close()
+                if e.args[0] == ER_DUP_ENTRY:
+                    raise DuplicateUserError(_duplicate_key(e.args[1]))
+                raise
             
             user_id = cursor.lastrowid
             
@@ -44,6 +76,8 @@ class User:
             
             return user_id
             
+        except DuplicateUserError:
+            raise
         except Exception as e:
             print(f"Error create user: {e}")
             return None
@@ -51,11 +85,18 @@ class User:
     @staticmethod
     def get_by_id(user_id):
         """
-        Dapatkan user berdasarkan ID
+        Dapatkan user berdasarkan ID (lewat cache per user).
+        Hash password tidak ikut (cache bisa dipakai bersama lewat Redis);
+        untuk verifikasi password pakai get_credentials.
         Args:
             user_id: ID user
-        Returns: dict user data atau None
+        Returns: dict user data tanpa password atau None
         """
+        return cache.get(user_id, 'user', lambda: User._load_by_id(user_id))
+    
+    @staticmethod
+    def _load_by_id(user_id):
+        """Baca user dari database, tanpa kolom password"""
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
@@ -66,6 +107,8 @@ class User:
             cursor.close()
             conn.close()
             
+            if user:
+                user.pop('password', None)
             return user
             
         except Exception as e:
@@ -73,26 +116,88 @@ class User:
             return None
     
     @staticmethod
-    def get_by_username_or_email(username_or_email):
+    def get_credentials(user_id):
         """
-        Dapatkan user berdasarkan username atau email
+        Baca hash password user langsung dari database (tidak pernah di-cache).
+        Koneksi dikembalikan ke pool sebelum password diverifikasi.
         Args:
-            username_or_email: username atau email
-        Returns: dict user data atau None
+            user_id: ID user
+        Returns: dict id, password atau None
         """
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
+            # Di luar scope request, seperti get_by_username_or_email
+            with get_pool().acquire() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT id, password FROM users WHERE id = %s", (user_id,))
+                user = cursor.fetchone()
+                cursor.close()
             
-            cursor.execute("""
-                SELECT * FROM users 
-                WHERE username = %s OR email = %s
-            """, (username_or_email, username_or_email))
-            
-            user = cursor.fetchone()
+            return user
             
+        except Exception as e:
+            print(f"Error get credentials: {e}")
+            return None
+    
+    @staticmethod
+    def bump_data_version(cursor, user_id):
+        """
+        Naikkan versi data user. Dipanggil dengan cursor yang sama dengan
+        penulisan data agar versi ikut commit/rollback bersama perubahan.
+        Row users terkunci sampai commit, sehingga versi per user naik
+        sesuai urutan commit dan bisa dipakai sebagai change sequence.
+        Args:
+            cursor: cursor aktif
+            user_id: ID user
+        Returns: int versi baru
+        """
+        # LAST_INSERT_ID(expr) mengembalikan versi baru lewat lastrowid
+        # tanpa SELECT tambahan
+        cursor.execute("""
+            UPDATE users SET data_version = LAST_INSERT_ID(data_version + 1) WHERE id = %s
+        """, (user_id,))
+        return cursor.lastrowid
+    
+    @staticmethod
+    def get_data_version(user_id):
+        """
+        Dapatkan versi data user (primary key lookup)
+        Args:
+            user_id: ID user
+        Returns: int versi data
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute("SELECT data_version FROM users WHERE id = %s", (user_id,))
+            result = cursor.fetchone()
+        finally:
             cursor.close()
             conn.close()
+        
+        return int(result['data_version']) if result else 0
+    
+    @staticmethod
+    def get_by_username_or_email(username_or_email):
+        """
+        Dapatkan user berdasarkan username atau email
+        Args:
+            username_or_email: username atau email
+        Returns: dict user data atau None
+        """
+        try:
+            # Koneksi di luar scope request yang langsung kembali ke pool:
+            # verifikasi password sesudahnya bisa antre di pool hashing dan
+            # tidak boleh menahan koneksi database selama itu
+            with get_pool().acquire() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT * FROM users 
+                    WHERE username = %s OR email = %s
+                """, (username_or_email, username_or_email))
+                
+                user = cursor.fetchone()
+                cursor.close()
             
             return user
             
@@ -103,15 +208,57 @@ class User:
     @staticmethod
     def verify_password(user, password):
         """
-        Verifikasi password user
+        Verifikasi password user.
+        Jika cocok tetapi hash dibuat dengan method/cost lama, hash
+        diperbarui ke Config.PASSWORD_HASH_METHOD (password plain text
+        hanya tersedia saat login, jadi ini satu-satunya kesempatan).
         Args:
-            user: dict user data
+            user: dict user berisi id dan password (get_by_username_or_email atau get_credentials)
             password: password plain text
         Returns: Boolean
         """
         if not user:
             return False
-        return check_password_hash(user['password'], password)
+        if not check_password(user['password'], password):
+            return False
+        
+        if needs_rehash(user['password']):
+            User.rehash_password(user['id'], user['password'], password)
+        return True
+    
+    @staticmethod
+    def rehash_password(user_id, old_hash, password):
+        """
+        Simpan hash baru untuk password yang sama
+        Args:
+            user_id: ID user
+            old_hash: hash yang baru saja diverifikasi
+            password: password plain text
+        Returns: Boolean
+        """
+        # Hash sebelum meminjam koneksi agar koneksi tidak tertahan selama hashing
+        new_hash = hash_password(password)
+        
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
+            # Syarat password = old_hash: jangan menimpa password yang
+            # diganti request lain sejak hash lama dibaca
+            cursor.execute("""
+                UPDATE users SET password = %s WHERE id = %s AND password = %s
+            """, (new_hash, user_id, old_hash))
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            invalidate_user(user_id)
+            return True
+            
+        except Exception as e:
+            print(f"Error rehash password: {e}")
+            return False
     
     @staticmethod
     def update_profile(user_id, data):
@@ -142,11 +289,13 @@ class User:
                 data.get('alamat'),
                 user_id
             ))
+            User.bump_data_version(cursor, user_id)
             
             conn.commit()
             cursor.close()
             conn.close()
             
+            invalidate_user(user_id)
             return True
             
         except Exception as e:
@@ -165,23 +314,25 @@ class User:
         """
         try:
             # Verifikasi password saat ini
-            user = User.get_by_id(user_id)
+            user = User.get_credentials(user_id)
             if not user or not User.verify_password(user, current_password):
                 return False, "Password saat ini salah!"
             
-            # Update password
+            # Update password (hash sebelum meminjam koneksi)
+            new_password_hash = hash_password(new_password)
             conn = get_db_connection()
             cursor = conn.cursor()
             
-            new_password_hash = generate_password_hash(new_password)
             cursor.execute("""
                 UPDATE users SET password = %s WHERE id = %s
             """, (new_password_hash, user_id))
+            User.bump_data_version(cursor, user_id)
             
             conn.commit()
             cursor.close()
             conn.close()
             
+            invalidate_user(user_id)
             return True, "Password berhasil diubah!"
             
         except Exception as e:
@@ -204,11 +355,13 @@ class User:
             cursor.execute("""
                 UPDATE users SET foto_profil = %s WHERE id = %s
             """, (photo_url, user_id))
+            User.bump_data_version(cursor, user_id)
             
             conn.commit()
             cursor.close()
             conn.close()
             
+            invalidate_user(user_id)
             return True
             
         except Exception as e:
@@ -216,49 +369,21 @@ class User:
             return False
     
     @staticmethod
-    def check_username_exists(username):
-        """
-        Cek apakah username sudah digunakan
-        Args:
-            username: username
-        Returns: Boolean
-        """
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT id FROM users WHERE username = %s", (username,))
-            exists = cursor.fetchone() is not None
-            
-            cursor.close()
-            conn.close()
-            
-            return exists
-            
-        except Exception as e:
-            print(f"Error check username: {e}")
-            return False
-    
-    @staticmethod
-    def check_email_exists(email):
+    def get_id_range():
         """
-        Cek apakah email sudah digunakan
-        Args:
-            email: email
-        Returns: Boolean
+        Dapatkan rentang ID user (untuk membagi job per shard)
+        Returns: tuple (id terkecil, id terbesar) atau None jika belum ada user
         """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT id FROM users WHERE email = %s", (email,))
-            exists = cursor.fetchone() is not None
-            
+            cursor.execute("SELECT MIN(id) AS awal, MAX(id) AS akhir FROM users")
+            result = cursor.fetchone()
+        finally:
             cursor.close()
             conn.close()
-            
-            return exists
-            
-        except Exception as e:
-            print(f"Error check email: {e}")
-            return False
\ No newline at end of file
+        
+        if not result or result['awal'] is None:
+            return None
+        return int(result['awal']), int(result['akhir'])
@@ -0,0 +1,178 @@
+"""
+USER BALANCE MODEL
+Agregat saldo per user yang diperbarui setiap kali transaksi ditulis,
+sehingga ringkasan cukup dibaca dari satu baris (primary key lookup).
+"""
+from models.database import get_db_connection
+from utils.money import Money
+
+# Tipe transaksi yang dihitung sebagai pengeluaran (mengurangi saldo)
+TIPE_PENGELUARAN = ('Pengeluaran', 'Tabungan')
+
+class UserBalance:
+    """Model untuk tabel agregat user_balances"""
+    
+    @staticmethod
+    def delta(tipe, jumlah):
+        """
+        Hitung perubahan total untuk satu transaksi
+        Args:
+            tipe: tipe transaksi
+            jumlah: Money
+        Returns: tuple Money (pemasukan, pengeluaran)
+        """
+        if tipe == 'Pemasukan':
+            return jumlah, Money()
+        if tipe in TIPE_PENGELUARAN:
+            return Money(), jumlah
+        return Money(), Money()
+    
+    @staticmethod
+    def apply(cursor, user_id, pemasukan, pengeluaran, jumlah_transaksi, last_transaction_id):
+        """
+        Tambahkan perubahan ke agregat user.
+        Dipanggil dengan cursor yang sama dengan INSERT transaksi agar
+        agregat ikut commit/rollback bersama ledger.
+        Args:
+            cursor: cursor aktif
+            user_id: ID user
+            pemasukan: tambahan total pemasukan (Money)
+            pengeluaran: tambahan total pengeluaran (Money)
+            jumlah_transaksi: tambahan jumlah baris
+            last_transaction_id: ID transaksi terakhir yang ditulis
+        """
+        cursor.execute("""
+            INSERT INTO user_balances
+                (user_id, total_pemasukan, total_pengeluaran, jumlah_transaksi, last_transaction_id)
+            VALUES (%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                total_pemasukan = total_pemasukan + VALUES(total_pemasukan),
+                total_pengeluaran = total_pengeluaran + VALUES(total_pengeluaran),
+                jumlah_transaksi = jumlah_transaksi + VALUES(jumlah_transaksi),
+                last_transaction_id = GREATEST(COALESCE(last_transaction_id, 0), VALUES(last_transaction_id))
+        """, (user_id, pemasukan.to_decimal(), pengeluaran.to_decimal(), jumlah_transaksi, last_transaction_id))
+    
+    @staticmethod
+    def reset(cursor, user_id):
+        """
+        Kosongkan agregat user (setelah semua transaksinya dihapus)
+        Args:
+            cursor: cursor aktif
+            user_id: ID user
+        """
+        cursor.execute("""
+            UPDATE user_balances
+            SET total_pemasukan = 0, total_pengeluaran = 0,
+                jumlah_transaksi = 0, last_transaction_id = NULL
+            WHERE user_id = %s
+        """, (user_id,))
+    
+    @staticmethod
+    def get(user_id):
+        """
+        Dapatkan agregat saldo user
+        Args:
+            user_id: ID user
+        Returns: dict total_pemasukan, total_pengeluaran (Money), jumlah_transaksi, last_transaction_id
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute("""
+                SELECT total_pemasukan, total_pengeluaran, jumlah_transaksi, last_transaction_id
+                FROM user_balances
+                WHERE user_id = %s
+            """, (user_id,))
+            
+            result = cursor.fetchone()
+        finally:
+            cursor.close()
+            conn.close()
+        
+        if not result:
+            return {
+                'total_pemasukan': Money(),
+                'total_pengeluaran': Money(),
+                'jumlah_transaksi': 0,
+                'last_transaction_id': None
+            }
+        
+        result['total_pemasukan'] = Money.of(result['total_pemasukan'])
+        result['total_pengeluaran'] = Money.of(result['total_pengeluaran'])
+        return result
+    
+    @staticmethod
+    def rebuild(user_id=None):
+        """
+        Hitung ulang agregat dari ledger transaksi
+        Args:
+            user_id: ID user (None = semua user)
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            where = "WHERE u.id = %s" if user_id is not None else ""
+            params = (user_id,) if user_id is not None else ()
+            
+            cursor.execute(f"""
+                REPLACE INTO user_balances
+                    (user_id, total_pemasukan, total_pengeluaran, jumlah_transaksi, last_transaction_id)
+                SELECT u.id,
+                       COALESCE(SUM(CASE WHEN t.tipe = 'Pemasukan' THEN t.jumlah END), 0),
+                       COALESCE(SUM(CASE WHEN t.tipe IN ('Pengeluaran', 'Tabungan') THEN t.jumlah END), 0),
+                       COUNT(t.id),
+                       MAX(t.id)
+                FROM users u
+                LEFT JOIN transaksi t ON t.user_id = u.id
+                {where}
+                GROUP BY u.id
+            """, params)
+            
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def verify(user_id=None):
+        """
+        Bandingkan agregat tersimpan dengan hasil hitung ulang dari ledger
+        Args:
+            user_id: ID user (None = semua user)
+        Returns: list dict user yang agregatnya tidak cocok
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        try:
+            where = "WHERE u.id = %s" if user_id is not None else ""
+            params = (user_id,) if user_id is not None else ()
+            
+            cursor.execute(f"""
+                SELECT l.user_id,
+                       l.total_pemasukan, b.total_pemasukan AS tersimpan_pemasukan,
+                       l.total_pengeluaran, b.total_pengeluaran AS tersimpan_pengeluaran,
+                       l.jumlah_transaksi, b.jumlah_transaksi AS tersimpan_jumlah_transaksi
+                FROM (
+                    SELECT u.id AS user_id,
+                           COALESCE(SUM(CASE WHEN t.tipe = 'Pemasukan' THEN t.jumlah END), 0) AS total_pemasukan,
+                           COALESCE(SUM(CASE WHEN t.tipe IN ('Pengeluaran', 'Tabungan') THEN t.jumlah END), 0) AS total_pengeluaran,
+                           COUNT(t.id) AS jumlah_transaksi
+                    FROM users u
+                    LEFT JOIN transaksi t ON t.user_id = u.id
+                    {where}
+                    GROUP BY u.id
+                ) l
+                LEFT JOIN user_balances b ON b.user_id = l.user_id
+                WHERE b.user_id IS NULL
+                   OR l.total_pemasukan <> b.total_pemasukan
+                   OR l.total_pengeluaran <> b.total_pengeluaran
+                   OR l.jumlah_transaksi <> b.jumlah_transaksi
+            """, params)
+            
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
@@ -1,19 +1,41 @@
 """
 API ROUTES
 """
-from flask import Blueprint, request, jsonify, session, send_file
-from utils.decorators import login_required, save_uploaded_file
+import json
+from datetime import date
+from flask import Blueprint, Response, request, jsonify, session, send_file
+from utils.decorators import login_required, conditional_get, save_uploaded_file
 from controllers.dashboard_controller import DashboardController
+from controllers.analytics_controller import AnalyticsController
 from controllers.transaksi_controller import TransaksiController
 from controllers.profil_controller import ProfilController
+from controllers.import_controller import ImportController
 from models.tabungan import Tabungan
-from models.transaksi import Transaksi
+from models.database import get_pool_stats, begin_request_scope, commit_request_scope, end_request_scope
+from utils.cache import cache
+from utils.events import hub
+from utils.money import Money
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# Satu koneksi & satu transaksi untuk semua pemanggilan model per request
+api_bp.before_request(begin_request_scope)
+api_bp.after_request(commit_request_scope)
+api_bp.teardown_request(end_request_scope)
+
 # ===== DASHBOARD APIS =====
+@api_bp.route('/dashboard', methods=['GET'])
+@login_required
+@conditional_get
+def get_dashboard():
+    """API untuk semua data dashboard (summary, kategori, tabungan, health score)"""
+    user_id = session.get('user_id')
+    data = DashboardController.get_dashboard_data(user_id)
+    return jsonify(data)
+
 @api_bp.route('/summary', methods=['GET'])
 @login_required
+@conditional_get
 def get_summary():
     """API untuk mendapatkan summary data"""
     user_id = session.get('user_id')
@@ -22,12 +44,60 @@ def get_summary():
 
 @api_bp.route('/chart-data', methods=['GET'])
 @login_required
+@conditional_get
 def get_chart_data():
     """API untuk mendapatkan data chart"""
     user_id = session.get('user_id')
     data = DashboardController.get_chart_data(user_id)
     return jsonify(data)
 
+@api_bp.route('/events', methods=['GET'])
+@login_required
+def dashboard_events():
+    """API Server-Sent Events: push perubahan ringkasan ke semua tab user"""
+    user_id = session.get('user_id')
+    result = DashboardController.stream_summary(user_id)
+    
+    if result is None:
+        return jsonify({'error': 'Terlalu banyak koneksi, coba lagi nanti'}), 503
+    
+    stream, release = result
+    response = Response(stream, mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    # Slot koneksi tetap dilepas walau body tidak pernah dibaca
+    # (HEAD, klien putus sebelum chunk pertama)
+    response.call_on_close(release)
+    return response
+
+@api_bp.route('/trend', methods=['GET'])
+@login_required
+@conditional_get
+def get_trend():
+    """API untuk mendapatkan tren bulanan (dari rekap bulanan)"""
+    user_id = session.get('user_id')
+    
+    bulan_mulai = request.args.get('bulan_mulai', '')
+    bulan_akhir = request.args.get('bulan_akhir', '')
+    kategori = request.args.get('kategori', '')
+    
+    try:
+        data = DashboardController.get_trend_data(user_id, bulan_mulai, bulan_akhir, kategori)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify(data)
+
+@api_bp.route('/analytics', methods=['GET'])
+@login_required
+@conditional_get
+def get_analytics():
+    """API untuk analitik ledger (arus kas bulanan, rata-rata bergulir, porsi kategori, rasio tabungan)"""
+    user_id = session.get('user_id')
+    data = AnalyticsController.get_analytics(user_id)
+    return jsonify(data)
+
 # ===== TRANSAKSI APIS =====
 @api_bp.route('/transaksi', methods=['POST'])
 @login_required
@@ -39,16 +109,81 @@ def tambah_transaksi():
     success, message = TransaksiController.tambah_transaksi(user_id, data)
     return jsonify({'success': success, 'message': message})
 
+@api_bp.route('/transaksi/batch', methods=['POST'])
+@login_required
+def tambah_transaksi_batch():
+    """API untuk menambah banyak transaksi sekaligus"""
+    user_id = session.get('user_id')
+    data = request.json
+    
+    # Terima array langsung atau {"transaksi": [...]}
+    items = data.get('transaksi') if isinstance(data, dict) else data
+    
+    success, message, results = TransaksiController.tambah_batch(user_id, items)
+    return jsonify({'success': success, 'message': message, 'results': results})
+
+@api_bp.route('/transaksi/import', methods=['POST'])
+@login_required
+def import_transaksi():
+    """API untuk import transaksi dari file CSV (dibaca streaming per baris)"""
+    user_id = session.get('user_id')
+    
+    if 'file' not in request.files or request.files['file'].filename == '':
+        return jsonify({'success': False, 'message': 'Tidak ada file yang diupload'})
+    
+    try:
+        mapping = json.loads(request.form.get('mapping') or '{}')
+    except ValueError:
+        return jsonify({'success': False, 'message': '❌ Format mapping kolom tidak valid'})
+    
+    result = ImportController.import_csv(
+        user_id,
+        request.files['file'].stream,
+        mapping=mapping,
+        format_tanggal=request.form.get('format_tanggal') or '%Y-%m-%d',
+        pemisah=request.form.get('pemisah') or ',',
+        desimal_koma=request.form.get('desimal_koma') in ('1', 'true', 'on'),
+        encoding=request.form.get('encoding') or 'utf-8-sig'
+    )
+    return jsonify(result)
+
 @api_bp.route('/riwayat', methods=['GET'])
 @login_required
+@conditional_get
 def get_riwayat():
-    """API untuk mendapatkan riwayat transaksi"""
+    """API untuk mendapatkan riwayat transaksi (per halaman, ?cursor=&limit=&format=columnar)"""
     user_id = session.get('user_id')
-    riwayat = TransaksiController.get_riwayat(user_id)
+    
+    cursor = request.args.get('cursor', '')
+    limit = request.args.get('limit')
+    fmt = request.args.get('format', '')
+    
+    try:
+        riwayat = TransaksiController.get_riwayat(user_id, cursor, limit, fmt)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     return jsonify(riwayat)
 
+@api_bp.route('/riwayat/changes', methods=['GET'])
+@login_required
+@conditional_get
+def get_riwayat_changes():
+    """API delta sync riwayat: transaksi baru/terhapus sejak ?since=<token>"""
+    user_id = session.get('user_id')
+    
+    try:
+        changes = TransaksiController.get_riwayat_changes(
+            user_id, request.args.get('since', ''), request.args.get('limit')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify(changes)
+
 @api_bp.route('/buku-besar', methods=['GET'])
 @login_required
+@conditional_get
 def get_buku_besar():
     """API untuk mendapatkan buku besar"""
     user_id = session.get('user_id')
@@ -64,13 +199,39 @@ def get_buku_besar():
     
     return jsonify(data)
 
+@api_bp.route('/export', methods=['GET'])
+@login_required
+def export_transaksi():
+    """API untuk export transaksi (CSV / JSON Lines) secara streaming"""
+    user_id = session.get('user_id')
+    fmt = request.args.get('format', 'csv')
+    
+    try:
+        content = TransaksiController.export(
+            user_id,
+            fmt,
+            request.args.get('kategori', ''),
+            request.args.get('tanggal_mulai', ''),
+            request.args.get('tanggal_akhir', '')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    mimetype = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+    filename = f"transaksi_{date.today():%Y%m%d}.{fmt}"
+    
+    return Response(content, mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename={filename}'
+    })
+
 # ===== TABUNGAN APIS =====
 @api_bp.route('/tabungan', methods=['GET'])
 @login_required
+@conditional_get
 def get_tabungan():
     """API untuk mendapatkan saldo tabungan"""
     user_id = session.get('user_id')
-    jumlah = Tabungan.get_by_user(user_id)
+    jumlah = DashboardController.get_tabungan(user_id)
     return jsonify({'jumlah': jumlah})
 
 @api_bp.route('/tabungan/kelola', methods=['POST'])
@@ -81,32 +242,19 @@ def kelola_tabungan():
     data = request.json
     
     aksi = data.get('aksi')
-    jumlah = float(data.get('jumlah'))
+    try:
+        jumlah = Money.of(data.get('jumlah'))
+    except ValueError:
+        return jsonify({'success': False, 'message': '❌ Jumlah harus berupa angka'})
     
-    # Cek saldo tersedia
-    summary = Transaksi.get_summary(user_id)
-    saldo_tersedia = summary['saldo']
+    if jumlah <= Money():
+        return jsonify({'success': False, 'message': '❌ Jumlah harus lebih dari 0'})
     
+    # Cek saldo, ubah tabungan dan catat transaksi dilakukan atomik di model
     if aksi == 'tambah':
-        # Cek apakah saldo tersedia cukup
-        if jumlah > saldo_tersedia:
-            return jsonify({
-                'success': False, 
-                'message': f'❌ Saldo tersedia tidak cukup! Anda hanya punya Rp {saldo_tersedia:,.0f}'
-            })
-        
-        # Tambah ke tabungan
-        Tabungan.tambah(user_id, jumlah)
-        
-        # Catat sebagai transaksi Tabungan (kredit)
-        Transaksi.create(
-            user_id=user_id,
-            tanggal='CURDATE()',
-            tipe='Tabungan',
-            kategori='Tabungan',
-            jumlah=jumlah,
-            keterangan='Menabung'
-        )
+        success, message = Tabungan.tambah(user_id, jumlah)
+        if not success:
+            return jsonify({'success': False, 'message': f'❌ {message}'})
         
         return jsonify({
             'success': True,
@@ -115,20 +263,9 @@ def kelola_tabungan():
     
     else:  # ambil
         success, message = Tabungan.kurang(user_id, jumlah)
-        
         if not success:
             return jsonify({'success': False, 'message': f'❌ {message}'})
         
-        # Catat sebagai transaksi Pemasukan (debit)
-        Transaksi.create(
-            user_id=user_id,
-            tanggal='CURDATE()',
-            tipe='Pemasukan',
-            kategori='Tabungan',
-            jumlah=jumlah,
-            keterangan='Ambil dari tabungan'
-        )
-        
         return jsonify({
             'success': True,
             'message': f'✅ Berhasil mengambil Rp {jumlah:,.0f} dari tabungan!'
@@ -203,3 +340,22 @@ def reset_data():
     
     success, message = ProfilController.reset_data(user_id, password)
     return jsonify({'success': success, 'message': message})
+
+# ===== MONITORING APIS =====
+@api_bp.route('/pool-stats', methods=['GET'])
+@login_required
+def pool_stats():
+    """API untuk statistik pool koneksi database"""
+    return jsonify(get_pool_stats())
+
+@api_bp.route('/cache-stats', methods=['GET'])
+@login_required
+def cache_stats():
+    """API untuk statistik cache ringkasan (hit/miss/eviction)"""
+    return jsonify(cache.stats())
+
+@api_bp.route('/events-stats', methods=['GET'])
+@login_required
+def events_stats():
+    """API untuk statistik koneksi SSE"""
+    return jsonify(hub.stats())
@@ -0,0 +1,39 @@
+"""
+ASSET ROUTES
+File CSS/JS hasil build (nama ber-hash) dengan Cache-Control jangka panjang
+dan varian gzip/brotli yang sudah dikompresi saat build.
+"""
+import mimetypes
+import os
+from flask import Blueprint, abort, request, send_from_directory
+from config import Config
+from utils.assets import asset_url, find_variant
+
+assets_bp = Blueprint('assets', __name__, url_prefix='/assets')
+
+@assets_bp.app_context_processor
+def inject_asset_url():
+    """Sediakan asset_url() di semua template"""
+    return {'asset_url': asset_url}
+
+@assets_bp.route('/<path:filename>', methods=['GET'])
+def serve(filename):
+    """Kirim asset hasil build, memakai varian .br/.gz jika browser mendukung"""
+    if filename == 'manifest.json':
+        abort(404)
+    
+    sent, encoding = find_variant(filename, request.accept_encodings)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    
+    response = send_from_directory(
+        os.path.abspath(Config.ASSET_DIST_DIR), sent,
+        mimetype=mimetype, max_age=Config.ASSET_MAX_AGE
+    )
+    
+    # Isi file tidak pernah berubah untuk nama yang sama (nama = hash isi)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    response.vary.add('Accept-Encoding')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    return response
@@ -3,9 +3,15 @@ AUTHENTICATION ROUTES
 """
 from flask import Blueprint, render_template, request, redirect, url_for, session
 from controllers.auth_controller import AuthController
+from models.database import begin_request_scope, commit_request_scope, end_request_scope
 
 auth_bp = Blueprint('auth', __name__)
 
+# Satu koneksi & satu transaksi untuk semua pemanggilan model per request
+auth_bp.before_request(begin_request_scope)
+auth_bp.after_request(commit_request_scope)
+auth_bp.teardown_request(end_request_scope)
+
 @auth_bp.route('/login', methods=['GET', 'POST'])
 def login():
     """Route untuk login"""
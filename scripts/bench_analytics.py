@@ -0,0 +1,179 @@
+"""
+BENCHMARK ANALITIK
+Bandingkan AnalyticsController (array NumPy) dengan perhitungan yang sama
+memakai loop Python per baris, pada ledger sintetis. Hasil kedua cara juga
+dicocokkan agar benchmark tidak membandingkan dua hal yang berbeda.
+Tidak membutuhkan database.
+
+CARA PAKAI:
+    python -m scripts.bench_analytics [--baris 500000] [--ulang 3]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from config import Config
+from controllers.analytics_controller import AnalyticsController, EPOCH
+
+KATEGORI = {
+    1: Config.KATEGORI_PEMASUKAN + ['Tabungan'],
+    2: Config.KATEGORI_PENGELUARAN,
+    3: ['Tabungan']
+}
+
+def synthetic_rows(jumlah, today, seed=42):
+    """
+    Ledger sintetis 3 tahun dengan bentuk baris Transaksi.get_ledger_columns
+    Returns: list tuple (hari, tipe, kategori, sen)
+    """
+    rng = random.Random(seed)
+    today_hari = (today - EPOCH).days
+    rows = []
+    for _ in range(jumlah):
+        tipe = rng.choices((1, 2, 3), weights=(2, 7, 1))[0]
+        rows.append((
+            today_hari - rng.randrange(3 * 365),
+            tipe,
+            rng.choice(KATEGORI[tipe]),
+            rng.randrange(1000, 5000000) * 100 + rng.choice((0, 50))
+        ))
+    return rows
+
+def compute_python(rows, today):
+    """Metrik yang sama dengan AnalyticsController.compute, satu baris per iterasi"""
+    today_hari = (today - EPOCH).days
+    windows = Config.ANALYTICS_ROLLING_WINDOWS
+    jumlah_hari = Config.ANALYTICS_SERIES_HARI
+    span = jumlah_hari + max(windows) - 1
+    first = today_hari - span + 1
+    
+    bulanan = {}  # bulan -> [pemasukan, pengeluaran, tabungan, pendapatan]
+    harian = {'pengeluaran': [0] * span, 'arus_kas': [0] * span}
+    kategori = {}
+    total_pendapatan = 0
+    total_pengeluaran = 0
+    
+    for hari, tipe, nama_kategori, sen in rows:
+        tanggal = EPOCH + timedelta(days=hari)
+        totals = bulanan.setdefault(tanggal.year * 12 + tanggal.month - 1, [0, 0, 0, 0])
+        kategori.setdefault(nama_kategori, 0)
+        
+        if tipe == 1:
+            totals[0] += sen
+            arus = sen
+            if nama_kategori != 'Tabungan':
+                totals[3] += sen
+                total_pendapatan += sen
+        elif tipe == 2:
+            totals[1] += sen
+            arus = -sen
+            kategori[nama_kategori] += sen
+            total_pengeluaran += sen
+        elif tipe == 3:
+            totals[2] += sen
+            arus = -sen
+        else:
+            arus = 0
+        
+        if first <= hari <= today_hari:
+            harian['arus_kas'][hari - first] += arus
+            if tipe == 2:
+                harian['pengeluaran'][hari - first] += sen
+    
+    bulan_ini = today.year * 12 + today.month - 1
+    mulai = min(min(bulanan, default=bulan_ini), bulan_ini)
+    akhir = max(max(bulanan, default=bulan_ini), bulan_ini)
+    
+    result_bulanan = {key: [] for key in ('labels', 'pemasukan', 'pengeluaran', 'tabungan', 'arus_kas', 'rasio_tabungan')}
+    for bulan in range(mulai, akhir + 1):
+        pemasukan, pengeluaran, tabungan, pendapatan = bulanan.get(bulan, [0, 0, 0, 0])
+        result_bulanan['labels'].append(f"{bulan // 12:04d}-{bulan % 12 + 1:02d}")
+        result_bulanan['pemasukan'].append(pemasukan / 100)
+        result_bulanan['pengeluaran'].append(pengeluaran / 100)
+        result_bulanan['tabungan'].append(tabungan / 100)
+        result_bulanan['arus_kas'].append((pemasukan - pengeluaran - tabungan) / 100)
+        result_bulanan['rasio_tabungan'].append(
+            round((pendapatan - pengeluaran) / pendapatan, 4) if pendapatan > 0 else None
+        )
+    
+    result_rolling = {
+        'labels': [(EPOCH + timedelta(days=h)).isoformat() for h in range(today_hari - jumlah_hari + 1, today_hari + 1)]
+    }
+    for key in ('pengeluaran', 'arus_kas'):
+        for window in windows:
+            series = []
+            for end in range(span - jumlah_hari, span):
+                series.append(round(sum(harian[key][end - window + 1:end + 1]) / window / 100, 2))
+            result_rolling[f"{key}_{window}"] = series
+    
+    keseluruhan = sum(kategori.values())
+    result_kategori = [
+        {'kategori': nama, 'total': total / 100, 'porsi': round(total / keseluruhan, 4)}
+        for nama, total in sorted(kategori.items(), key=lambda item: (-item[1], item[0]))
+        if total > 0
+    ]
+    
+    return {
+        'bulanan': result_bulanan,
+        'rolling': result_rolling,
+        'kategori': result_kategori,
+        'rasio_tabungan': (
+            round((total_pendapatan - total_pengeluaran) / total_pendapatan, 4) if total_pendapatan > 0 else None
+        ),
+        'jumlah_transaksi': len(rows)
+    }
+
+def compute_vectorized(columns, today):
+    """Jalur produksi: kolom hasil get_ledger_columns -> array -> metrik"""
+    return AnalyticsController.compute(AnalyticsController.to_arrays(*columns), today)
+
+def same_result(a, b):
+    """
+    Cocokkan hasil; rata-rata bergulir boleh beda 1 sen karena pembulatan
+    (prefix sum float vs jumlah integer)
+    """
+    rolling_a = a.pop('rolling')
+    rolling_b = b.pop('rolling')
+    if a != b or rolling_a.keys() != rolling_b.keys() or rolling_a['labels'] != rolling_b['labels']:
+        return False
+    return all(
+        abs(x - y) <= 0.011
+        for key in rolling_a if key != 'labels'
+        for x, y in zip(rolling_a[key], rolling_b[key])
+    )
+
+def measure(fn, ulang):
+    """Waktu terbaik dari beberapa kali jalan, dalam milidetik"""
+    best = None
+    for _ in range(ulang):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark analitik vektor vs loop Python")
+    parser.add_argument('--baris', type=int, default=500000)
+    parser.add_argument('--ulang', type=int, default=3)
+    args = parser.parse_args()
+    
+    today = date.today()
+    print(f"🧪 Membuat ledger sintetis {args.baris} baris...")
+    rows = synthetic_rows(args.baris, today)
+    columns = tuple(zip(*rows))
+    
+    python_ms, python_result = measure(lambda: compute_python(rows, today), args.ulang)
+    numpy_ms, numpy_result = measure(lambda: compute_vectorized(columns, today), args.ulang)
+    
+    print(f"🐍 Loop Python per baris : {python_ms:9.1f} ms")
+    print(f"🔢 NumPy vektor          : {numpy_ms:9.1f} ms ({python_ms / numpy_ms:.1f}x lebih cepat)")
+    
+    if not same_result(python_result, numpy_result):
+        print("❌ Hasil kedua cara berbeda!")
+        sys.exit(1)
+    print("✅ Hasil kedua cara sama")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+BENCHMARK HASH PASSWORD
+Simulasikan lonjakan login: banyak thread request memverifikasi password
+bersamaan, sekali langsung di thread request (cara lama) dan sekali lewat
+pool hashing (utils.passwords). Selama lonjakan, satu thread lain menjalankan
+"request ringan" berulang untuk mengukur seberapa terganggu endpoint lain.
+Tidak membutuhkan database.
+
+CARA PAKAI:
+    python -m scripts.bench_password_hash [--login 200] [--thread 32] [--worker 2] [--method scrypt:32768:8:1]
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import generate_password_hash, check_password_hash
+from config import Config
+from utils import passwords
+
+def light_request():
+    """Pekerjaan kecil yang mewakili endpoint biasa (murni Python)"""
+    return sum(i * i for i in range(2000))
+
+def run_burst(verify, password_hash, login, thread):
+    """
+    Jalankan login paralel sambil mengukur latensi request ringan
+    Returns: tuple (login per detik, list latensi request ringan dalam ms)
+    """
+    latencies = []
+    done = threading.Event()
+    
+    def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            light_request()
+            latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(0.005)
+    
+    prober = threading.Thread(target=probe)
+    prober.start()
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=thread) as executor:
+        results = list(executor.map(lambda _: verify(password_hash, 'rahasia123'), range(login)))
+    elapsed = time.perf_counter() - start
+    
+    done.set()
+    prober.join()
+    
+    assert all(results)
+    return login / elapsed, latencies
+
+def report(label, per_detik, latencies):
+    """Tampilkan hasil satu mode"""
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) >= 2 else latencies[0]
+    print(f"{label}: {per_detik:7.1f} login/detik, request ringan "
+          f"median {statistics.median(latencies):6.2f} ms, p95 {p95:6.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark login per detik dengan dan tanpa pool hashing")
+    parser.add_argument('--login', type=int, default=200, help="jumlah login dalam satu lonjakan")
+    parser.add_argument('--thread', type=int, default=32, help="jumlah thread request")
+    parser.add_argument('--worker', type=int, default=Config.PASSWORD_HASH_WORKERS, help="ukuran pool hashing")
+    parser.add_argument('--method', default=Config.PASSWORD_HASH_METHOD)
+    args = parser.parse_args()
+    
+    # Harus di-set sebelum pool dan method dipakai pertama kali
+    Config.PASSWORD_HASH_WORKERS = args.worker
+    Config.PASSWORD_HASH_METHOD = args.method
+    
+    password_hash = generate_password_hash('rahasia123', method=args.method)
+    print(f"🔐 {args.method}, {args.login} login, {args.thread} thread request, pool {args.worker} worker")
+    
+    idle = [0.0] * 50
+    for i in range(len(idle)):
+        start = time.perf_counter()
+        light_request()
+        idle[i] = (time.perf_counter() - start) * 1000
+    print(f"   request ringan tanpa beban: median {statistics.median(idle):6.2f} ms")
+    
+    report("🧵 Langsung di thread request",
+           *run_burst(check_password_hash, password_hash, args.login, args.thread))
+    report("🏊 Pool hashing             ",
+           *run_burst(passwords.check_password, password_hash, args.login, args.thread))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+BENCHMARK RENDER TEMPLATE app.py
+Bandingkan render_template_string (parse + kompilasi setiap request, cara
+lama) dengan render_template dari environment Jinja yang sudah di-cache.
+Tidak membutuhkan database: template dirender dengan user contoh.
+
+CARA PAKAI:
+    python -m scripts.bench_templates [--iterasi 200]
+"""
+import argparse
+import time
+from flask import render_template, render_template_string
+import app as legacy
+
+USER_CONTOH = {
+    'id': 1,
+    'username': 'demo',
+    'email': 'demo@example.com',
+    'nama_lengkap': 'Pengguna Demo',
+    'tanggal_lahir': None,
+    'jenis_kelamin': None,
+    'no_telepon': None,
+    'alamat': None,
+    'foto_profil': None
+}
+
+def measure(render, iterasi):
+    """
+    Rata-rata waktu satu render
+    Returns: milidetik per render
+    """
+    render()
+    start = time.perf_counter()
+    for _ in range(iterasi):
+        render()
+    return (time.perf_counter() - start) * 1000 / iterasi
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark render template app.py")
+    parser.add_argument('--iterasi', type=int, default=200)
+    args = parser.parse_args()
+    
+    cases = [
+        ('login', legacy.LOGIN_TEMPLATE, 'app/login.html', {'title': 'Login', 'is_register': False}),
+        ('main', legacy.MAIN_TEMPLATE, 'app/main.html', {'user': USER_CONTOH})
+    ]
+    
+    with legacy.app.test_request_context('/'):
+        for name, source, template_name, context in cases:
+            before = measure(lambda: render_template_string(source, **context), args.iterasi)
+            after = measure(lambda: render_template(template_name, **context), args.iterasi)
+            
+            print(f"📄 {name}: {before:.3f} ms -> {after:.3f} ms per render ({before / after:.1f}x lebih cepat)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+BUILD ASSET CSS/JS
+Salin setiap file di static/css dan static/js ke Config.ASSET_DIST_DIR dengan
+hash isi di nama file, buat varian .gz (dan .br jika paket brotli terpasang),
+lalu tulis manifest.json yang dibaca asset_url() di template.
+Jalankan ulang setiap kali CSS/JS berubah (misalnya saat deploy).
+
+CARA PAKAI:
+    python -m scripts.build_assets           # build, file lama tetap disimpan
+    python -m scripts.build_assets --clean   # hapus file yang tidak ada di manifest baru
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from config import Config
+
+SOURCE_SUBDIRS = ('css', 'js')
+HASH_LENGTH = 12
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def fingerprint(name, content):
+    """
+    Nama file hasil build: main.css -> main.<hash>.css
+    Returns: string
+    """
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    base, ext = os.path.splitext(name)
+    return f"{base}.{digest}{ext}"
+
+def write_file(path, content):
+    """Tulis file secara atomik agar worker tidak pernah membaca file setengah jadi"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def build(source_dir, dist_dir):
+    """
+    Build semua asset
+    Returns: dict manifest (nama sumber -> nama file hasil build)
+    """
+    assets = {}
+    
+    for subdir in SOURCE_SUBDIRS:
+        folder = os.path.join(source_dir, subdir)
+        if not os.path.isdir(folder):
+            continue
+        
+        os.makedirs(os.path.join(dist_dir, subdir), exist_ok=True)
+        
+        for filename in sorted(os.listdir(folder)):
+            if not filename.endswith(('.css', '.js')):
+                continue
+            
+            name = f"{subdir}/{filename}"
+            with open(os.path.join(folder, filename), 'rb') as f:
+                content = f.read()
+            
+            built = fingerprint(name, content)
+            path = os.path.join(dist_dir, built)
+            write_file(path, content)
+            
+            # mtime=0 agar hasil gzip identik di setiap build
+            write_file(path + '.gz', gzip.compress(content, compresslevel=9, mtime=0))
+            if brotli is not None:
+                write_file(path + '.br', brotli.compress(content))
+            
+            assets[name] = built
+            print(f"   {name} -> {built} ({len(content)} byte)")
+    
+    write_file(
+        os.path.join(dist_dir, 'manifest.json'),
+        json.dumps(assets, indent=2, sort_keys=True).encode('utf-8')
+    )
+    return assets
+
+def clean(dist_dir, assets):
+    """
+    Hapus file hasil build lama yang tidak lagi direferensikan manifest
+    Returns: jumlah file yang dihapus
+    """
+    keep = {'manifest.json'}
+    for built in assets.values():
+        keep.update((built, built + '.gz', built + '.br'))
+    
+    removed = 0
+    for subdir in SOURCE_SUBDIRS:
+        folder = os.path.join(dist_dir, subdir)
+        if not os.path.isdir(folder):
+            continue
+        for filename in os.listdir(folder):
+            if f"{subdir}/{filename}" not in keep:
+                os.remove(os.path.join(folder, filename))
+                removed += 1
+    return removed
+
+def main():
+    parser = argparse.ArgumentParser(description="Build asset CSS/JS ber-fingerprint")
+    parser.add_argument('--clean', action='store_true',
+                        help="hapus file hasil build yang tidak ada di manifest baru")
+    args = parser.parse_args()
+    
+    print(f"📦 Build asset {Config.ASSET_SOURCE_DIR}/ -> {Config.ASSET_DIST_DIR}/")
+    if brotli is None:
+        print("⚠️  Paket brotli tidak terpasang, hanya varian .gz yang dibuat")
+    
+    assets = build(Config.ASSET_SOURCE_DIR, Config.ASSET_DIST_DIR)
+    print(f"✅ {len(assets)} asset ditulis ke manifest")
+    
+    if args.clean:
+        print(f"🧹 {clean(Config.ASSET_DIST_DIR, assets)} file lama dihapus")
+
+if __name__ == '__main__':
+    main()
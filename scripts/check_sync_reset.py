@@ -0,0 +1,104 @@
+"""
+CEK DELTA SYNC SETELAH RESET DATA
+Pastikan klien baru (token kosong) milik user yang pernah reset data tetap
+konvergen: sync awal tidak menerima reset, mengikuti next_token sampai
+selesai, dan sync berikutnya kosong. Klien lama dengan token dari sebelum
+reset harus tetap menerima reset.
+Skrip membuat user uji sementara lalu menghapusnya lagi.
+
+CARA PAKAI:
+    python -m scripts.check_sync_reset
+"""
+import sys
+import uuid
+from datetime import date
+from controllers.transaksi_controller import TransaksiController
+from models.database import get_db_connection
+from models.transaksi import Transaksi
+from models.user import User
+
+def tambah(user_id, jumlah):
+    """Tambah satu transaksi pemasukan untuk user uji"""
+    Transaksi.create(user_id, date.today().isoformat(), 'Pemasukan', 'Gaji', jumlah, 'cek sync')
+
+def full_sync(user_id, limit=2, max_calls=50):
+    """
+    Sync dari token kosong sampai has_more False
+    Returns: tuple (list ID item, token terakhir, ada reset)
+    """
+    token = ''
+    ids = []
+    reset = False
+    for _ in range(max_calls):
+        result = TransaksiController.get_riwayat_changes(user_id, token, limit)
+        ids.extend(item['id'] for item in result['items'])
+        reset = reset or result['reset']
+        token = result['next_token']
+        if not result['has_more']:
+            return ids, token, reset
+    raise RuntimeError(f"sync tidak selesai setelah {max_calls} panggilan")
+
+def delete_user(user_id):
+    """Hapus user uji (transaksi & agregat ikut terhapus lewat ON DELETE CASCADE)"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+def check(user_id):
+    """
+    Jalankan skenario reset
+    Returns: list pesan kegagalan
+    """
+    errors = []
+    
+    tambah(user_id, 1000)
+    token_lama = TransaksiController.get_riwayat_changes(user_id, '')['next_token']
+    
+    Transaksi.delete_all_by_user(user_id)
+    for jumlah in (2000, 3000, 4000):
+        tambah(user_id, jumlah)
+    
+    ids, token, reset = full_sync(user_id)
+    if reset:
+        errors.append("sync awal dengan token kosong menerima reset")
+    if len(ids) != 3:
+        errors.append(f"sync awal menerima {len(ids)} transaksi, seharusnya 3")
+    
+    result = TransaksiController.get_riwayat_changes(user_id, token)
+    if result['items'] or result['reset'] or result['deleted']:
+        errors.append("sync berikutnya tidak kosong (klien tidak konvergen)")
+    
+    result = TransaksiController.get_riwayat_changes(user_id, token_lama)
+    if not result['reset']:
+        errors.append("klien dengan token dari sebelum reset tidak menerima reset")
+    
+    return errors
+
+def main():
+    username = f"cek_sync_{uuid.uuid4().hex[:8]}"
+    user_id = User.create(username, f"{username}@example.invalid", uuid.uuid4().hex)
+    if not user_id:
+        print("❌ Gagal membuat user uji")
+        return 1
+    
+    print(f"🧪 User uji {username} (id {user_id})")
+    try:
+        errors = check(user_id)
+    finally:
+        delete_user(user_id)
+    
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        return 1
+    
+    print("✅ Sync awal user yang pernah reset konvergen, token lama tetap menerima reset")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+CEK KONKURENSI TABUNGAN
+Jalankan ratusan Tabungan.tambah / Tabungan.kurang secara paralel untuk satu
+user (seperti banyak tab yang menekan tombol bersamaan), lalu pastikan:
+- saldo tabungan akhir = awal + total tambah sukses - total ambil sukses
+- saldo tersedia berubah sebaliknya dan tidak pernah dipakai dua kali
+- setiap operasi sukses tercatat tepat satu baris transaksi
+Skrip ini MENULIS ke database; gunakan akun uji.
+
+CARA PAKAI:
+    python -m scripts.check_tabungan_concurrency --user-id ID [--request 400] [--worker 8] [--jumlah 1000]
+"""
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from models.tabungan import Tabungan
+from models.user_balance import UserBalance
+from utils.money import Money
+
+def snapshot(user_id):
+    """
+    Baca state saldo user langsung dari database (tanpa cache)
+    Returns: dict tabungan, saldo (Money), jumlah_transaksi
+    """
+    balance = UserBalance.get(user_id)
+    return {
+        'tabungan': Tabungan.get_by_user(user_id),
+        'saldo': balance['total_pemasukan'] - balance['total_pengeluaran'],
+        'jumlah_transaksi': balance['jumlah_transaksi']
+    }
+
+def run(user_id, aksi_list, jumlah, worker):
+    """
+    Jalankan semua aksi secara paralel
+    Returns: dict aksi -> jumlah operasi sukses
+    """
+    def call(aksi):
+        if aksi == 'tambah':
+            success, _ = Tabungan.tambah(user_id, jumlah)
+        else:
+            success, _ = Tabungan.kurang(user_id, jumlah)
+        return aksi, success
+    
+    sukses = {'tambah': 0, 'ambil': 0}
+    with ThreadPoolExecutor(max_workers=worker) as executor:
+        for aksi, success in executor.map(call, aksi_list):
+            if success:
+                sukses[aksi] += 1
+    return sukses
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji tambah/ambil tabungan paralel untuk satu user")
+    parser.add_argument('--user-id', type=int, required=True)
+    parser.add_argument('--request', type=int, default=400, help="jumlah operasi paralel")
+    parser.add_argument('--worker', type=int, default=Config.DB_POOL['max_size'],
+                        help="jumlah thread (default ukuran maksimum pool)")
+    parser.add_argument('--jumlah', default='1000', help="nominal per operasi (rupiah)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    jumlah = Money.of(args.jumlah)
+    aksi_list = ['tambah', 'ambil'] * (args.request // 2) + ['tambah'] * (args.request % 2)
+    random.Random(args.seed).shuffle(aksi_list)
+    
+    awal = snapshot(args.user_id)
+    print(f"🔎 Awal: tabungan Rp {awal['tabungan']:,.2f}, saldo tersedia Rp {awal['saldo']:,.2f}")
+    print(f"🚀 {len(aksi_list)} operasi Rp {jumlah:,.2f} dengan {args.worker} thread...")
+    
+    start = time.perf_counter()
+    sukses = run(args.user_id, aksi_list, jumlah, args.worker)
+    elapsed = time.perf_counter() - start
+    
+    akhir = snapshot(args.user_id)
+    print(f"   selesai dalam {elapsed:.2f} detik, sukses: {sukses['tambah']} tambah, {sukses['ambil']} ambil")
+    print(f"🔎 Akhir: tabungan Rp {akhir['tabungan']:,.2f}, saldo tersedia Rp {akhir['saldo']:,.2f}")
+    
+    selisih = Money(jumlah.sen * (sukses['tambah'] - sukses['ambil']))
+    errors = []
+    if akhir['tabungan'] != awal['tabungan'] + selisih:
+        errors.append(f"tabungan seharusnya Rp {awal['tabungan'] + selisih:,.2f}")
+    if akhir['saldo'] != awal['saldo'] - selisih:
+        errors.append(f"saldo tersedia seharusnya Rp {awal['saldo'] - selisih:,.2f}")
+    if akhir['tabungan'] < Money():
+        errors.append("tabungan negatif")
+    if akhir['saldo'] < min(awal['saldo'], Money()):
+        errors.append("saldo tersedia dipakai melebihi yang ada")
+    if akhir['jumlah_transaksi'] - awal['jumlah_transaksi'] != sukses['tambah'] + sukses['ambil']:
+        errors.append(
+            f"baris transaksi bertambah {akhir['jumlah_transaksi'] - awal['jumlah_transaksi']}, "
+            f"seharusnya {sukses['tambah'] + sukses['ambil']}"
+        )
+    
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        return 1
+    
+    print("✅ Saldo akhir konsisten dengan operasi yang sukses")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+CEK RENCANA EKSEKUSI FILTER TRANSAKSI
+Jalankan EXPLAIN untuk setiap kombinasi filter Transaksi.get_filtered
+(kategori, tanggal_mulai, tanggal_akhir) dan pastikan semuanya memakai
+index komposit: range scan jika ada filter tanggal, tanpa filesort.
+Jalankan terhadap database dengan data yang representatif.
+
+CARA PAKAI:
+    python -m scripts.explain_filters --user-id 1 [--kategori Makan]
+"""
+import argparse
+import itertools
+import sys
+from datetime import date, timedelta
+from models.database import get_db_connection
+from models.transaksi import Transaksi
+
+def expected_plan(kategori, tanggal_mulai, tanggal_akhir):
+    """
+    Rencana yang diharapkan untuk satu kombinasi filter
+    Returns: tuple (set tipe akses yang diterima, nama index)
+    """
+    key = 'idx_user_kategori_tanggal' if kategori else 'idx_user_tanggal'
+    if tanggal_mulai or tanggal_akhir:
+        return {'range'}, key
+    return {'ref', 'range'}, key
+
+def explain(cursor, user_id, kategori, tanggal_mulai, tanggal_akhir, limit):
+    """
+    EXPLAIN query yang sama persis dengan Transaksi.get_filtered
+    Returns: dict baris pertama EXPLAIN (type, key, rows, Extra, ...)
+    """
+    query, params = Transaksi.filtered_query(user_id, kategori, tanggal_mulai, tanggal_akhir, limit)
+    cursor.execute(f"EXPLAIN {query}", params)
+    return cursor.fetchone()
+
+def plan_ok(plan, kategori, tanggal_mulai, tanggal_akhir):
+    """Cek apakah rencana memakai index yang diharapkan tanpa filesort"""
+    allowed_types, expected_key = expected_plan(kategori, tanggal_mulai, tanggal_akhir)
+    return (plan['type'] in allowed_types
+            and plan['key'] == expected_key
+            and 'Using filesort' not in (plan.get('Extra') or ''))
+
+def main():
+    parser = argparse.ArgumentParser(description="Cek EXPLAIN filter transaksi")
+    parser.add_argument('--user-id', type=int, required=True)
+    parser.add_argument('--kategori', default='Makan')
+    parser.add_argument('--tanggal-mulai', default=(date.today() - timedelta(days=30)).isoformat())
+    parser.add_argument('--tanggal-akhir', default=date.today().isoformat())
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+    
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    failures = 0
+    
+    for kategori, tanggal_mulai, tanggal_akhir in itertools.product(
+        ('', args.kategori), ('', args.tanggal_mulai), ('', args.tanggal_akhir)
+    ):
+        plan = explain(cursor, args.user_id, kategori, tanggal_mulai, tanggal_akhir, args.limit)
+        ok = plan_ok(plan, kategori, tanggal_mulai, tanggal_akhir)
+        extra = plan.get('Extra') or ''
+        
+        label = f"kategori={kategori or '-'} mulai={tanggal_mulai or '-'} akhir={tanggal_akhir or '-'}"
+        status = '✅' if ok else '❌'
+        print(f"{status} {label}: type={plan['type']} key={plan['key']} rows={plan['rows']} extra={extra}")
+        
+        if not ok:
+            failures += 1
+            allowed_types, expected_key = expected_plan(kategori, tanggal_mulai, tanggal_akhir)
+            print(f"   diharapkan type in {sorted(allowed_types)} key={expected_key} tanpa filesort")
+    
+    cursor.close()
+    conn.close()
+    
+    if failures:
+        print(f"❌ {failures} kombinasi filter tidak memakai index yang diharapkan")
+        return 1
+    
+    print("✅ Semua kombinasi filter memakai index range/ref tanpa filesort")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+IMPORT CSV / MUTASI REKENING
+Import transaksi dari file CSV besar secara streaming (baris per baris,
+disimpan per chunk), dengan laporan progres dan error per baris.
+
+CARA PAKAI:
+    python -m scripts.import_csv --user-id 1 mutasi.csv
+    python -m scripts.import_csv --user-id 1 mutasi.csv \\
+        --map tanggal=Tanggal --map jumlah=Nominal --map keterangan=Deskripsi \\
+        --format-tanggal %d/%m/%Y --pemisah ';' --desimal-koma --encoding cp1252
+"""
+import argparse
+import sys
+import time
+from controllers.import_controller import ImportController
+
+def peak_memory_mb():
+    """Puncak pemakaian memori proses (MB), None jika tidak tersedia"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description="Import transaksi dari CSV")
+    parser.add_argument('file', help="path file CSV")
+    parser.add_argument('--user-id', type=int, required=True)
+    parser.add_argument('--map', action='append', default=[], metavar='FIELD=KOLOM',
+                        help="petakan field (tanggal/tipe/kategori/jumlah/keterangan) ke kolom CSV")
+    parser.add_argument('--format-tanggal', default='%Y-%m-%d')
+    parser.add_argument('--pemisah', default=',')
+    parser.add_argument('--desimal-koma', action='store_true', help="angka berformat 1.234,56")
+    parser.add_argument('--encoding', default='utf-8-sig', help="encoding file (utf-8-sig, cp1252, latin-1, ...)")
+    args = parser.parse_args()
+    
+    mapping = {}
+    for item in args.map:
+        field, _, column = item.partition('=')
+        mapping[field.strip()] = column.strip()
+    
+    start = time.monotonic()
+    last_report = [start]
+    
+    def progress(stats):
+        # Laporkan paling sering sekali per detik
+        now = time.monotonic()
+        if now - last_report[0] < 1:
+            return
+        last_report[0] = now
+        elapsed = now - start
+        print(f"   {stats['diproses']:,} baris diproses, {stats['diimpor']:,} diimpor, "
+              f"{stats['gagal']:,} gagal ({stats['diproses'] / max(elapsed, 1e-9):,.0f} baris/detik)")
+    
+    with open(args.file, 'rb') as f:
+        result = ImportController.import_csv(
+            args.user_id, f,
+            mapping=mapping,
+            format_tanggal=args.format_tanggal,
+            pemisah=args.pemisah,
+            desimal_koma=args.desimal_koma,
+            encoding=args.encoding,
+            progress=progress
+        )
+    
+    for error in result['errors']:
+        print(f"   baris {error['baris']}: {'; '.join(error['errors'])}")
+    if result['errors_terpotong']:
+        print("   ... error lainnya tidak ditampilkan")
+    
+    print(result['message'])
+    
+    memory = peak_memory_mb()
+    if memory is not None:
+        print(f"📦 Puncak memori: {memory:,.1f} MB, waktu: {time.monotonic() - start:,.1f} detik")
+    
+    return 0 if result['success'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
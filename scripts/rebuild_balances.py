@@ -0,0 +1,75 @@
+"""
+REBUILD AGREGAT (user_balances & rekap_bulanan)
+Hitung ulang agregat saldo dan rekap bulanan dari ledger transaksi,
+dan laporkan selisihnya.
+
+CARA PAKAI:
+    python -m scripts.rebuild_balances              # verifikasi lalu rebuild semua user
+    python -m scripts.rebuild_balances --user-id 5  # hanya satu user
+    python -m scripts.rebuild_balances --verify     # hanya verifikasi, tanpa menulis
+"""
+import argparse
+import sys
+from models.user_balance import UserBalance
+from models.rekap_bulanan import RekapBulanan
+
+def print_mismatches(mismatches):
+    """Tampilkan daftar agregat yang tidak cocok dengan ledger"""
+    for m in mismatches:
+        print(
+            f"   user {m['user_id']}: "
+            f"pemasukan {m['tersimpan_pemasukan']} -> {m['total_pemasukan']}, "
+            f"pengeluaran {m['tersimpan_pengeluaran']} -> {m['total_pengeluaran']}, "
+            f"baris {m['tersimpan_jumlah_transaksi']} -> {m['jumlah_transaksi']}"
+        )
+
+def print_rekap_mismatches(mismatches):
+    """Tampilkan daftar rekap bulanan yang tidak cocok dengan ledger"""
+    for m in mismatches:
+        print(
+            f"   user {m['user_id']} {m['bulan']} {m['tipe']}/{m['kategori']}: "
+            f"{m['tersimpan_total']} -> {m['total']}"
+        )
+
+def verify(user_id):
+    """
+    Verifikasi kedua agregat
+    Returns: int jumlah selisih
+    """
+    mismatches = UserBalance.verify(user_id)
+    if mismatches:
+        print(f"⚠️  {len(mismatches)} agregat saldo tidak cocok dengan ledger:")
+        print_mismatches(mismatches)
+    
+    rekap_mismatches = RekapBulanan.verify(user_id)
+    if rekap_mismatches:
+        print(f"⚠️  {len(rekap_mismatches)} rekap bulanan tidak cocok dengan ledger:")
+        print_rekap_mismatches(rekap_mismatches)
+    
+    return len(mismatches) + len(rekap_mismatches)
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild agregat user_balances & rekap_bulanan dari ledger transaksi")
+    parser.add_argument('--user-id', type=int, help="hanya proses user ini")
+    parser.add_argument('--verify', action='store_true', help="hanya verifikasi, jangan menulis")
+    args = parser.parse_args()
+    
+    if not verify(args.user_id):
+        print("✅ Semua agregat cocok dengan ledger")
+        return 0
+    
+    if args.verify:
+        return 1
+    
+    UserBalance.rebuild(args.user_id)
+    RekapBulanan.rebuild(args.user_id)
+    
+    if verify(args.user_id):
+        print("❌ Masih ada agregat yang tidak cocok setelah rebuild")
+        return 1
+    
+    print("✅ Agregat berhasil dibangun ulang")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+REKONSILIASI TABUNGAN
+Cocokkan saldo tabel tabungan dengan saldo menurut ledger transaksi
+(Tabungan dikurangi Pemasukan kategori Tabungan) untuk semua user.
+User dibagi per rentang ID (shard) dan setiap shard diperiksa di proses
+terpisah dengan satu query ber-GROUP BY; selisih dilaporkan dan bisa
+diperbaiki dengan --repair.
+
+CARA PAKAI:
+    python -m scripts.reconcile_tabungan                     # laporkan selisih saja
+    python -m scripts.reconcile_tabungan --repair            # perbaiki dari ledger
+    python -m scripts.reconcile_tabungan --shard 5000 --proses 8
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from models.database import get_pool
+from models.tabungan import Tabungan
+from models.user import User
+
+def shards(awal, akhir, ukuran):
+    """
+    Bagi rentang ID user menjadi shard
+    Returns: list tuple (id awal, id akhir) inklusif
+    """
+    return [(mulai, min(mulai + ukuran - 1, akhir)) for mulai in range(awal, akhir + 1, ukuran)]
+
+def reconcile_shard(shard, repair):
+    """
+    Periksa (dan perbaiki) satu shard. Dijalankan di proses worker;
+    pool koneksi dibuat ulang otomatis per proses.
+    Returns: tuple (jumlah user, list selisih, list user_id yang diperbaiki)
+    """
+    jumlah_user, mismatches = Tabungan.verify_range(*shard)
+    
+    repaired = []
+    if repair:
+        for m in mismatches:
+            Tabungan.rebuild(m['user_id'])
+            repaired.append(m['user_id'])
+    
+    return jumlah_user, mismatches, repaired
+
+def main():
+    parser = argparse.ArgumentParser(description="Rekonsiliasi saldo tabungan dengan ledger transaksi")
+    parser.add_argument('--repair', action='store_true', help="tulis ulang saldo yang tidak cocok dari ledger")
+    parser.add_argument('--shard', type=int, default=1000, help="jumlah ID user per shard")
+    parser.add_argument('--proses', type=int, default=os.cpu_count() or 1, help="jumlah proses worker")
+    args = parser.parse_args()
+    
+    id_range = User.get_id_range()
+    if id_range is None:
+        print("ℹ️  Belum ada user")
+        return 0
+    
+    # Koneksi milik proses induk jangan sampai ikut terwarisi worker hasil fork
+    get_pool().close_all()
+    
+    daftar_shard = shards(*id_range, args.shard)
+    print(f"🔎 {len(daftar_shard)} shard (user {id_range[0]}-{id_range[1]}), {args.proses} proses")
+    
+    total_user = 0
+    total_selisih = 0
+    total_diperbaiki = 0
+    start = time.perf_counter()
+    
+    with ProcessPoolExecutor(max_workers=args.proses) as executor:
+        futures = [executor.submit(reconcile_shard, shard, args.repair) for shard in daftar_shard]
+        for future in futures:
+            jumlah_user, mismatches, repaired = future.result()
+            total_user += jumlah_user
+            total_selisih += len(mismatches)
+            total_diperbaiki += len(repaired)
+            for m in mismatches:
+                print(f"   user {m['user_id']}: tersimpan {m['tersimpan']} -> ledger {m['jumlah']}")
+    
+    elapsed = time.perf_counter() - start
+    print(f"⏱️  {total_user} user dalam {elapsed:.2f} detik ({total_user / max(elapsed, 1e-9):,.0f} user/detik)")
+    
+    if not total_selisih:
+        print("✅ Semua saldo tabungan cocok dengan ledger")
+        return 0
+    
+    if not args.repair:
+        print(f"⚠️  {total_selisih} saldo tabungan tidak cocok dengan ledger (jalankan dengan --repair)")
+        return 1
+    
+    print(f"🔧 {total_diperbaiki} saldo tabungan dibangun ulang dari ledger")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,662 @@
+// Mobile Menu Toggle
+function toggleMobileMenu() {
+    const sidebar = document.getElementById('sidebar');
+    const overlay = document.getElementById('mobileOverlay');
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+}
+
+// Close mobile menu when clicking nav link
+document.addEventListener('DOMContentLoaded', function() {
+    const navLinks = document.querySelectorAll('.sidebar .nav-link');
+    navLinks.forEach(link => {
+        link.addEventListener('click', function() {
+            if (window.innerWidth <= 768) {
+                toggleMobileMenu();
+            }
+        });
+    });
+});
+
+// Global chart instances
+let pieChart = null;
+let barChart = null;
+
+// Kategori berdasarkan tipe
+const kategoriPemasukan = ['Gaji', 'Hibah', 'Lainnya'];
+const kategoriPengeluaran = ['Jajan', 'Transportasi', 'Makan', 'Kebutuhan', 'Keinginan', 'Lainnya'];
+
+window.onload = function() {
+    initDateLimits();
+    updateKategori();
+    refreshDashboard();
+    updateFilterKategori();
+    connectEvents();
+
+    const today = new Date();
+    const firstDay = new Date(today.getFullYear(), today.getMonth(), 1);
+    document.getElementById('filterTanggalMulai').value = firstDay.toISOString().split('T')[0];
+    document.getElementById('filterTanggalAkhir').value = today.toISOString().split('T')[0];
+};
+
+// Inisialisasi limit tanggal (seminggu ke depan dan ke belakang)
+function initDateLimits() {
+    const today = new Date();
+    const weekBefore = new Date(today);
+    weekBefore.setDate(today.getDate() - 7);
+    const weekAfter = new Date(today);
+    weekAfter.setDate(today.getDate() + 7);
+
+    const tanggalInput = document.getElementById('tanggal');
+    tanggalInput.min = weekBefore.toISOString().split('T')[0];
+    tanggalInput.max = weekAfter.toISOString().split('T')[0];
+    tanggalInput.value = today.toISOString().split('T')[0];
+}
+
+// Update kategori berdasarkan tipe
+function updateKategori() {
+    const tipe = document.getElementById('tipe').value;
+    const kategoriSelect = document.getElementById('kategori');
+    kategoriSelect.innerHTML = '';
+
+    const kategoriList = tipe === 'Pemasukan' ? kategoriPemasukan : kategoriPengeluaran;
+    kategoriList.forEach(kat => {
+        const option = document.createElement('option');
+        option.value = kat;
+        option.textContent = kat;
+        kategoriSelect.appendChild(option);
+    });
+}
+
+// Update filter kategori di buku besar
+function updateFilterKategori() {
+    const filterSelect = document.getElementById('filterKategori');
+    filterSelect.innerHTML = '<option value="">Semua Kategori</option>';
+
+    [...kategoriPemasukan, ...kategoriPengeluaran].forEach(kat => {
+        const option = document.createElement('option');
+        option.value = kat;
+        option.textContent = kat;
+        filterSelect.appendChild(option);
+    });
+}
+
+// Show tab
+function showTab(tabName) {
+    document.querySelectorAll('.content-wrapper').forEach(el => el.style.display = 'none');
+    document.querySelectorAll('.nav-link').forEach(el => el.classList.remove('active'));
+
+    document.getElementById(tabName).style.display = 'block';
+    event.target.closest('.nav-link').classList.add('active');
+
+    if (tabName === 'riwayat') loadRiwayat();
+    if (tabName === 'bukubesar') loadBukuBesar();
+    if (tabName === 'dashboard') eventsAktif() && dashboardState ? renderCharts(dashboardState) : refreshDashboard();
+}
+
+function calculateHealthScore(data) {
+    let score = 50; // Base score
+
+    // Tabungan factor (max +20)
+    if (data.tabungan > 0) {
+        const tabunganRatio = data.tabungan / (data.pemasukan || 1);
+        score += Math.min(20, tabunganRatio * 100);
+    }
+
+    // Saldo factor (max +15)
+    if (data.saldo > 0) {
+        const saldoRatio = data.saldo / (data.pemasukan || 1);
+        score += Math.min(15, saldoRatio * 50);
+    } else {
+        score -= 15;
+    }
+
+    // Arus kas factor (max +10)
+    if (data.arus_kas > 0) {
+        score += 10;
+    } else {
+        score -= 10;
+    }
+
+    // Pengeluaran ratio factor (max +5)
+    if (data.pemasukan > 0) {
+        const pengeluaranRatio = data.pengeluaran / data.pemasukan;
+        if (pengeluaranRatio < 0.5) {
+            score += 5;
+        } else if (pengeluaranRatio > 0.9) {
+            score -= 10;
+        }
+    }
+
+    return Math.max(0, Math.min(100, Math.round(score)));
+}
+
+function getHealthStatus(score) {
+    if (score >= 80) return { text: 'Sangat Sehat', color: '#2ecc71', emoji: '😄' };
+    if (score >= 60) return { text: 'Sehat', color: '#27ae60', emoji: '🙂' };
+    if (score >= 40) return { text: 'Cukup', color: '#f39c12', emoji: '😐' };
+    if (score >= 20) return { text: 'Perlu Perhatian', color: '#e67e22', emoji: '😟' };
+    return { text: 'Buruk', color: '#e74c3c', emoji: '😰' };
+}
+
+// Data dashboard terakhir; diperbarui oleh event 'summary' dari /api/events
+let dashboardState = null;
+let eventSource = null;
+
+function refreshDashboard() {
+    fetch('/api/dashboard')
+        .then(response => response.json())
+        .then(data => {
+            dashboardState = data;
+            renderSummary(data);
+            renderCharts(data);
+            renderTabunganInfo(data);
+        })
+        .catch(error => console.error('Error loading dashboard:', error));
+}
+
+function connectEvents() {
+    if (!window.EventSource) return;
+
+    eventSource = new EventSource('/api/events');
+    let pertama = true;
+
+    eventSource.addEventListener('summary', e => {
+        const delta = JSON.parse(e.data);
+        dashboardState = Object.assign(dashboardState || {}, delta);
+        renderSummary(dashboardState);
+        renderTabunganInfo(dashboardState);
+
+        // Event pertama sama dengan hasil refreshDashboard() saat halaman dibuka
+        if (!pertama) renderCharts(dashboardState);
+        pertama = false;
+    });
+
+    // Server menutup koneksi ini karena tab lain membuka koneksi baru
+    eventSource.addEventListener('close', () => {
+        eventSource.close();
+        eventSource = null;
+    });
+}
+
+function eventsAktif() {
+    return eventSource !== null && eventSource.readyState === EventSource.OPEN;
+}
+
+function renderSummary(data) {
+    const healthScore = calculateHealthScore(data);
+    const healthStatus = getHealthStatus(healthScore);
+
+    document.getElementById('summaryStats').innerHTML = `
+        <div class="row">
+            <div class="col-md-3">
+                <div class="stats-box stats-box-info">
+                    <h6>📊 Arus Kas Bersih</h6>
+                    <h3>Rp ${data.arus_kas.toLocaleString('id-ID')}</h3>
+                    <small>${data.arus_kas >= 0 ? '✅ Positif' : '⚠️ Negatif'}</small>
+                </div>
+            </div>
+            <div class="col-md-3">
+                <div class="stats-box">
+                    <h6>💵 Saldo Tersedia</h6>
+                    <h3>Rp ${data.saldo.toLocaleString('id-ID')}</h3>
+                </div>
+            </div>
+            <div class="col-md-3">
+                <div class="stats-box stats-box-warning">
+                    <h6>💎 Tabungan</h6>
+                    <h3>Rp ${data.tabungan.toLocaleString('id-ID')}</h3>
+                </div>
+            </div>
+            <div class="col-md-3">
+                <div class="stats-box" style="background: linear-gradient(135deg, ${healthStatus.color} 0%, ${healthStatus.color}dd 100%);">
+                    <h6>❤️ Health Score</h6>
+                    <div class="health-score">${healthScore} ${healthStatus.emoji}</div>
+                    <div class="health-indicator">
+                        <div class="health-pointer" style="left: ${healthScore}%;"></div>
+                    </div>
+                    <small style="text-align: center; display: block; margin-top: 10px;">${healthStatus.text}</small>
+                </div>
+            </div>
+        </div>
+    `;
+}
+
+function renderCharts(data) {
+    // Destroy existing charts
+    if (pieChart) pieChart.destroy();
+    if (barChart) barChart.destroy();
+
+    // Pie Chart - Distribusi Pengeluaran
+    const pieCtx = document.getElementById('pieChart').getContext('2d');
+    pieChart = new Chart(pieCtx, {
+        type: 'pie',
+        data: {
+            labels: data.kategori_labels,
+            datasets: [{
+                data: data.kategori_values,
+                backgroundColor: [
+                    '#2ecc71', '#27ae60', '#f1c40f', 
+                    '#f39c12', '#e67e22', '#e74c3c'
+                ],
+                borderWidth: 2,
+                borderColor: '#fff'
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    position: 'bottom',
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            return context.label + ': Rp ' + context.parsed.toLocaleString('id-ID');
+                        }
+                    }
+                }
+            }
+        }
+    });
+
+    // Bar Chart - Perbandingan
+    const barCtx = document.getElementById('barChart').getContext('2d');
+    barChart = new Chart(barCtx, {
+        type: 'bar',
+        data: {
+            labels: ['Pemasukan', 'Pengeluaran', 'Tabungan', 'Saldo'],
+            datasets: [{
+                label: 'Jumlah (Rp)',
+                data: [data.pemasukan, data.pengeluaran, data.tabungan, data.saldo],
+                backgroundColor: [
+                    '#2ecc71',
+                    '#e74c3c',
+                    '#f1c40f',
+                    data.saldo >= 0 ? '#27ae60' : '#c0392b'
+                ],
+                borderWidth: 2,
+                borderColor: '#fff'
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    display: false
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            return 'Rp ' + context.parsed.y.toLocaleString('id-ID');
+                        }
+                    }
+                }
+            },
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    ticks: {
+                        callback: function(value) {
+                            return 'Rp ' + value.toLocaleString('id-ID');
+                        }
+                    }
+                }
+            }
+        }
+    });
+}
+
+document.getElementById('transaksiForm').onsubmit = function(e) {
+    e.preventDefault();
+    const data = {
+        tanggal: document.getElementById('tanggal').value,
+        tipe: document.getElementById('tipe').value,
+        kategori: document.getElementById('kategori').value,
+        jumlah: document.getElementById('jumlah').value,
+        keterangan: document.getElementById('keterangan').value
+    };
+
+    fetch('/api/transaksi', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            document.getElementById('transaksiStatus').innerHTML = 
+                `<div class="alert alert-success">${result.message}</div>`;
+            document.getElementById('transaksiForm').reset();
+            initDateLimits();
+            updateKategori();
+            if (!eventsAktif()) refreshDashboard();
+        } else {
+            document.getElementById('transaksiStatus').innerHTML = 
+                `<div class="alert alert-danger">${result.message}</div>`;
+        }
+    });
+};
+
+let riwayatCursor = null;
+let riwayatSync = null;
+let riwayatItems = [];
+
+// Urutan tampilan riwayat: tanggal, created_at, id menurun
+function compareRiwayat(a, b) {
+    return (new Date(b.tanggal) - new Date(a.tanggal))
+        || (new Date(b.created_at) - new Date(a.created_at))
+        || (b.id - a.id);
+}
+
+function renderRiwayat() {
+    const tbody = document.querySelector('#riwayatTable tbody');
+    let rows = '';
+    riwayatItems.forEach(item => {
+        let badgeClass = 'success';
+        let badgeText = item.tipe;
+
+        if (item.tipe === 'Tabungan') {
+            badgeClass = 'primary tabungan-badge';
+        } else if (item.tipe === 'Pengeluaran') {
+            badgeClass = 'danger';
+        }
+
+        rows += `
+            <tr>
+                <td>${new Date(item.tanggal).toLocaleDateString('id-ID')}</td>
+                <td><span class="badge bg-${badgeClass}">${badgeText}</span></td>
+                <td>${item.kategori}</td>
+                <td class="${item.tipe === 'Pemasukan' ? 'debit' : 'kredit'}">Rp ${parseFloat(item.jumlah).toLocaleString('id-ID')}</td>
+                <td>${item.keterangan || '-'}</td>
+            </tr>
+        `;
+    });
+    tbody.innerHTML = rows;
+    document.getElementById('riwayatMoreBtn').style.display = riwayatCursor ? '' : 'none';
+}
+
+function loadRiwayat(more = false) {
+    // Riwayat sudah dimuat: cukup ambil perubahannya saja
+    if (!more && riwayatSync) {
+        syncRiwayat();
+        return;
+    }
+
+    const params = new URLSearchParams();
+    if (more && riwayatCursor) params.set('cursor', riwayatCursor);
+
+    fetch(`/api/riwayat?${params}`)
+        .then(response => response.json())
+        .then(data => {
+            if (!more) {
+                riwayatItems = [];
+                riwayatSync = data.sync_token;
+            }
+            riwayatItems = riwayatItems.concat(data.items);
+            riwayatCursor = data.next_cursor;
+            renderRiwayat();
+        });
+}
+
+function syncRiwayat() {
+    fetch(`/api/riwayat/changes?since=${encodeURIComponent(riwayatSync)}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.error || data.reset) {
+                riwayatSync = null;
+                loadRiwayat();
+                return;
+            }
+
+            const deleted = new Set(data.deleted);
+            const last = riwayatItems[riwayatItems.length - 1];
+
+            // Baris yang lebih lama dari halaman terakhir akan muncul saat "Muat lebih banyak"
+            const baru = data.items.filter(item => !riwayatCursor || !last || compareRiwayat(item, last) < 0);
+            riwayatItems = riwayatItems
+                .filter(item => !deleted.has(item.id))
+                .concat(baru)
+                .sort(compareRiwayat);
+
+            riwayatSync = data.next_token;
+            renderRiwayat();
+
+            if (data.has_more) syncRiwayat();
+        });
+}
+
+function loadBukuBesar() {
+    const kategori = document.getElementById('filterKategori').value;
+    const tanggalMulai = document.getElementById('filterTanggalMulai').value;
+    const tanggalAkhir = document.getElementById('filterTanggalAkhir').value;
+
+    const params = new URLSearchParams({
+        kategori: kategori,
+        tanggal_mulai: tanggalMulai,
+        tanggal_akhir: tanggalAkhir,
+        limit: 10  // Batasi hanya 10 baris terakhir
+    });
+
+    fetch(`/api/buku-besar?${params}`)
+        .then(response => response.json())
+        .then(data => {
+            const tbody = document.getElementById('bukuBesarBody');
+            tbody.innerHTML = '';
+
+            if (data.entries.length > 0) {
+                const awal = document.createElement('tr');
+                awal.innerHTML = `
+                    <td colspan="5" class="text-end"><em>Saldo Awal</em></td>
+                    <td class="text-end"><strong>Rp ${data.saldo_awal.toLocaleString('id-ID')}</strong></td>
+                `;
+                tbody.appendChild(awal);
+            }
+
+            data.entries.forEach(entry => {
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td>${new Date(entry.tanggal).toLocaleDateString('id-ID')}</td>
+                    <td>${entry.keterangan}</td>
+                    <td>${entry.kategori}</td>
+                    <td class="text-end debit">${entry.debit > 0 ? 'Rp ' + parseFloat(entry.debit).toLocaleString('id-ID') : '-'}</td>
+                    <td class="text-end kredit">${entry.kredit > 0 ? 'Rp ' + parseFloat(entry.kredit).toLocaleString('id-ID') : '-'}</td>
+                    <td class="text-end"><strong>Rp ${entry.saldo.toLocaleString('id-ID')}</strong></td>
+                `;
+                tbody.appendChild(row);
+            });
+
+            document.getElementById('bukuBesarTotal').innerHTML = `
+                <td colspan="3" class="text-end"><strong>TOTAL:</strong></td>
+                <td class="text-end debit"><strong>Rp ${data.total_debit.toLocaleString('id-ID')}</strong></td>
+                <td class="text-end kredit"><strong>Rp ${data.total_kredit.toLocaleString('id-ID')}</strong></td>
+                <td class="text-end"><strong>Rp ${data.saldo_akhir.toLocaleString('id-ID')}</strong></td>
+            `;
+        });
+}
+
+function loadTabunganInfo() {
+    if (eventsAktif() && dashboardState) {
+        renderTabunganInfo(dashboardState);
+    } else {
+        refreshDashboard();
+    }
+}
+
+function renderTabunganInfo(data) {
+    document.getElementById('tabunganInfo').innerHTML = `
+        <h3>💎 Saldo Tabungan</h3>
+        <h2>Rp ${data.tabungan.toLocaleString('id-ID')}</h2>
+    `;
+
+    document.getElementById('saldoInfo').innerHTML = `
+        <strong>💵 Saldo Tersedia untuk Ditabung:</strong> Rp ${data.saldo.toLocaleString('id-ID')}
+        <br><small class="text-muted">Saldo ini adalah hasil dari: Pemasukan - Pengeluaran (termasuk yang sudah masuk tabungan)</small>
+    `;
+}
+
+document.getElementById('tabunganForm').onsubmit = function(e) {
+    e.preventDefault();
+    const data = {
+        aksi: document.getElementById('aksiTabungan').value,
+        jumlah: document.getElementById('jumlahTabungan').value
+    };
+
+    fetch('/api/tabungan/kelola', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(response => response.json())
+    .then(result => {
+        document.getElementById('tabunganStatus').innerHTML = 
+            `<div class="alert alert-${result.success ? 'success' : 'danger'}">${result.message}</div>`;
+        if (result.success) {
+            document.getElementById('tabunganForm').reset();
+            if (!eventsAktif()) refreshDashboard();
+            loadRiwayat();
+        }
+    });
+};
+
+document.getElementById('profilForm').onsubmit = function(e) {
+    e.preventDefault();
+    const data = {
+        nama_lengkap: document.getElementById('namaLengkap').value,
+        tanggal_lahir: document.getElementById('tanggalLahir').value,
+        jenis_kelamin: document.getElementById('jenisKelamin').value,
+        no_telepon: document.getElementById('noTelepon').value,
+        alamat: document.getElementById('alamat').value
+    };
+
+    fetch('/api/profil/update', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(response => response.json())
+    .then(result => {
+        document.getElementById('profilStatus').innerHTML = 
+            `<div class="alert alert-${result.success ? 'success' : 'danger'}">${result.message}</div>`;
+        if (result.success) {
+            setTimeout(() => location.reload(), 1500);
+        }
+    });
+};
+
+document.getElementById('passwordForm').onsubmit = function(e) {
+    e.preventDefault();
+    const newPass = document.getElementById('newPassword').value;
+    const confirmPass = document.getElementById('confirmPassword').value;
+
+    if (newPass !== confirmPass) {
+        document.getElementById('passwordStatus').innerHTML = 
+            '<div class="alert alert-danger">Password baru tidak cocok!</div>';
+        return;
+    }
+
+    const data = {
+        current_password: document.getElementById('currentPassword').value,
+        new_password: newPass
+    };
+
+    fetch('/api/profil/reset-password', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(response => response.json())
+    .then(result => {
+        document.getElementById('passwordStatus').innerHTML = 
+            `<div class="alert alert-${result.success ? 'success' : 'danger'}">${result.message}</div>`;
+        if (result.success) {
+            document.getElementById('passwordForm').reset();
+            setTimeout(() => location.href = '/logout', 2000);
+        }
+    });
+};
+
+function uploadFoto() {
+    const fileInput = document.getElementById('fotoUpload');
+    const file = fileInput.files[0];
+
+    if (!file) return;
+
+    const formData = new FormData();
+    formData.append('foto', file);
+
+    fetch('/api/profil/upload-foto', {
+        method: 'POST',
+        body: formData
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            document.getElementById('profilePreview').src = result.foto_url + '?t=' + new Date().getTime();
+            document.getElementById('profilStatus').innerHTML = 
+                `<div class="alert alert-success">${result.message}</div>`;
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            document.getElementById('profilStatus').innerHTML = 
+                `<div class="alert alert-danger">${result.message}</div>`;
+        }
+    });
+}
+
+// Reset Data Functions
+let resetDataModal;
+
+function showResetDataModal() {
+    if (!resetDataModal) {
+        resetDataModal = new bootstrap.Modal(document.getElementById('resetDataModal'));
+    }
+    document.getElementById('resetDataForm').reset();
+    resetDataModal.show();
+}
+
+function executeResetData() {
+    const password = document.getElementById('resetPassword').value;
+    const confirmed = document.getElementById('confirmReset').checked;
+
+    if (!password) {
+        alert('Mohon masukkan password Anda!');
+        return;
+    }
+
+    if (!confirmed) {
+        alert('Mohon centang konfirmasi untuk melanjutkan!');
+        return;
+    }
+
+    // Kirim request reset data
+    fetch('/api/profil/reset-data', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({ password: password })
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            resetDataModal.hide();
+            document.getElementById('resetStatus').innerHTML = 
+                `<div class="alert alert-success">${result.message}</div>`;
+
+            // Reload setelah 2 detik
+            setTimeout(() => {
+                location.href = '/';
+            }, 2000);
+        } else {
+            document.getElementById('resetStatus').innerHTML = 
+                `<div class="alert alert-danger">${result.message}</div>`;
+            resetDataModal.hide();
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        document.getElementById('resetStatus').innerHTML = 
+            `<div class="alert alert-danger">Terjadi kesalahan saat reset data!</div>`;
+        resetDataModal.hide();
+    });
+}
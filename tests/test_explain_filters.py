@@ -0,0 +1,79 @@
+"""
+TEST RENCANA EKSEKUSI FILTER TRANSAKSI
+Versi pytest dari scripts/explain_filters.py: setiap kombinasi filter
+buku besar harus memakai index komposit (range scan jika ada filter
+tanggal) tanpa filesort. Ledger uji diisi cukup banyak baris dan tabel
+di-ANALYZE agar optimizer memilih rencana seperti pada data nyata.
+"""
+import itertools
+from datetime import date, timedelta
+import pytest
+from config import Config
+from models.database import get_db_connection
+from models.transaksi import Transaksi
+from scripts.explain_filters import explain, expected_plan, plan_ok
+from tests.conftest import create_user, delete_user
+
+HARI = 365
+BARIS_PER_HARI = 8
+KATEGORI = Config.KATEGORI_PENGELUARAN
+
+TANGGAL_AKHIR = date.today()
+TANGGAL_MULAI = TANGGAL_AKHIR - timedelta(days=30)
+
+def ledger_rows():
+    """Baris transaksi sintetis: beberapa per hari, kategori bergiliran"""
+    rows = []
+    for hari in range(HARI):
+        tanggal = (TANGGAL_AKHIR - timedelta(days=hari)).isoformat()
+        for i in range(BARIS_PER_HARI):
+            rows.append({
+                'tanggal': tanggal,
+                'tipe': 'Pengeluaran',
+                'kategori': KATEGORI[(hari + i) % len(KATEGORI)],
+                'jumlah': 1000 + i,
+                'keterangan': 'test explain'
+            })
+    return rows
+
+@pytest.fixture(scope='module')
+def ledger_user(database):
+    """User dengan ledger representatif, ditambah user lain agar filter user_id selektif"""
+    user_ids = [create_user('explain') for _ in range(3)]
+    try:
+        rows = ledger_rows()
+        for user_id in user_ids:
+            for start in range(0, len(rows), Config.IMPORT_CHUNK_SIZE):
+                assert Transaksi.create_many(user_id, rows[start:start + Config.IMPORT_CHUNK_SIZE])
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("ANALYZE TABLE transaksi")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
+        
+        yield user_ids[0]
+    finally:
+        for user_id in user_ids:
+            delete_user(user_id)
+
+@pytest.mark.parametrize('kategori, tanggal_mulai, tanggal_akhir', list(itertools.product(
+    ('', 'Makan'), ('', TANGGAL_MULAI.isoformat()), ('', TANGGAL_AKHIR.isoformat())
+)))
+def test_filter_memakai_index(ledger_user, kategori, tanggal_mulai, tanggal_akhir):
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        plan = explain(cursor, ledger_user, kategori, tanggal_mulai, tanggal_akhir, 10)
+    finally:
+        cursor.close()
+        conn.close()
+    
+    allowed_types, expected_key = expected_plan(kategori, tanggal_mulai, tanggal_akhir)
+    assert plan_ok(plan, kategori, tanggal_mulai, tanggal_akhir), (
+        f"type={plan['type']} key={plan['key']} extra={plan.get('Extra')}, "
+        f"diharapkan type in {sorted(allowed_types)} key={expected_key} tanpa filesort"
+    )
@@ -0,0 +1,60 @@
+"""
+TEST KONKURENSI TABUNGAN
+Tabungan.tambah / Tabungan.kurang dijalankan paralel untuk satu user
+(lewat helper scripts.check_tabungan_concurrency). Permintaan sengaja
+melebihi saldo yang ada: tanpa update bersyarat yang atomik, saldo
+tabungan atau saldo tersedia akan menjadi negatif.
+"""
+import random
+from datetime import date
+from config import Config
+from models.tabungan import Tabungan
+from models.transaksi import Transaksi
+from scripts.check_tabungan_concurrency import run, snapshot
+from utils.money import Money
+
+JUMLAH = Money.of('1000')
+WORKER = Config.DB_POOL['max_size']
+
+def modal_awal(user_id, rupiah):
+    """Isi saldo tersedia user uji dengan satu pemasukan"""
+    assert Transaksi.create(user_id, date.today().isoformat(), 'Pemasukan', 'Gaji', Money.of(rupiah), 'modal test')
+
+def test_ambil_paralel_tidak_melebihi_tabungan(user_id):
+    modal_awal(user_id, '5000')
+    for _ in range(5):
+        success, message = Tabungan.tambah(user_id, JUMLAH)
+        assert success, message
+    
+    sukses = run(user_id, ['ambil'] * 40, JUMLAH, WORKER)
+    
+    akhir = snapshot(user_id)
+    assert sukses['ambil'] == 5
+    assert akhir['tabungan'] == Money()
+    assert akhir['saldo'] == Money.of('5000')
+
+def test_tambah_paralel_tidak_melebihi_saldo(user_id):
+    modal_awal(user_id, '5000')
+    
+    sukses = run(user_id, ['tambah'] * 40, JUMLAH, WORKER)
+    
+    akhir = snapshot(user_id)
+    assert sukses['tambah'] == 5
+    assert akhir['tabungan'] == Money.of('5000')
+    assert akhir['saldo'] == Money()
+
+def test_campuran_paralel_konsisten(user_id):
+    modal_awal(user_id, '10000')
+    aksi_list = ['tambah', 'ambil'] * 100
+    random.Random(42).shuffle(aksi_list)
+    
+    awal = snapshot(user_id)
+    sukses = run(user_id, aksi_list, JUMLAH, WORKER)
+    akhir = snapshot(user_id)
+    
+    selisih = Money(JUMLAH.sen * (sukses['tambah'] - sukses['ambil']))
+    assert akhir['tabungan'] >= Money()
+    assert akhir['saldo'] >= Money()
+    assert akhir['tabungan'] == awal['tabungan'] + selisih
+    assert akhir['saldo'] == awal['saldo'] - selisih
+    assert akhir['jumlah_transaksi'] - awal['jumlah_transaksi'] == sukses['tambah'] + sukses['ambil']
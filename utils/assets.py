@@ -0,0 +1,83 @@
+"""
+STATIC ASSETS
+CSS/JS halaman disimpan sebagai file statis (static/css, static/js).
+scripts/build_assets.py menyalinnya ke Config.ASSET_DIST_DIR dengan hash isi
+di nama file (mis. main.3f2a9c1d0b4e.js) beserta varian .gz/.br, dan menulis
+manifest.json. Karena nama file berubah setiap isinya berubah, file hasil
+build boleh di-cache browser selamanya; halaman HTML cukup diunduh ulang.
+"""
+import json
+import os
+import threading
+from flask import url_for
+from config import Config
+
+# Varian precompressed yang dicari, urut dari yang paling diutamakan
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+class AssetManifest:
+    """Pemetaan nama asset sumber -> nama file hasil build (dari manifest.json)"""
+    
+    def __init__(self, dist_dir):
+        self.dist_dir = dist_dir
+        self.path = os.path.join(dist_dir, 'manifest.json')
+        
+        self._assets = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+    
+    def get(self, name):
+        """
+        Nama file hasil build untuk satu asset
+        Args:
+            name: path asset relatif terhadap static/ (mis. 'js/main.js')
+        Returns: path relatif terhadap dist_dir, atau None jika belum di-build
+        """
+        return self._load().get(name)
+    
+    def _load(self):
+        """Baca ulang manifest hanya jika file berubah (build ulang tanpa restart)"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return {}
+        
+        with self._lock:
+            if mtime != self._mtime:
+                try:
+                    with open(self.path, encoding='utf-8') as f:
+                        self._assets = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"Error baca manifest asset: {e}")
+                    self._assets = {}
+                self._mtime = mtime
+            return self._assets
+
+manifest = AssetManifest(Config.ASSET_DIST_DIR)
+
+def asset_url(name):
+    """
+    URL asset untuk template.
+    Jika belum di-build, file sumber di static/ dipakai langsung
+    (tanpa fingerprint, dengan cache default Flask).
+    Args:
+        name: path asset relatif terhadap static/ (mis. 'css/main.css')
+    Returns: string URL
+    """
+    built = manifest.get(name)
+    if built is None:
+        return url_for('static', filename=name)
+    return url_for('assets.serve', filename=built)
+
+def find_variant(filename, accept_encodings):
+    """
+    Pilih file precompressed yang didukung browser
+    Args:
+        filename: path file hasil build relatif terhadap dist_dir
+        accept_encodings: request.accept_encodings
+    Returns: tuple (nama file yang dikirim, Content-Encoding atau None)
+    """
+    for encoding, suffix in ENCODINGS:
+        if encoding in accept_encodings and os.path.isfile(os.path.join(Config.ASSET_DIST_DIR, filename + suffix)):
+            return filename + suffix, encoding
+    return filename, None
@@ -0,0 +1,255 @@
+"""
+CACHE PER USER
+Cache read-through untuk data yang sering dibaca (ringkasan dashboard,
+profil user) dengan backend yang bisa dipilih lewat Config.CACHE_BACKEND:
+- 'memory': LRU + TTL di dalam proses (default, cocok untuk satu worker)
+- 'redis' : dipakai bersama oleh semua worker WSGI
+
+Invalidasi memakai nomor versi per user: setiap penulisan menaikkan versi,
+dan kunci cache menyertakan versi tersebut, sehingga semua worker langsung
+berhenti membaca nilai lama tanpa perlu menghapus kunci satu per satu.
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from config import Config
+from models.database import after_commit
+
+class MemoryBackend:
+    """Backend LRU + TTL di dalam satu proses"""
+    
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        
+        self._entries = OrderedDict()  # key -> (expires, nilai)
+        self._versions = {}  # key -> int (tidak ikut di-evict)
+        self._lock = threading.Lock()
+        
+        self._evictions = 0
+        self._expired = 0
+    
+    def get(self, key):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            if cached[0] <= time.monotonic():
+                del self._entries[key]
+                self._expired += 1
+                return None
+            self._entries.move_to_end(key)
+            return cached[1]
+    
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def get_version(self, key):
+        with self._lock:
+            return self._versions.get(key, 0)
+    
+    def incr(self, key):
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            return self._versions[key]
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'backend': 'memory',
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'evictions': self._evictions,
+                'expired': self._expired
+            }
+
+class RedisBackend:
+    """
+    Backend Redis yang dipakai bersama oleh semua worker.
+    Membutuhkan paket redis (pip install redis). Nilai disimpan dengan
+    pickle, jadi server Redis harus berada di jaringan yang dipercaya.
+    """
+    
+    def __init__(self, url, prefix='keuangan:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis membutuhkan paket redis (pip install redis)")
+        
+        self.url = url
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+    
+    def get(self, key):
+        raw = self._client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+    
+    def set(self, key, value, ttl):
+        self._client.set(self.prefix + key, pickle.dumps(value), ex=ttl)
+    
+    def get_version(self, key):
+        return int(self._client.get(self.prefix + key) or 0)
+    
+    def incr(self, key):
+        return self._client.incr(self.prefix + key)
+    
+    def stats(self):
+        info = self._client.info('memory')
+        return {
+            'backend': 'redis',
+            'keys': self._client.dbsize(),
+            'used_memory': info.get('used_memory_human')
+        }
+
+class Cache:
+    """
+    Cache read-through per user di atas sebuah backend.
+    Error backend (misalnya Redis mati) tidak menggagalkan request:
+    nilai langsung dihitung dari database.
+    """
+    
+    def __init__(self, backend, ttl=60):
+        self.backend = backend
+        self.ttl = ttl
+        
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._invalidations = 0
+    
+    def get(self, user_id, name, loader):
+        """
+        Baca nilai dari cache, atau hitung dengan loader jika tidak ada/kedaluwarsa
+        Args:
+            user_id: ID user
+            name: nama nilai ('summary', 'chart', 'user', ...)
+            loader: fungsi tanpa argumen yang menghitung nilai dari database
+        Returns: nilai dari cache atau hasil loader
+        """
+        try:
+            version = self.backend.get_version(f"ver:{user_id}")
+            key = f"user:{user_id}:v{version}:{name}"
+            value = self.backend.get(key)
+        except Exception as e:
+            print(f"Error baca cache: {e}")
+            self._count('_errors')
+            return loader()
+        
+        if value is not None:
+            self._count('_hits')
+            return value
+        
+        self._count('_misses')
+        value = loader()
+        
+        # Nilai yang dihitung sebelum invalidasi tersimpan di versi lama
+        # dan tidak akan pernah dibaca lagi
+        if value is not None:
+            try:
+                self.backend.set(key, value, self.ttl)
+            except Exception as e:
+                print(f"Error tulis cache: {e}")
+                self._count('_errors')
+        
+        return value
+    
+    def version(self, user_id):
+        """
+        Nomor versi cache user saat ini (0 jika backend tidak bisa dibaca)
+        Args:
+            user_id: ID user
+        Returns: int
+        """
+        try:
+            return self.backend.get_version(f"ver:{user_id}")
+        except Exception as e:
+            print(f"Error baca versi cache: {e}")
+            self._count('_errors')
+            return 0
+    
+    def invalidate(self, user_id):
+        """
+        Buang semua nilai cache milik user (di semua worker)
+        Args:
+            user_id: ID user
+        """
+        try:
+            self.backend.incr(f"ver:{user_id}")
+            self._count('_invalidations')
+        except Exception as e:
+            print(f"Error invalidasi cache: {e}")
+            self._count('_errors')
+        
+        for listener in self._listeners:
+            try:
+                listener(user_id)
+            except Exception as e:
+                print(f"Error listener invalidasi cache: {e}")
+    
+    def add_listener(self, callback):
+        """
+        Daftarkan callback(user_id) yang dipanggil setiap kali cache user
+        diinvalidasi (mis. untuk push perubahan ke browser)
+        Args:
+            callback: fungsi dengan satu argumen user_id
+        """
+        self._listeners.append(callback)
+    
+    def stats(self):
+        """
+        Statistik cache untuk monitoring dan menentukan ukuran
+        (hit/miss dihitung per proses worker)
+        Returns: dict
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            stats = {
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / total, 4) if total else 0.0,
+                'errors': self._errors,
+                'invalidations': self._invalidations
+            }
+        
+        try:
+            stats.update(self.backend.stats())
+        except Exception as e:
+            stats['backend_error'] = str(e)
+        return stats
+    
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+def create_cache():
+    """
+    Buat cache sesuai Config.CACHE_BACKEND
+    Returns: Cache
+    Raises: ValueError jika backend tidak dikenal
+    """
+    if Config.CACHE_BACKEND == 'memory':
+        backend = MemoryBackend(Config.CACHE_MAX_ENTRIES)
+    elif Config.CACHE_BACKEND == 'redis':
+        backend = RedisBackend(Config.CACHE_REDIS_URL, Config.CACHE_KEY_PREFIX)
+    else:
+        raise ValueError(f"CACHE_BACKEND tidak dikenal: {Config.CACHE_BACKEND}")
+    
+    return Cache(backend, Config.CACHE_TTL)
+
+cache = create_cache()
+
+def invalidate_user(user_id):
+    """
+    Buang cache user setelah perubahan di-commit
+    Args:
+        user_id: ID user
+    """
+    after_commit(lambda: cache.invalidate(user_id))
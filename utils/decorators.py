@@ -1,10 +1,14 @@
 """
 DECORATORS & HELPER FUNCTIONS
 """
+import hashlib
+from datetime import date
 from functools import wraps
-from flask import session, redirect, url_for, request
+from flask import session, redirect, url_for, request, make_response
 from werkzeug.utils import secure_filename
 from config import Config
+from models.user import User
+from utils.cache import cache
 import os
 
 def login_required(f):
@@ -18,6 +22,40 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def conditional_get(f):
+    """
+    Decorator ETag untuk GET API data user.
+    ETag diturunkan dari versi data user (naik di transaksi yang sama dengan
+    setiap penulisan) dan versi cache, jadi jika If-None-Match cocok
+    request dibalas 304 tanpa menjalankan view maupun query datanya.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        user_id = session.get('user_id')
+        
+        # Tanggal ikut dihitung karena rentang default (mis. tren 12 bulan)
+        # bergantung pada hari ini
+        raw = ':'.join(str(part) for part in (
+            user_id,
+            User.get_data_version(user_id),
+            cache.version(user_id),
+            date.today().isoformat(),
+            request.full_path
+        ))
+        etag = hashlib.sha1(raw.encode()).hexdigest()[:32]
+        
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+        else:
+            response = make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    return decorated_function
+
 def allowed_file(filename):
     """
     Cek apakah file upload diperbolehkan
@@ -0,0 +1,144 @@
+"""
+EVENT PUSH (SERVER-SENT EVENTS)
+Registry subscriber per user untuk mendorong perubahan ringkasan ke semua
+tab yang sedang terbuka. Notifikasi hanya menandai "ada perubahan"; setiap
+stream lalu membaca ringkasan terbaru (lewat cache) dan mengirim field yang
+berubah saja, sehingga notifikasi beruntun cukup dikirim sekali.
+"""
+import threading
+from collections import OrderedDict
+from config import Config
+from utils.cache import cache
+
+class Subscriber:
+    """Satu koneksi SSE yang menunggu notifikasi"""
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._closed = False
+    
+    def notify(self):
+        with self._cond:
+            self._dirty = True
+            self._cond.notify_all()
+    
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+    
+    def wait(self, timeout):
+        """
+        Tunggu notifikasi
+        Args:
+            timeout: detik (interval heartbeat)
+        Returns: True jika ada perubahan, False jika timeout, None jika ditutup
+        """
+        with self._cond:
+            if not (self._dirty or self._closed):
+                self._cond.wait(timeout)
+            if self._closed:
+                return None
+            changed, self._dirty = self._dirty, False
+            return changed
+
+class EventHub:
+    """
+    Registry subscriber per user dengan batas per user dan batas total.
+    Jika satu user membuka terlalu banyak tab, koneksi tertua ditutup.
+    """
+    
+    def __init__(self, max_per_user=5, max_total=500):
+        self.max_per_user = max_per_user
+        self.max_total = max_total
+        
+        self._subscribers = {}  # user_id -> OrderedDict(Subscriber -> None)
+        self._total = 0
+        self._lock = threading.Lock()
+        
+        self._published = 0
+        self._evicted = 0
+        self._rejected = 0
+    
+    def subscribe(self, user_id):
+        """
+        Daftarkan koneksi baru untuk user
+        Args:
+            user_id: ID user
+        Returns: Subscriber, atau None jika batas total tercapai
+        """
+        subscriber = Subscriber()
+        evicted = None
+        
+        with self._lock:
+            subscribers = self._subscribers.setdefault(user_id, OrderedDict())
+            
+            if len(subscribers) >= self.max_per_user:
+                evicted, _ = subscribers.popitem(last=False)
+                self._total -= 1
+                self._evicted += 1
+            elif self._total >= self.max_total:
+                self._rejected += 1
+                if not subscribers:
+                    del self._subscribers[user_id]
+                return None
+            
+            subscribers[subscriber] = None
+            self._total += 1
+        
+        if evicted:
+            evicted.close()
+        return subscriber
+    
+    def unsubscribe(self, user_id, subscriber):
+        """
+        Lepas koneksi user (saat stream selesai / klien putus)
+        Args:
+            user_id: ID user
+            subscriber: Subscriber dari subscribe()
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers is None or subscriber not in subscribers:
+                return
+            
+            del subscribers[subscriber]
+            self._total -= 1
+            if not subscribers:
+                del self._subscribers[user_id]
+    
+    def publish(self, user_id):
+        """
+        Beri tahu semua koneksi user bahwa datanya berubah
+        Args:
+            user_id: ID user
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+            if subscribers:
+                self._published += 1
+        
+        for subscriber in subscribers:
+            subscriber.notify()
+    
+    def stats(self):
+        """
+        Statistik koneksi SSE
+        Returns: dict
+        """
+        with self._lock:
+            return {
+                'users': len(self._subscribers),
+                'subscribers': self._total,
+                'max_per_user': self.max_per_user,
+                'max_total': self.max_total,
+                'published': self._published,
+                'evicted': self._evicted,
+                'rejected': self._rejected
+            }
+
+hub = EventHub(Config.SSE_MAX_PER_USER, Config.SSE_MAX_TOTAL)
+
+# Setiap invalidasi cache user (terjadi setelah commit) juga didorong ke tab user
+cache.add_listener(hub.publish)
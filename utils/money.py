@@ -0,0 +1,97 @@
+"""
+MONEY
+Nilai uang sebagai bilangan bulat sen (1/100 rupiah). Kolom DECIMAL(15,2)
+diubah ke Money sekali saat dibaca dari database; penjumlahan saldo dan
+agregat setelahnya murni aritmetika integer (eksak, tanpa float maupun
+Decimal). Konversi balik hanya di batas keluar: to_decimal() untuk parameter
+SQL dan float() untuk JSON.
+"""
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from functools import total_ordering
+
+SEN = Decimal('0.01')
+
+@total_ordering
+class Money:
+    """Jumlah uang dalam sen. Perlakukan sebagai nilai tetap: operasi selalu membuat Money baru"""
+    
+    __slots__ = ('sen',)
+    
+    def __init__(self, sen=0):
+        self.sen = int(sen)
+    
+    @classmethod
+    def of(cls, value):
+        """
+        Buat Money dari nilai rupiah
+        Args:
+            value: Decimal dari database, int, float, string angka, Money atau None (= 0)
+        Returns: Money (dibulatkan ke sen terdekat)
+        Raises: ValueError jika value bukan angka
+        """
+        if isinstance(value, Money):
+            return value
+        if value is None:
+            return cls(0)
+        if isinstance(value, int):
+            return cls(value * 100)
+        
+        try:
+            # str() agar float 0.1 dibaca sebagai '0.1', bukan nilai binernya
+            amount = Decimal(str(value)).quantize(SEN, rounding=ROUND_HALF_UP)
+        except InvalidOperation:
+            raise ValueError(f"Jumlah uang tidak valid: {value!r}")
+        return cls(amount.scaleb(2))
+    
+    def to_decimal(self):
+        """Decimal rupiah dengan 2 desimal (untuk parameter SQL)"""
+        return Decimal(self.sen).scaleb(-2)
+    
+    def __add__(self, other):
+        if isinstance(other, Money):
+            return Money(self.sen + other.sen)
+        if other == 0 and isinstance(other, int):
+            return self  # agar sum() dengan start 0 tetap bekerja
+        return NotImplemented
+    
+    __radd__ = __add__
+    
+    def __sub__(self, other):
+        if isinstance(other, Money):
+            return Money(self.sen - other.sen)
+        return NotImplemented
+    
+    def __neg__(self):
+        return Money(-self.sen)
+    
+    def __abs__(self):
+        return Money(abs(self.sen))
+    
+    def __eq__(self, other):
+        if isinstance(other, Money):
+            return self.sen == other.sen
+        return NotImplemented
+    
+    def __lt__(self, other):
+        if isinstance(other, Money):
+            return self.sen < other.sen
+        return NotImplemented
+    
+    def __hash__(self):
+        return hash(self.sen)
+    
+    def __bool__(self):
+        return self.sen != 0
+    
+    def __float__(self):
+        # Pembagian int/int dibulatkan benar, jadi 1234.56 tetap tampil 1234.56 di JSON
+        return self.sen / 100
+    
+    def __format__(self, spec):
+        return format(self.to_decimal(), spec)
+    
+    def __str__(self):
+        return str(self.to_decimal())
+    
+    def __repr__(self):
+        return f"Money('{self}')"
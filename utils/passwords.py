@@ -0,0 +1,69 @@
+"""
+PASSWORD HASHING
+Hash dan verifikasi password dijalankan di pool thread berukuran
+Config.PASSWORD_HASH_WORKERS, bukan langsung di thread request.
+hashlib (scrypt/PBKDF2) melepas GIL selama menghitung, jadi thread request
+lain tetap jalan; batas pool menjamin lonjakan login paling banyak memakai
+sejumlah core itu dan antre di belakangnya, alih-alih memakan semua CPU.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import generate_password_hash, check_password_hash
+from config import Config
+
+_executor = None
+_executor_lock = threading.Lock()
+_method_prefix = None
+
+def _get_executor():
+    """Pool thread hashing (dibuat saat pertama dipakai)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.PASSWORD_HASH_WORKERS,
+                    thread_name_prefix='password-hash'
+                )
+    return _executor
+
+def hash_password(password):
+    """
+    Hash password dengan Config.PASSWORD_HASH_METHOD
+    Args:
+        password: password plain text
+    Returns: string hash format werkzeug (method$salt$hash)
+    """
+    return _get_executor().submit(
+        generate_password_hash, password, method=Config.PASSWORD_HASH_METHOD
+    ).result()
+
+def check_password(password_hash, password):
+    """
+    Cocokkan password dengan hash tersimpan
+    Args:
+        password_hash: hash dari database
+        password: password plain text
+    Returns: Boolean
+    """
+    return _get_executor().submit(check_password_hash, password_hash, password).result()
+
+def needs_rehash(password_hash):
+    """
+    Cek apakah hash dibuat dengan method/cost yang berbeda dari konfigurasi
+    Args:
+        password_hash: hash dari database
+    Returns: Boolean
+    """
+    return password_hash.split('$', 1)[0] != _current_method()
+
+def _current_method():
+    """
+    Bentuk lengkap Config.PASSWORD_HASH_METHOD seperti yang tertulis di hash
+    ('pbkdf2' -> 'pbkdf2:sha256:<iterasi default>'), diambil sekali dari
+    satu hash contoh agar default werkzeug tidak perlu ditulis ulang di sini
+    """
+    global _method_prefix
+    if _method_prefix is None:
+        _method_prefix = hash_password('').split('$', 1)[0]
+    return _method_prefix